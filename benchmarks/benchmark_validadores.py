@@ -0,0 +1,91 @@
+# benchmarks/benchmark_validadores.py
+
+"""
+Custo por registro de ValidadorDadosFuncionario.validate sobre uma exportação de RH sintética,
+em que as datas de admissão e de nascimento se repetem (poucas centenas de datas distintas).
+
+Uso (na raiz do repositório):
+    python -m benchmarks.benchmark_validadores [quantidade_registros]
+
+Mostra o tempo da linha de base (o validador de antes da pré-compilação, em validador_linha_de_base)
+e do validador atual com os caches vazios (primeira passada) e já aquecidos (segunda passada), e
+confere antes que os dois validam os registros da mesma forma.
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from benchmarks.validador_linha_de_base import ValidadorDadosFuncionarioLinhaDeBase
+from core import validators
+from core.validators import ValidadorDadosFuncionario
+
+
+def gerar_cpf(gerador: random.Random) -> str:
+    digitos = [gerador.randint(0, 9) for _ in range(9)]
+    for tamanho in (9, 10):
+        soma = sum(d * (tamanho + 1 - i) for i, d in enumerate(digitos[:tamanho]))
+        digitos.append((soma * 10) % 11 % 10)
+    texto = "".join(map(str, digitos))
+    return f"{texto[:3]}.{texto[3:6]}.{texto[6:9]}-{texto[9:]}"
+
+
+def gerar_registros(quantidade: int, semente: int = 7) -> list:
+    gerador = random.Random(semente)
+    # Admissões no primeiro dia útil de cada mês e nascimentos em poucas datas: como em exportações reais
+    admissoes = [date(2000 + i // 12, i % 12 + 1, 1) for i in range(300)]
+    nascimentos = [date(1960, 1, 1) + timedelta(days=180 * i) for i in range(80)]
+    registros = []
+    for i in range(quantidade):
+        admissao = gerador.choice(admissoes)
+        registros.append({
+            "CHAPA": str(i % 100000).zfill(5), "NOME": f"Funcionario {i}", "SITUACAO": "A", "CODIGO_FUNCAO": "0001",
+            "DATA_ADMISSAO": admissao.isoformat(), "DATA_ADMISSAO_PTS": admissao.strftime("%d/%m/%Y"),
+            "DATA_NASCIMENTO": gerador.choice(nascimentos).isoformat(),
+            "SECAO": "01.01.1.01.01.001", "CARGA_HORARIA_MENSAL": "220", "CPF": gerar_cpf(gerador),
+            "CENTRO_CUSTO": "123456789", "EMPRESA": "Matriz", "EQUIPE": "Operacao", "FUNCAO": "Operador",
+            "VALOR_VALE_TRANSPORTE_MENSAL": 150.0, "VALOR_VALE_REFEICAO_MENSAL": "400", "PLANO_SAUDE_MENSAL": 0,
+            "OUTROS_BENEFICIOS_MENSAIS": 0.0,
+        })
+    return registros
+
+
+def limpar_caches():
+    for nome in ("converter_data", "conferir_cpf"):
+        funcao = getattr(validators, nome, None)
+        if funcao is not None:
+            funcao.cache_clear()
+
+
+def medir(registros: list, classe_validador: type = ValidadorDadosFuncionario) -> float:
+    """Microssegundos por registro, criando o validador uma vez por registro (como na ingestão registro a registro)."""
+    inicio = time.perf_counter()
+    for registro in registros:
+        classe_validador().validate(registro)
+    return (time.perf_counter() - inicio) / len(registros) * 1e6
+
+
+def conferir_equivalencia(registros: list):
+    """A comparação só vale se os dois validadores devolvem o mesmo resultado para os registros medidos."""
+    for registro in registros:
+        if ValidadorDadosFuncionario().validate(registro) != ValidadorDadosFuncionarioLinhaDeBase().validate(registro):
+            raise AssertionError(f"Validadores divergem no registro {registro['CHAPA']}.")
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    registros = gerar_registros(quantidade)
+    conferir_equivalencia(registros[:1000])
+    linha_de_base = medir(registros, ValidadorDadosFuncionarioLinhaDeBase)
+    limpar_caches()
+    frio = medir(registros)
+    quente = medir(registros)
+    print(f"{quantidade} registros")
+    print(f"  linha de base:    {linha_de_base:.2f} µs/registro")
+    print(f"  caches vazios:    {frio:.2f} µs/registro ({linha_de_base / frio:.1f}x)")
+    print(f"  caches aquecidos: {quente:.2f} µs/registro ({linha_de_base / quente:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
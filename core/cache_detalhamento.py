@@ -0,0 +1,85 @@
+# core/cache_detalhamento.py
+
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, Hashable, Mapping, Tuple
+
+from core.entities import Funcionario, ConfiguracaoGlobal, LancamentoMensalFuncionario
+
+# Ficha de cálculo somente leitura: pode ser compartilhada entre funcionários sem risco de alteração
+Detalhamento = Mapping[str, float]
+
+
+def chave_detalhamento(
+    salario_base: float,
+    funcionario: Funcionario,
+    configuracao_global: ConfiguracaoGlobal,
+    lancamento_mensal: LancamentoMensalFuncionario
+) -> Tuple[Hashable, ...]:
+    """
+    Chave com tudo o que influencia a ficha de calcular_detalhamento_custo_total, e nada mais:
+    o salário do cargo, os benefícios do funcionário, os parâmetros da configuração (sem a data de cálculo)
+    e os campos do lançamento mensal usados no cálculo. Funcionários com a mesma chave têm a mesma ficha.
+    """
+    return (
+        salario_base,
+        funcionario.valor_vale_transporte_mensal,
+        funcionario.valor_vale_refeicao_mensal,
+        funcionario.plano_saude_mensal,
+        funcionario.outros_beneficios_mensais,
+        funcionario.valor_base_gratificacao_mensal,
+        configuracao_global.salario_minimo,
+        configuracao_global.percentual_insalubridade,
+        configuracao_global.aliquota_fgts_patronal,
+        configuracao_global.aliquota_inss_patronal_media,
+        configuracao_global.percentual_terco_ferias,
+        configuracao_global.meses_do_ano,
+        configuracao_global.horas_jornada_padrao_mensal,
+        configuracao_global.percentual_periculosidade,
+        configuracao_global.percentual_adicional_noturno,
+        lancamento_mensal.dias_ferias,
+        bool(lancamento_mensal.recebe_insalubridade),
+        bool(lancamento_mensal.recebe_periculosidade),
+        lancamento_mensal.horas_trabalhadas_no_mes,
+        lancamento_mensal.quantidade_horas_s_aviso,
+        lancamento_mensal.quantidade_horas_adicional_noturno,
+    )
+
+
+class CacheDetalhamento:
+    """
+    Cache LRU das fichas de cálculo, indexado por chave_detalhamento.
+    As fichas guardadas são somente leitura (MappingProxyType), então a mesma ficha pode ser
+    devolvida para todos os funcionários com as mesmas entradas. 'acertos' e 'falhas' contam os
+    acessos; ao passar de 'capacidade' entradas, a usada há mais tempo é descartada.
+    """
+    def __init__(self, capacidade: int = 4096):
+        if capacidade <= 0:
+            raise ValueError("'capacidade' deve ser um inteiro positivo.")
+        self.capacidade = capacidade
+        self._fichas: "OrderedDict[Tuple[Hashable, ...], Detalhamento]" = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter_ou_calcular(self, chave: Tuple[Hashable, ...], calcular: Callable[[], Dict[str, float]]) -> Detalhamento:
+        """Retorna a ficha da chave, calculando-a (e guardando-a) só se ainda não estiver no cache."""
+        ficha = self._fichas.get(chave)
+        if ficha is not None:
+            self.acertos += 1
+            self._fichas.move_to_end(chave)
+            return ficha
+        self.falhas += 1
+        ficha = MappingProxyType(calcular())
+        self._fichas[chave] = ficha
+        if len(self._fichas) > self.capacidade:
+            self._fichas.popitem(last=False)
+        return ficha
+
+    def limpar(self):
+        """Descarta as fichas guardadas e zera os contadores."""
+        self._fichas.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self) -> int:
+        return len(self._fichas)
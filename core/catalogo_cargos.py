@@ -0,0 +1,74 @@
+# core/catalogo_cargos.py
+
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+from core.entities import Cargo
+from core import formulas
+
+
+class CatalogoCargos:
+    """
+    Catálogo de cargos indexado por codigo_funcao.
+    Substitui a list[Cargo] nas consultas de salário: a busca passa a ser O(1) em vez de
+    percorrer todos os cargos, e o salário-hora das jornadas usuais já fica pré-calculado.
+    """
+    JORNADAS_PADRAO = (220, 150, 75)
+
+    def __init__(self, cargos: Iterable[Cargo] = ()):
+        self._cargos: Dict[str, Cargo] = {}
+        self._salarios_hora: Dict[Tuple[str, int], float] = {}
+        for cargo in cargos:
+            self.adicionar(cargo)
+
+    @classmethod
+    def de_cargos(cls, cargos: Union["CatalogoCargos", Iterable[Cargo]]) -> "CatalogoCargos":
+        """
+        Retorna o próprio catálogo, ou monta um a partir de uma lista de cargos. Usado só nos pontos de
+        entrada (main, serviços e cálculo em lote), uma vez por chamada; as consultas por funcionário
+        recebem o catálogo já montado.
+        """
+        if isinstance(cargos, CatalogoCargos):
+            return cargos
+        return cls(cargos)
+
+    def adicionar(self, cargo: Cargo):
+        """
+        Adiciona um cargo ao catálogo. Se o codigo_funcao já existir, mantém o primeiro,
+        como acontecia na busca sequencial pela lista.
+        """
+        if cargo.codigo_funcao in self._cargos:
+            return
+        self._cargos[cargo.codigo_funcao] = cargo
+        for jornada in self.JORNADAS_PADRAO:
+            self._salarios_hora[(cargo.codigo_funcao, jornada)] = formulas.calcular_salario_hora(
+                salario=cargo.salario, horas=jornada
+            )
+
+    def obter(self, codigo_funcao: str) -> Optional[Cargo]:
+        """Retorna o cargo do código informado, ou None se não existir."""
+        return self._cargos.get(codigo_funcao)
+
+    def obter_salario(self, codigo_funcao: str) -> float:
+        """Retorna o salário do cargo, ou 0.0 se o código não existir."""
+        cargo = self._cargos.get(codigo_funcao)
+        return cargo.salario if cargo is not None else 0.0
+
+    def obter_salario_hora(self, codigo_funcao: str, jornada_mensal_horas: int) -> float:
+        """Retorna o salário-hora do cargo para a jornada, usando o valor pré-calculado quando houver."""
+        chave = (codigo_funcao, jornada_mensal_horas)
+        salario_hora = self._salarios_hora.get(chave)
+        if salario_hora is None:
+            salario_hora = formulas.calcular_salario_hora(
+                salario=self.obter_salario(codigo_funcao), horas=jornada_mensal_horas
+            )
+            if codigo_funcao in self._cargos:
+                self._salarios_hora[chave] = salario_hora
+        return salario_hora
+
+    def __contains__(self, codigo_funcao: object) -> bool:
+        return codigo_funcao in self._cargos
+
+    def __iter__(self) -> Iterator[Cargo]:
+        return iter(self._cargos.values())
+
+    def __len__(self) -> int:
+        return len(self._cargos)
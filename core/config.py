@@ -1,6 +1,21 @@
+from bisect import bisect_right
+from dataclasses import astuple, dataclass, fields, replace
 from datetime import date
-from typing import List
-from core.entities import ParametroHistorico
+from typing import Dict, List, Tuple
+from dateutil.relativedelta import relativedelta
+import numpy as np
+from core.entities import ParametroHistorico, ConfiguracaoGlobal
+from core.history_manager import GerenciadorHistorico, Datas, datas_para_array, valores_historicos_nas_datas
+
+# Campo da ConfiguracaoGlobal -> nome do parâmetro no histórico (todos obrigatórios)
+PARAMETROS_HISTORICOS_CONFIGURACAO = {
+    "salario_minimo": "minimum_wage",
+    "percentual_insalubridade": "insalubrity_percent",
+    "aliquota_fgts_patronal": "aliquota_fgts_empresa",
+    "aliquota_inss_patronal_media": "aliquota_inss_patronal_media",
+    "percentual_terco_ferias": "percentual_terco_ferias",
+    "meses_do_ano": "meses_do_ano",
+}
 
 
 def get_historical_value(history: List[ParametroHistorico], target_date: date) -> float:
@@ -16,3 +31,142 @@ def get_historical_value(history: List[ParametroHistorico], target_date: date) -
             return param.valor
     raise ValueError("Nenhum valor de configuração válido encontrado para a data fornecida.")
 
+
+def obter_valores_historicos_nas_datas(history: List[ParametroHistorico], datas: Datas) -> np.ndarray:
+    """
+    Versão em lote de get_historical_value: o histórico é ordenado e resolvido em vigências uma única vez,
+    e todas as datas são consultadas com um searchsorted. Datas sem valor vigente ficam com NaN.
+    """
+    return valores_historicos_nas_datas(history, datas)
+
+
+def construir_parametros_para_datas(history_manager: GerenciadorHistorico, datas: Datas) -> Dict[str, np.ndarray]:
+    """
+    Os parâmetros históricos da ConfiguracaoGlobal para cada data, em colunas (um array por campo,
+    alinhado com as datas): uma busca vetorizada por parâmetro, para recálculos retroativos de
+    muitos meses ou datas de cálculo diferentes por funcionário.
+    """
+    datas = datas_para_array(datas)
+    colunas = {}
+    for campo, parametro in PARAMETROS_HISTORICOS_CONFIGURACAO.items():
+        valores = history_manager.obter_valores_nas_datas(parametro, datas)
+        sem_valor = np.flatnonzero(np.isnan(valores))
+        if len(sem_valor):
+            raise ValueError(f"Parâmetro histórico '{parametro}' é obrigatório mas não encontrado ou nulo para {datas[sem_valor[0]]}.")
+        colunas[campo] = valores
+    return colunas
+
+
+def parametros_alterados(anterior: ConfiguracaoGlobal, nova: ConfiguracaoGlobal) -> Tuple[str, ...]:
+    """
+    Campos da ConfiguracaoGlobal com valores diferentes entre as duas configurações.
+    A data de cálculo fica de fora: ela não entra em nenhum evento da folha.
+    """
+    return tuple(
+        campo.name for campo in fields(ConfiguracaoGlobal)
+        if campo.name != "data_calculo" and getattr(anterior, campo.name) != getattr(nova, campo.name)
+    )
+
+
+def construir_configuracao_global_para_data(history_manager: GerenciadorHistorico, check_date: date) -> ConfiguracaoGlobal:
+    """Constrói uma GlobalConfig para uma data específica a partir do HistoryManager."""
+    active_params = history_manager.obter_todos_parametros_ativos_na_data(check_date)
+
+    required_params = [
+        "minimum_wage", "insalubrity_percent", "aliquota_fgts_empresa",
+        "aliquota_inss_patronal_media", "percentual_terco_ferias", "meses_do_ano"
+    ]
+    for param in required_params:
+        if param not in active_params or active_params[param] is None:
+            raise ValueError(f"Parâmetro histórico '{param}' é obrigatório mas não encontrado ou nulo para {check_date}.")
+
+    return ConfiguracaoGlobal(
+        data_calculo=check_date,
+        salario_minimo=active_params.get("minimum_wage"),
+        percentual_insalubridade=active_params.get("insalubrity_percent"),
+        aliquota_fgts_patronal=active_params.get("aliquota_fgts_empresa"),
+        aliquota_inss_patronal_media=active_params.get("aliquota_inss_patronal_media"),
+        percentual_terco_ferias=active_params.get("percentual_terco_ferias"),
+        meses_do_ano=active_params.get("meses_do_ano")
+    )
+
+
+@dataclass(frozen=True)
+class SegmentoMensal:
+    """Meses consecutivos de um horizonte com a mesma ConfiguracaoGlobal. 'deslocamento' é o índice do primeiro mês."""
+    deslocamento: int
+    quantidade_meses: int
+    configuracao: ConfiguracaoGlobal
+
+
+class LinhaDoTempoConfiguracao:
+    """
+    Cache de ConfiguracaoGlobal por (ano, mes) montado sobre as datas de mudança do histórico.
+    Cada período de parâmetros constantes gera uma única ConfiguracaoGlobal (construída e
+    validada uma vez), e períodos com os mesmos valores compartilham o mesmo objeto interno.
+    As consultas devolvem uma cópia rasa desse objeto com o data_calculo da data consultada.
+    """
+    def __init__(self, history_manager: GerenciadorHistorico):
+        self._history_manager = history_manager
+        self._datas_de_mudanca = history_manager.obter_datas_de_mudanca()
+        self._por_periodo: Dict[int, ConfiguracaoGlobal] = {}
+        self._por_mes: Dict[Tuple[int, int], ConfiguracaoGlobal] = {}
+        self._internadas: Dict[tuple, ConfiguracaoGlobal] = {}
+
+    def obter(self, ano: int, mes: int) -> ConfiguracaoGlobal:
+        """Retorna a ConfiguracaoGlobal vigente no primeiro dia do mês, com data_calculo nesse dia."""
+        chave = (ano, mes)
+        configuracao = self._por_mes.get(chave)
+        if configuracao is None:
+            configuracao = self.obter_na_data(date(ano, mes, 1))
+            self._por_mes[chave] = configuracao
+        return configuracao
+
+    def obter_na_data(self, check_date: date) -> ConfiguracaoGlobal:
+        """Retorna a ConfiguracaoGlobal do período de parâmetros que contém a data, com data_calculo na data."""
+        return replace(self._configuracao_do_periodo(check_date), data_calculo=check_date)
+
+    def _configuracao_do_periodo(self, check_date: date) -> ConfiguracaoGlobal:
+        """Objeto compartilhado do período que contém a data (o data_calculo dele é o de quem o criou)."""
+        periodo = bisect_right(self._datas_de_mudanca, check_date)
+        configuracao = self._por_periodo.get(periodo)
+        if configuracao is None:
+            inicio_periodo = self._datas_de_mudanca[periodo - 1] if periodo > 0 else check_date
+            configuracao = construir_configuracao_global_para_data(self._history_manager, inicio_periodo)
+            # Internaliza por valor: períodos com os mesmos parâmetros reaproveitam o mesmo objeto
+            configuracao = self._internadas.setdefault(astuple(configuracao)[1:], configuracao)
+            self._por_periodo[periodo] = configuracao
+        return configuracao
+
+    def segmentos_mensais(self, ano_inicio: int, mes_inicio: int, duracao_meses: int) -> List[SegmentoMensal]:
+        """
+        Divide um horizonte de meses nos trechos de ConfiguracaoGlobal constante, a partir das datas de
+        mudança do histórico dentro do horizonte. Como cada mês usa a configuração do seu primeiro dia, uma
+        mudança no meio do mês só vale a partir do mês seguinte. Trechos vizinhos com os mesmos valores
+        são unidos; a configuração de cada trecho tem o data_calculo do seu primeiro mês.
+        """
+        if duracao_meses <= 0:
+            return []
+        inicio = date(ano_inicio, mes_inicio, 1)
+        ultimo_mes = inicio + relativedelta(months=duracao_meses - 1)
+        deslocamentos = sorted({
+            (mudanca.year - ano_inicio) * 12 + mudanca.month - mes_inicio + (mudanca.day > 1)
+            for mudanca in self._history_manager.obter_datas_de_mudanca_entre(inicio, ultimo_mes)
+        })
+        segmentos: List[SegmentoMensal] = []
+        internada_anterior = None
+        for posicao, deslocamento in enumerate([0] + deslocamentos):
+            fim = deslocamentos[posicao] if posicao < len(deslocamentos) else duracao_meses
+            data_mes = inicio + relativedelta(months=deslocamento)
+            internada = self._configuracao_do_periodo(data_mes)
+            if segmentos and internada is internada_anterior:
+                segmentos[-1] = replace(segmentos[-1], quantidade_meses=fim - segmentos[-1].deslocamento)
+            else:
+                segmentos.append(SegmentoMensal(deslocamento, fim - deslocamento, self.obter(data_mes.year, data_mes.month)))
+            internada_anterior = internada
+        return segmentos
+
+    @property
+    def quantidade_configuracoes(self) -> int:
+        """Quantidade de configurações distintas já construídas."""
+        return len(self._internadas)
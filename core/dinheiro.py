@@ -0,0 +1,55 @@
+# core/dinheiro.py
+
+"""
+Valores monetários em centavos inteiros (ponto fixo).
+
+Regra de arredondamento única para todos os eventos: cada evento é arredondado para o centavo
+uma única vez, no próprio cálculo, com meio centavo para cima. Daí em diante tudo é soma de
+inteiros: totais por funcionário, por bloco e do quadro são exatos e não dependem da ordem da soma
+(o que permite juntar somas parciais de blocos calculados em paralelo).
+
+As funções aceitam tanto inteiros quanto arrays NumPy de int64, com o mesmo resultado
+posição a posição, para que o cálculo individual e o cálculo em lote batam centavo a centavo.
+"""
+
+import math
+from typing import Union
+import numpy as np
+
+Centavos = Union[int, np.ndarray]
+
+# Folga para que produtos em ponto flutuante que deveriam dar exatamente meio centavo
+# (ex.: 0.125 virando 0.12499999999) sejam arredondados para cima
+FOLGA_MEIO_CENTAVO = 1e-6
+
+
+def para_centavos(valor: float) -> int:
+    """Converte um valor em reais (com até 2 casas, como salários e benefícios) para centavos."""
+    return int(math.floor(valor * 100 + 0.5 + FOLGA_MEIO_CENTAVO))
+
+
+def para_centavos_array(valores: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de para_centavos."""
+    return np.floor(np.asarray(valores, dtype=np.float64) * 100 + 0.5 + FOLGA_MEIO_CENTAVO).astype(np.int64)
+
+
+def para_reais(centavos: Centavos) -> Union[float, np.ndarray]:
+    """Converte centavos para reais (float), só na apresentação ou nas APIs em float."""
+    return centavos / 100
+
+
+def arredondar_meio_para_cima(valor_em_centavos: Union[float, np.ndarray]) -> Centavos:
+    """Arredonda um valor já em centavos (ainda fracionário) para o centavo inteiro, meio para cima."""
+    if isinstance(valor_em_centavos, np.ndarray):
+        return np.floor(valor_em_centavos + 0.5 + FOLGA_MEIO_CENTAVO).astype(np.int64)
+    return int(math.floor(valor_em_centavos + 0.5 + FOLGA_MEIO_CENTAVO))
+
+
+def dividir_arredondando(numerador: Centavos, denominador: int) -> Centavos:
+    """Divisão inteira exata com meio para cima (numerador não negativo, denominador positivo)."""
+    return (2 * numerador + denominador) // (2 * denominador)
+
+
+def aplicar_percentual(centavos: Centavos, percentual: float) -> Centavos:
+    """Percentual (ou fator qualquer) sobre um valor em centavos, arredondado para o centavo."""
+    return arredondar_meio_para_cima(centavos * percentual)
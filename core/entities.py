@@ -1,12 +1,24 @@
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dateutil.relativedelta import relativedelta
 
 
+# Campos de texto que se repetem em milhares de funcionários: internalizados para que todos
+# os funcionários da mesma empresa/equipe/função apontem para a mesma string
+CAMPOS_CATEGORICOS_FUNCIONARIO = (
+    "situacao", "codigo_funcao", "secao", "carga_horaria_mensal", "centro_custo", "empresa", "equipe", "funcao"
+)
 
-@dataclass()
+
+def internalizar(valor: Any) -> Any:
+    """sys.intern para textos; outros valores voltam sem alteração."""
+    return sys.intern(valor) if type(valor) is str else valor
+
+
+@dataclass(slots=True)
 class Funcionario:
     chapa: str
     nome: str
@@ -29,6 +41,10 @@ class Funcionario:
     valor_base_gratificacao_mensal: float = 0.0
     custo_total_mensal: float = 0.0  
 
+    def __post_init__(self):
+        for campo in CAMPOS_CATEGORICOS_FUNCIONARIO:
+            setattr(self, campo, internalizar(getattr(self, campo)))
+
     def is_active(self) -> bool:
         """
         Verifica se o funcionário está ativo.
@@ -47,13 +63,16 @@ class Funcionario:
     
     # Exemplo: Se os benefícios são específicos para o funcionário e podem mudar:
     # ids_beneficios_vigentes: List[int] = field(default_factory=list) # Referencia ID de um BenefitHistory
+    # Os valores por data (vigências por chapa) ficam no HistoricoCadastral (core/historico_cadastral.py);
+    # os campos acima são os valores atuais, usados quando não há vigência cadastrada.
     pass # Manter a estrutura existente. A "vigência" será tratada na camada de dados.
 
 @dataclass(frozen=True)
 class Cargo:
     codigo_funcao: str
     nome_funcao: str
-    # ATENÇÃO: Salário aqui é o *padrão*. O salário *vigente* de um funcionário virá do histórico de salários.
+    # ATENÇÃO: Salário aqui é o *padrão*. O salário *vigente* em cada data vem do HistoricoCadastral
+    # (core/historico_cadastral.py), quando o cargo tiver vigências cadastradas.
     salario: float
     
 
@@ -74,6 +93,49 @@ class ParametroHistorico:
             return False
         return True
 
+
+NIVEIS_VIGENCIA_CADASTRAL = ("CARGO", "FUNCIONARIO")
+
+
+@dataclass(frozen=True)
+class VigenciaCadastral:
+    """
+    Valor de um campo cadastral com data de vigência de início e fim: salário de um cargo
+    (nivel "CARGO", chave = codigo_funcao) ou benefício de um funcionário (nivel "FUNCIONARIO", chave = chapa).
+    """
+    id: int
+    nivel: str
+    chave: str
+    campo: str
+    valor: float
+    data_inicio: date
+    data_fim: Optional[date] = None
+
+    def __post_init__(self):
+        if self.nivel not in NIVEIS_VIGENCIA_CADASTRAL:
+            raise ValueError(f"Nível de vigência deve ser um de {NIVEIS_VIGENCIA_CADASTRAL}.")
+        if self.data_fim is not None and self.data_fim < self.data_inicio:
+            raise ValueError("A data de fim da vigência não pode ser anterior à data de início.")
+
+    def is_active_on_date(self, check_date: date) -> bool:
+        """Verifica se esta vigência está ativa em uma determinada data."""
+        if self.data_inicio > check_date:
+            return False
+        if self.data_fim and self.data_fim < check_date:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class SegmentoParametros:
+    """
+    Intervalo de datas (fim inclusive) em que nenhum parâmetro histórico muda de valor,
+    com os valores vigentes nele. Parâmetros sem vigência no intervalo ficam de fora de 'valores'.
+    """
+    data_inicio: date
+    data_fim: date
+    valores: Dict[str, float]
+
 # --- Configuração Global (Agora irá *usar* o histórico de parâmetros) ---
 
 @dataclass(frozen=True)
@@ -143,6 +205,39 @@ class AcaoQuadroPessoal:
         if self.salario_base_simulado is not None and self.salario_base_simulado < 0:
             raise ValueError("Salário base simulado não pode ser negativo.")
 
+@dataclass(frozen=True, slots=True)
+class CoorteContratacao:
+    """
+    Grupo de contratações simuladas idênticas (mesma função, empresa/equipe, salário e benefícios),
+    guardado como um único registro com a quantidade de pessoas. As chapas da coorte são a faixa
+    contínua que começa em 'primeira_chapa'; reduções retiram as maiores chapas da faixa.
+    """
+    primeira_chapa: int
+    quantidade: int
+    codigo_funcao: str
+    funcao: str
+    empresa: str
+    equipe: str
+    data_admissao: datetime
+    valor_vale_transporte_mensal: float = 0.0
+    valor_vale_refeicao_mensal: float = 0.0
+    plano_saude_mensal: float = 0.0
+    outros_beneficios_mensais: float = 0.0
+    salario_base_simulado: Optional[float] = None # Se None, vale o salário padrão da função
+
+    @property
+    def identificador(self) -> str:
+        """A primeira chapa da faixa, que identifica a coorte no quadro."""
+        return str(self.primeira_chapa).zfill(5)
+
+    @property
+    def chapas(self) -> List[str]:
+        return [str(numero).zfill(5) for numero in range(self.primeira_chapa, self.primeira_chapa + self.quantidade)]
+
+    def contem_chapa(self, chapa: str) -> bool:
+        return chapa.isdigit() and self.primeira_chapa <= int(chapa) < self.primeira_chapa + self.quantidade
+
+
 @dataclass
 class CenarioOrcamento:
     nome_cenario: str
@@ -156,4 +251,67 @@ class CenarioOrcamento:
 
     def get_end_date(self) -> Dict[str, int]:
         end_date_calc = datetime(self.ano_inicio, self.mes_inicio, 1) + relativedelta(months=self.duracao_meses - 1)
-        return {"ano": end_date_calc.year, "mes": end_date_calc.month}
\ No newline at end of file
+        return {"ano": end_date_calc.year, "mes": end_date_calc.month}
+
+
+@dataclass(frozen=True, slots=True)
+class OrcamentoMensal:
+    """ Resultado compacto de um mês de simulação: só contagem e custo, sem os objetos Funcionario. """
+    ano: int
+    mes: int
+    numero_total_funcionarios: int
+    custo_total_orcamento: float
+
+
+@dataclass(frozen=True, slots=True)
+class DetalhamentoCusto:
+    """
+    Ficha de cálculo compacta de um funcionário em um mês: os mesmos valores do dicionário de
+    ServicoFolhaPagamento.calcular_detalhamento_custo_total, em atributos (sem um dict por ficha).
+    Aceita também a consulta pelo nome do campo da ficha, ex.: detalhamento["TOTAL_BENEFICIOS"].
+    """
+    salario_base: float
+    ev_dias_trabalhados: float
+    ev_adic_insalubridade: float
+    ev_adic_periculosidade: float
+    ev_adic_noturno: float
+    ev_gratificacao: float
+    ev_hora_s_aviso: float
+    total_proventos: float
+    encargo_fgts: float
+    encargo_inss_empresa: float
+    provisao_ferias: float
+    provisao_13_salario: float
+    total_encargos_e_provisoes: float
+    total_beneficios: float
+    total_custo_final_do_empregado: float
+
+    @classmethod
+    def de_dict(cls, ficha: Dict[str, float]) -> "DetalhamentoCusto":
+        return cls(**{campo.lower(): float(valor) for campo, valor in ficha.items()})
+
+    def para_dict(self) -> Dict[str, float]:
+        return {campo.upper(): getattr(self, campo) for campo in self.__slots__}
+
+    def __getitem__(self, campo: str) -> float:
+        try:
+            return getattr(self, campo.lower())
+        except AttributeError:
+            raise KeyError(campo) from None
+
+
+@dataclass(frozen=True, slots=True)
+class TotaisFolhaPagamento:
+    """
+    Totais da folha de um quadro: cada campo da ficha de cálculo somado para todos os funcionários
+    (coortes contam pela quantidade), em reais. Com agrupamento, 'subtotais' traz a mesma soma por grupo,
+    indexada pela tupla com os valores dos campos de 'agrupado_por' (ex.: ("Matriz", "Operacao")).
+    """
+    numero_funcionarios: int
+    total: DetalhamentoCusto
+    agrupado_por: Tuple[str, ...] = ()
+    subtotais: Dict[Tuple[str, ...], DetalhamentoCusto] = field(default_factory=dict)
+
+    @property
+    def custo_total(self) -> float:
+        return self.total.total_custo_final_do_empregado
@@ -7,8 +7,7 @@ e retornando um resultado.
 
 from datetime import date
 from typing import Dict, Any
-from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
-from core.payroll_rules import ServicoFolhaPagamento
+from core import dinheiro
 
 def calcular_salario_hora(salario: float, horas: int) -> float:
     """
@@ -20,28 +19,24 @@ def calcular_salario_hora(salario: float, horas: int) -> float:
     salario_hora_calculado = salario / horas
     return round(salario_hora_calculado, 2)
 
+# Os eventos em reais abaixo são as fórmulas em centavos (no fim do módulo) convertidas:
+# um único cálculo e uma única regra de arredondamento para a ficha em reais e em centavos.
+
 def calcular_bonus_percentual(valor_base: float, percentual: float) -> float:
     """
     Calcula um valor de bônus baseado em um percentual de um valor base.
     Formula: VALOR_BASE * PERCENTUAL
     """
-    bonus = valor_base * percentual
-    return round(bonus, 2)
+    return dinheiro.para_reais(calcular_bonus_percentual_centavos(dinheiro.para_centavos(valor_base), percentual))
 
 def calcular_salario_proporcional(salario_base: float, total_dias_no_mes: int, dias_nao_trabalhados: int) -> float: # <--- RENOMEADO AQUI
     """
     Calcula o salário proporcional aos dias trabalhados no mês.
     Formula: (SALARIO_BASE / TOTAL_DIAS_NO_MES) * (TOTAL_DIAS_NO_MES - DIAS_NAO_TRABALHADOS)
     """
-    if total_dias_no_mes <= 0:
-        return 0.0
-    dias_trabalhados = total_dias_no_mes - dias_nao_trabalhados
-    if dias_trabalhados < 0:
-        dias_trabalhados = 0
-
-    salario_diario = salario_base / total_dias_no_mes # <--- Use novos nomes
-    salario_proporcional_calculado = salario_diario * dias_trabalhados # <--- Use novos nomes
-    return round(salario_proporcional_calculado, 2)
+    return dinheiro.para_reais(calcular_salario_proporcional_centavos(
+        dinheiro.para_centavos(salario_base), total_dias_no_mes, dias_nao_trabalhados
+    ))
 
 
 def calcular_tempo_servico(data_inicio: date, data_fim: date) -> float:
@@ -54,16 +49,16 @@ def calcular_tempo_servico(data_inicio: date, data_fim: date) -> float:
     return anos
 
 def calcular_valor_fgts(salario_base: float, aliquota_fgts: float) -> float:
-    return salario_base * aliquota_fgts
+    return dinheiro.para_reais(calcular_valor_fgts_centavos(dinheiro.para_centavos(salario_base), aliquota_fgts))
 
 def calcular_inss_patronal(salario_base: float, aliquota_inss_empresa: float) -> float:
-    return salario_base * aliquota_inss_empresa
+    return dinheiro.para_reais(calcular_inss_patronal_centavos(dinheiro.para_centavos(salario_base), aliquota_inss_empresa))
 
 def calcular_provisao_ferias(salario_base: float, terco_ferias_percent: float, meses_ano: int) -> float:
-    return (salario_base * (1 + terco_ferias_percent)) / meses_ano
+    return dinheiro.para_reais(calcular_provisao_ferias_centavos(dinheiro.para_centavos(salario_base), terco_ferias_percent, meses_ano))
 
 def calcular_provisao_decimo_terceiro_salario(salario_base: float, meses_ano: int) -> float:
-    return salario_base / meses_ano
+    return dinheiro.para_reais(calcular_provisao_decimo_terceiro_salario_centavos(dinheiro.para_centavos(salario_base), meses_ano))
 
 def somar_beneficios(
     valor_vale_transporte_mensal: float,
@@ -88,8 +83,19 @@ def calcular_custo_total_funcionario(
 def calcular_total_proventos(
     salario_base_ou_proporcional: float,
     adicional_insalubridade: float,
+    adicional_periculosidade: float = 0.0,
+    adicional_noturno: float = 0.0,
+    gratificacao: float = 0.0,
+    hora_s_aviso: float = 0.0,
 ) -> float:
-    return salario_base_ou_proporcional + adicional_insalubridade
+    return (
+        salario_base_ou_proporcional +
+        adicional_insalubridade +
+        adicional_periculosidade +
+        adicional_noturno +
+        gratificacao +
+        hora_s_aviso
+    )
 
 
 def calcular_adicional_periculosidade_formula(valor_dias_trabalhados: float, percentual_periculosidade: float) -> float:
@@ -97,17 +103,83 @@ def calcular_adicional_periculosidade_formula(valor_dias_trabalhados: float, per
     Calcula o adicional de periculosidade.
     Fórmula: VALOR_DIAS_TRABALHADOS * PERCENTUAL_PERICULOSIDADE
     """
-    adicional = valor_dias_trabalhados * percentual_periculosidade
-    return round(adicional, 2)
+    return dinheiro.para_reais(calcular_adicional_periculosidade_centavos(
+        dinheiro.para_centavos(valor_dias_trabalhados), percentual_periculosidade
+    ))
 
 def calcular_adicional_noturno_formula(base_calculo_hora_total: float, jornada_padrao_mensal_horas: int, percentual_adicional: float, quantidade_horas_noturnas: float) -> float: # <-- Nomes dos parâmetros em português
     """
     Calcula o adicional noturno.
     Fórmula: (BASE_CALCULO_HORA_TOTAL / jornada_padrao_mensal_horas) * PERCENTUAL_ADICIONAL * QUANTIDADE_HORAS_NOTURNAS
     """
+    return dinheiro.para_reais(calcular_adicional_noturno_centavos(
+        dinheiro.para_centavos(base_calculo_hora_total), jornada_padrao_mensal_horas, percentual_adicional, quantidade_horas_noturnas
+    ))
+
+def calcular_gratificacao(valor_base_gratificacao_mensal: float, horas_trabalhadas_no_mes: float, jornada_padrao_mensal_horas: int) -> float:
+    """
+    Calcula a gratificação proporcional às horas trabalhadas no mês.
+    Fórmula: (VALOR_BASE_GRATIFICACAO / jornada_padrao_mensal_horas) * HORAS_TRABALHADAS_NO_MES
+    """
+    return dinheiro.para_reais(calcular_gratificacao_centavos(
+        dinheiro.para_centavos(valor_base_gratificacao_mensal), horas_trabalhadas_no_mes, jornada_padrao_mensal_horas
+    ))
+
+def calcular_hora_s_aviso(salario_base: float, jornada_padrao_mensal_horas: int, quantidade_horas_s_aviso: float) -> float:
+    """
+    Calcula o evento 'Hora S. Aviso' (horas pagas sem aviso prévio, pelo valor da hora normal).
+    Fórmula: (SALARIO_BASE / jornada_padrao_mensal_horas) * QUANTIDADE_HORAS_S_AVISO
+    """
+    return dinheiro.para_reais(calcular_hora_s_aviso_centavos(
+        dinheiro.para_centavos(salario_base), jornada_padrao_mensal_horas, quantidade_horas_s_aviso
+    ))
+
+# --- Fórmulas em centavos inteiros ---
+# Mesmos eventos das fórmulas acima, com valores em centavos (int) e o arredondamento de core.dinheiro:
+# cada evento é arredondado uma única vez para o centavo, com meio centavo para cima.
+
+def calcular_salario_proporcional_centavos(salario_base_centavos: int, total_dias_no_mes: int, dias_nao_trabalhados: int) -> int:
+    """
+    Fórmula: (SALARIO_BASE * DIAS_TRABALHADOS) / TOTAL_DIAS_NO_MES, em divisão inteira exata.
+    """
+    if total_dias_no_mes <= 0:
+        return 0
+    dias_trabalhados = max(total_dias_no_mes - dias_nao_trabalhados, 0)
+    return dinheiro.dividir_arredondando(salario_base_centavos * dias_trabalhados, total_dias_no_mes)
+
+def calcular_bonus_percentual_centavos(valor_base_centavos: int, percentual: float) -> int:
+    return dinheiro.aplicar_percentual(valor_base_centavos, percentual)
+
+def calcular_valor_fgts_centavos(salario_base_centavos: int, aliquota_fgts: float) -> int:
+    return dinheiro.aplicar_percentual(salario_base_centavos, aliquota_fgts)
+
+def calcular_inss_patronal_centavos(salario_base_centavos: int, aliquota_inss_empresa: float) -> int:
+    return dinheiro.aplicar_percentual(salario_base_centavos, aliquota_inss_empresa)
+
+def calcular_provisao_ferias_centavos(salario_base_centavos: int, terco_ferias_percent: float, meses_ano: int) -> int:
+    return dinheiro.arredondar_meio_para_cima(salario_base_centavos * (1 + terco_ferias_percent) / meses_ano)
+
+def calcular_provisao_decimo_terceiro_salario_centavos(salario_base_centavos: int, meses_ano: int) -> int:
+    return dinheiro.dividir_arredondando(salario_base_centavos, meses_ano)
+
+def calcular_adicional_periculosidade_centavos(valor_dias_trabalhados_centavos: int, percentual_periculosidade: float) -> int:
+    return dinheiro.aplicar_percentual(valor_dias_trabalhados_centavos, percentual_periculosidade)
+
+def calcular_adicional_noturno_centavos(base_calculo_hora_total_centavos: int, jornada_padrao_mensal_horas: int, percentual_adicional: float, quantidade_horas_noturnas: float) -> int:
+    """
+    Fórmula: (BASE_CALCULO_HORA_TOTAL / jornada_padrao_mensal_horas) * PERCENTUAL_ADICIONAL * QUANTIDADE_HORAS_NOTURNAS
+    """
     if jornada_padrao_mensal_horas <= 0:
-        return 0.0
-    
-    valor_hora_base = base_calculo_hora_total / jornada_padrao_mensal_horas
-    adicional = valor_hora_base * percentual_adicional * quantidade_horas_noturnas
-    return round(adicional, 2)
\ No newline at end of file
+        return 0
+    valor_hora_base = base_calculo_hora_total_centavos / jornada_padrao_mensal_horas
+    return dinheiro.arredondar_meio_para_cima(valor_hora_base * percentual_adicional * quantidade_horas_noturnas)
+
+def calcular_gratificacao_centavos(valor_base_gratificacao_centavos: int, horas_trabalhadas_no_mes: float, jornada_padrao_mensal_horas: int) -> int:
+    if jornada_padrao_mensal_horas <= 0:
+        return 0
+    return dinheiro.arredondar_meio_para_cima(valor_base_gratificacao_centavos / jornada_padrao_mensal_horas * horas_trabalhadas_no_mes)
+
+def calcular_hora_s_aviso_centavos(salario_base_centavos: int, jornada_padrao_mensal_horas: int, quantidade_horas_s_aviso: float) -> int:
+    if jornada_padrao_mensal_horas <= 0:
+        return 0
+    return dinheiro.arredondar_meio_para_cima(salario_base_centavos / jornada_padrao_mensal_horas * quantidade_horas_s_aviso)
@@ -0,0 +1,146 @@
+# core/grafo_eventos.py
+
+"""
+Grafo declarativo dos eventos da folha.
+
+Cada evento declara de quais outros eventos (ou colunas de entrada do lote) e de quais parâmetros
+da ConfiguracaoGlobal depende, e como é calculado sobre arrays NumPy de centavos inteiros. Os
+valores em reais são os mesmos centavos convertidos no fim (não há um segundo cálculo em float).
+Para um conjunto de saídas pedidas, o grafo é compilado uma vez em um PlanoCalculo: só os eventos
+necessários, já em ordem topológica. O plano roda sobre o lote inteiro e pula os eventos cujos
+gatilhos (ex.: a coluna recebe_periculosidade) são zero em todas as posições do lote.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+import numpy as np
+
+from core import dinheiro
+from core.entities import ConfiguracaoGlobal
+
+# Recebe os valores já calculados (colunas de entrada e eventos anteriores) e a configuração; devolve centavos
+CalculoEvento = Callable[[Mapping[str, np.ndarray], ConfiguracaoGlobal], np.ndarray]
+
+
+@dataclass(frozen=True)
+class EventoFolha:
+    """
+    Um evento da ficha de cálculo. 'dependencias' são nomes de outros eventos ou de colunas de entrada;
+    'parametros' são os campos da ConfiguracaoGlobal usados no cálculo. 'gatilhos' são dependências pelas
+    quais o evento é proporcional: se qualquer uma for zero no lote inteiro, o evento é zero e não é calculado.
+    """
+    nome: str
+    dependencias: Tuple[str, ...]
+    calcular: CalculoEvento
+    parametros: Tuple[str, ...] = ()
+    gatilhos: Tuple[str, ...] = ()
+
+
+class GrafoEventos:
+    """Conjunto de eventos indexado pelo nome. Nomes que não são eventos são tratados como colunas de entrada."""
+    def __init__(self, eventos: Iterable[EventoFolha]):
+        self.eventos: Dict[str, EventoFolha] = {}
+        for evento in eventos:
+            if evento.nome in self.eventos:
+                raise ValueError(f"Evento '{evento.nome}' declarado mais de uma vez.")
+            gatilhos_invalidos = set(evento.gatilhos) - set(evento.dependencias)
+            if gatilhos_invalidos:
+                raise ValueError(f"Gatilhos de '{evento.nome}' que não são dependências: {sorted(gatilhos_invalidos)}.")
+            self.eventos[evento.nome] = evento
+        self._compilar = lru_cache(maxsize=None)(self._compilar_plano)
+        self._em_ordem = self.compilar(tuple(self.eventos)).eventos
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self.eventos
+
+    def compilar(self, saidas: Sequence[str]) -> "PlanoCalculo":
+        """Plano de cálculo das saídas pedidas. O plano de cada conjunto de saídas é compilado uma única vez."""
+        return self._compilar(tuple(saidas))
+
+    def eventos_afetados(self, parametros: Iterable[str]) -> Set[str]:
+        """
+        Eventos cujo valor pode mudar quando os parâmetros informados mudam: os que usam algum deles
+        diretamente e, em cascata, os que dependem de um evento afetado.
+        """
+        parametros = set(parametros)
+        afetados = set()
+        for evento in self._em_ordem:
+            if parametros.intersection(evento.parametros) or afetados.intersection(evento.dependencias):
+                afetados.add(evento.nome)
+        return afetados
+
+    def _compilar_plano(self, saidas: Tuple[str, ...]) -> "PlanoCalculo":
+        desconhecidas = [saida for saida in saidas if saida not in self.eventos]
+        if desconhecidas:
+            raise ValueError(f"Eventos desconhecidos: {desconhecidas}.")
+
+        ordem: List[EventoFolha] = []
+        entradas: List[str] = []
+        visitados = set()
+        em_andamento = set()
+
+        def visitar(nome: str):
+            if nome in visitados:
+                return
+            if nome not in self.eventos:
+                visitados.add(nome)
+                entradas.append(nome)
+                return
+            if nome in em_andamento:
+                raise ValueError(f"Dependência circular envolvendo o evento '{nome}'.")
+            em_andamento.add(nome)
+            for dependencia in self.eventos[nome].dependencias:
+                visitar(dependencia)
+            em_andamento.discard(nome)
+            visitados.add(nome)
+            ordem.append(self.eventos[nome])
+
+        for saida in saidas:
+            visitar(saida)
+        return PlanoCalculo(tuple(ordem), saidas, tuple(entradas))
+
+
+class PlanoCalculo:
+    """
+    Eventos em ordem topológica para um conjunto de saídas. 'entradas' são as colunas que o lote precisa ter.
+    executar devolve só as saídas pedidas; os eventos intermediários são descartados.
+    """
+    def __init__(self, eventos: Tuple[EventoFolha, ...], saidas: Tuple[str, ...], entradas: Tuple[str, ...]):
+        self.eventos = eventos
+        self.saidas = saidas
+        self.entradas = entradas
+
+    def executar(
+        self,
+        colunas: Mapping[str, np.ndarray],
+        configuracao_global: ConfiguracaoGlobal,
+        em_centavos: bool = False,
+        calculados: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula as saídas sobre o lote, em centavos; com em_centavos=False, as saídas são convertidas
+        para reais no fim. Com 'calculados' (sempre em centavos), os eventos já presentes nele são
+        reaproveitados (e não recalculados), e os eventos calculados agora são acrescentados a ele.
+        """
+        faltando = [entrada for entrada in self.entradas if entrada not in colunas]
+        if faltando:
+            raise ValueError(f"Colunas de entrada ausentes no lote: {faltando}.")
+        quantidade = len(colunas[self.entradas[0]]) if self.entradas else 0
+
+        valores: Dict[str, np.ndarray] = {entrada: colunas[entrada] for entrada in self.entradas}
+        zerados = set()
+        for evento in self.eventos:
+            if calculados is not None and evento.nome in calculados:
+                valores[evento.nome] = calculados[evento.nome]
+                continue
+            if any(gatilho in zerados or not np.any(valores[gatilho]) for gatilho in evento.gatilhos):
+                valores[evento.nome] = np.zeros(quantidade, dtype=np.int64)
+                zerados.add(evento.nome)
+            else:
+                valores[evento.nome] = evento.calcular(valores, configuracao_global)
+            if calculados is not None:
+                calculados[evento.nome] = valores[evento.nome]
+        if em_centavos:
+            return {saida: valores[saida] for saida in self.saidas}
+        return {saida: dinheiro.para_reais(valores[saida]) for saida in self.saidas}
@@ -0,0 +1,176 @@
+# core/historico_cadastral.py
+
+"""
+Histórico cadastral com vigência: salário por cargo (codigo_funcao) e benefícios por funcionário (chapa).
+
+As vigências de cada (campo, chave) são resolvidas uma vez em segmentos sem sobreposição, com a mesma
+regra do histórico de parâmetros (vale a de início mais recente). Os segmentos de todas as chaves de um
+campo ficam em um único array ordenado por (chave, início), então o valor vigente de um quadro inteiro
+em uma data (ou cada linha em uma data diferente) sai de um único searchsorted, sem montar objetos
+Funcionario mês a mês. Onde não há vigência cadastrada vale o valor atual (Cargo.salario ou o campo do
+Funcionario).
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Sequence, Union
+import numpy as np
+
+from core.entities import VigenciaCadastral
+from core.history_manager import Datas, datas_para_array, resolver_vigencias
+from core.tabela_funcionarios import TabelaFuncionarios
+
+# Campos com vigência em cada nível, com a coluna do lote que cada um substitui
+CAMPOS_VIGENCIA_CARGO = {"salario": "salario_base"}
+CAMPOS_VIGENCIA_FUNCIONARIO = {
+    campo: campo for campo in (
+        "valor_vale_transporte_mensal", "valor_vale_refeicao_mensal", "plano_saude_mensal",
+        "outros_beneficios_mensais", "valor_base_gratificacao_mensal",
+    )
+}
+
+# Chave combinada (posição da chave, dia) para ordenar os segmentos de todas as chaves em um único array
+_DIAS_POR_CHAVE = 1 << 32
+_DESLOCAMENTO_DIAS = 1 << 31
+
+Registros = Union[Sequence[Any], TabelaFuncionarios]
+
+
+def vigencias_de_dados_brutos(raw_data: Iterable[Dict[str, Any]]) -> List[VigenciaCadastral]:
+    """Converte os dados brutos (ex: JSON) em VigenciaCadastral, na ordem de carga. Registros inválidos são ignorados."""
+    vigencias = []
+    for item in raw_data:
+        try:
+            start_date = datetime.strptime(item['start_date'], "%Y-%m-%d").date()
+            end_date = datetime.strptime(item['end_date'], "%Y-%m-%d").date() if item.get('end_date') else None
+            vigencias.append(VigenciaCadastral(
+                id=item['id'],
+                nivel=item['nivel'],
+                chave=str(item['chave']),
+                campo=item['campo'],
+                valor=float(item['value']),
+                data_inicio=start_date,
+                data_fim=end_date
+            ))
+        except (KeyError, ValueError, TypeError) as e:
+            print(f"Erro ao carregar vigência cadastral: {item}. Erro: {e}. Registro ignorado.")
+    return vigencias
+
+
+def _dias(datas: np.ndarray) -> np.ndarray:
+    return datas.astype('datetime64[D]').astype(np.int64) + _DESLOCAMENTO_DIAS
+
+
+class _VigenciasDoCampo:
+    """Segmentos de um campo para todas as chaves, em colunas ordenadas por (chave, início)."""
+    __slots__ = ("posicoes", "_ordem", "_chaves", "_fins", "_valores")
+
+    def __init__(self, vigencias_por_chave: Dict[str, List[VigenciaCadastral]]):
+        self.posicoes: Dict[str, int] = {}
+        chaves, inicios, fins, valores = [], [], [], []
+        for posicao, (chave, vigencias) in enumerate(vigencias_por_chave.items()):
+            self.posicoes[chave] = posicao
+            for inicio, fim, valor in resolver_vigencias(vigencias):
+                chaves.append(posicao)
+                inicios.append(inicio)
+                fins.append(fim if fim is not None else date.max)
+                valores.append(valor)
+        self._chaves = np.array(chaves, dtype=np.int64)
+        self._ordem = self._chaves * _DIAS_POR_CHAVE + _dias(np.array(inicios, dtype='datetime64[D]'))
+        self._fins = _dias(np.array(fins, dtype='datetime64[D]'))
+        self._valores = np.array(valores, dtype=np.float64)
+
+    def valores(self, posicoes: np.ndarray, datas: np.ndarray) -> np.ndarray:
+        """Valor vigente para cada (posição da chave, data); NaN para chave sem vigência (posição -1) ou data fora dela."""
+        dias = _dias(datas)
+        segmentos = np.searchsorted(self._ordem, posicoes * _DIAS_POR_CHAVE + dias, side='right') - 1
+        segmentos_validos = np.clip(segmentos, 0, None)
+        vigente = (posicoes >= 0) & (segmentos >= 0) & (self._chaves[segmentos_validos] == posicoes) \
+            & (dias <= self._fins[segmentos_validos])
+        return np.where(vigente, self._valores[segmentos_validos], np.nan)
+
+
+class HistoricoCadastral:
+    """
+    Vigências de salário por cargo e de benefícios por funcionário, com consultas em lote por data.
+    Montado uma vez na carga; as consultas aceitam uma data para o quadro inteiro ou uma data por linha.
+    """
+    def __init__(self, vigencias: Iterable[VigenciaCadastral] = ()):
+        agrupadas: Dict[str, Dict[str, List[VigenciaCadastral]]] = {}
+        for vigencia in vigencias:
+            campos_do_nivel = CAMPOS_VIGENCIA_CARGO if vigencia.nivel == "CARGO" else CAMPOS_VIGENCIA_FUNCIONARIO
+            if vigencia.campo not in campos_do_nivel:
+                raise ValueError(f"Campo '{vigencia.campo}' não tem vigência no nível {vigencia.nivel}.")
+            agrupadas.setdefault(vigencia.campo, {}).setdefault(vigencia.chave, []).append(vigencia)
+        self._campos: Dict[str, _VigenciasDoCampo] = {campo: _VigenciasDoCampo(por_chave) for campo, por_chave in agrupadas.items()}
+
+    @classmethod
+    def de_dados_brutos(cls, raw_data: Iterable[Dict[str, Any]]) -> "HistoricoCadastral":
+        return cls(vigencias_de_dados_brutos(raw_data))
+
+    def campos(self) -> List[str]:
+        """Campos com ao menos uma vigência cadastrada."""
+        return list(self._campos)
+
+    def valores_nas_datas(self, campo: str, chaves: Sequence[str], datas: Union[date, Datas]) -> np.ndarray:
+        """
+        Valor vigente do campo para cada chave (codigo_funcao ou chapa), na data informada ou na data de
+        cada posição. NaN onde a chave não tem vigência na data.
+        """
+        datas = _datas_alinhadas(datas, len(chaves))
+        vigencias = self._campos.get(campo)
+        if vigencias is None:
+            return np.full(len(chaves), np.nan)
+        posicoes = np.fromiter((vigencias.posicoes.get(chave, -1) for chave in chaves), dtype=np.int64, count=len(chaves))
+        return vigencias.valores(posicoes, datas)
+
+    def salarios_nas_datas(self, codigos_funcao: Sequence[str], datas: Union[date, Datas]) -> np.ndarray:
+        """Salário vigente de cada cargo na data (NaN sem vigência: vale o salário do catálogo)."""
+        return self.valores_nas_datas("salario", codigos_funcao, datas)
+
+    def colunas_na_data(self, registros: Registros, colunas: Dict[str, np.ndarray], datas: Union[date, Datas]) -> Dict[str, np.ndarray]:
+        """
+        Colunas do lote (de payroll_batch.montar_colunas_funcionarios) com os valores vigentes na data:
+        salario_base pelo cargo e benefícios pela chapa. Onde não há vigência, fica o valor atual da coluna.
+        Coortes com salário simulado mantêm o salário simulado. As colunas recebidas não são alteradas.
+        """
+        quantidade = len(registros)
+        datas = _datas_alinhadas(datas, quantidade)
+        ajustadas = dict(colunas)
+        if "salario" in self._campos and "salario_base" in colunas:
+            if isinstance(registros, TabelaFuncionarios):
+                # Uma busca por cargo distinto, como em TabelaFuncionarios.salarios_base
+                codigos, categorias = registros.categoricas["codigo_funcao"]
+                posicoes_por_codigo = np.array([self._campos["salario"].posicoes.get(c, -1) for c in categorias], dtype=np.int64)
+                salarios = self._campos["salario"].valores(posicoes_por_codigo[codigos], datas)
+            else:
+                salarios = self.salarios_nas_datas([getattr(r, "codigo_funcao", "") for r in registros], datas)
+            salarios[_com_salario_simulado(registros)] = np.nan
+            ajustadas["salario_base"] = np.where(np.isnan(salarios), colunas["salario_base"], salarios)
+
+        campos_funcionario = [c for c in CAMPOS_VIGENCIA_FUNCIONARIO if c in self._campos and c in colunas]
+        if campos_funcionario:
+            chapas = registros.textos["chapa"] if isinstance(registros, TabelaFuncionarios) else [getattr(r, "chapa", None) for r in registros]
+            for campo in campos_funcionario:
+                valores = self.valores_nas_datas(campo, chapas, datas)
+                ajustadas[campo] = np.where(np.isnan(valores), colunas[campo], valores)
+        return ajustadas
+
+
+def _com_salario_simulado(registros: Registros) -> np.ndarray:
+    """
+    Linhas com salário simulado (coortes com salario_base_simulado), que não seguem a vigência do cargo.
+    A TabelaFuncionarios só guarda Funcionario, sem salário simulado: nenhuma linha é marcada.
+    """
+    if isinstance(registros, TabelaFuncionarios):
+        return np.zeros(len(registros), dtype=bool)
+    return np.fromiter((getattr(r, "salario_base_simulado", None) is not None for r in registros), dtype=bool, count=len(registros))
+
+
+def _datas_alinhadas(datas: Union[date, Datas], quantidade: int) -> np.ndarray:
+    """Uma data para todas as posições ou uma data por posição, como array datetime64[D]."""
+    if isinstance(datas, date):
+        return np.full(quantidade, datas_para_array([datas])[0])
+    datas = datas_para_array(datas)
+    if len(datas) != quantidade:
+        raise ValueError("A lista de datas deve ter o mesmo tamanho da lista de registros.")
+    return datas
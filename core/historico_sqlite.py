@@ -0,0 +1,227 @@
+# core/historico_sqlite.py
+
+"""
+Histórico de parâmetros guardado em um banco SQLite local.
+
+Mesma API do GerenciadorHistorico em memória, mas os registros ficam em uma tabela indexada por
+(nome_parametro, data_inicio) e as consultas por data (valor vigente, parâmetros ativos, datas de
+mudança em um intervalo) são respondidas em SQL, sem carregar o histórico inteiro. A carga é feita
+uma única vez (ex.: importando o JSON), e as execuções seguintes só abrem o arquivo.
+
+O banco usa journal WAL, então vários processos podem ler o mesmo arquivo ao mesmo tempo. A conexão
+é aberta no primeiro uso em cada processo e não é serializada junto com o objeto.
+
+As consultas em lote por parâmetro usam a linha do tempo do parâmetro, montada na primeira consulta e
+guardada até o banco mudar (por uma carga deste objeto ou, via PRAGMA data_version, de outro processo).
+"""
+
+import sqlite3
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.entities import ParametroHistorico
+from core.history_manager import GerenciadorHistorico, Datas, datas_para_array, registros_de_dados_brutos, _LinhaDoTempoParametro
+
+# ordem_carga desempata vigências com a mesma data de início: vale a carregada primeiro, como em memória
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS parametros_historicos (
+    ordem_carga INTEGER PRIMARY KEY,
+    id INTEGER NOT NULL,
+    nome_parametro TEXT NOT NULL,
+    valor REAL NOT NULL,
+    data_inicio TEXT NOT NULL,
+    data_fim TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_parametros_nome_inicio ON parametros_historicos (nome_parametro, data_inicio);
+CREATE INDEX IF NOT EXISTS idx_parametros_inicio ON parametros_historicos (data_inicio);
+CREATE INDEX IF NOT EXISTS idx_parametros_fim ON parametros_historicos (data_fim);
+"""
+
+# Registro prevalente de um parâmetro em uma data: o de data_inicio mais recente entre os vigentes
+_SQL_VALOR_NA_DATA = """
+SELECT valor FROM parametros_historicos
+WHERE nome_parametro = :nome AND data_inicio <= :data AND (data_fim IS NULL OR data_fim >= :data)
+ORDER BY data_inicio DESC, ordem_carga
+LIMIT 1
+"""
+
+_SQL_PARAMETROS_NA_DATA = """
+SELECT nome_parametro, valor FROM (
+    SELECT nome_parametro, valor,
+           ROW_NUMBER() OVER (PARTITION BY nome_parametro ORDER BY data_inicio DESC, ordem_carga) AS posicao
+    FROM parametros_historicos
+    WHERE data_inicio <= :data AND (data_fim IS NULL OR data_fim >= :data)
+)
+WHERE posicao = 1
+"""
+
+# Candidatas a mudança são o início de cada vigência e o dia seguinte ao seu fim; só contam aquelas em que
+# o valor prevalente do parâmetro é diferente do valor na véspera (IS NOT também compara a ausência de valor)
+_SQL_DATAS_DE_MUDANCA = """
+WITH candidatas (nome_parametro, data) AS (
+    SELECT nome_parametro, data_inicio FROM parametros_historicos
+    WHERE (:inicio IS NULL OR data_inicio > :inicio) AND data_inicio <= :fim
+    UNION
+    SELECT nome_parametro, date(data_fim, '+1 day') FROM parametros_historicos
+    WHERE data_fim IS NOT NULL AND data_fim < :fim AND (:inicio IS NULL OR data_fim >= :inicio)
+)
+SELECT DISTINCT candidata.data FROM candidatas AS candidata
+WHERE (
+    SELECT valor FROM parametros_historicos AS p
+    WHERE p.nome_parametro = candidata.nome_parametro AND p.data_inicio <= candidata.data
+      AND (p.data_fim IS NULL OR p.data_fim >= candidata.data)
+    ORDER BY p.data_inicio DESC, p.ordem_carga LIMIT 1
+) IS NOT (
+    SELECT valor FROM parametros_historicos AS p
+    WHERE p.nome_parametro = candidata.nome_parametro AND p.data_inicio <= date(candidata.data, '-1 day')
+      AND (p.data_fim IS NULL OR p.data_fim >= date(candidata.data, '-1 day'))
+    ORDER BY p.data_inicio DESC, p.ordem_carga LIMIT 1
+)
+ORDER BY candidata.data
+"""
+
+
+def _texto_data(valor: date) -> str:
+    """Datas são gravadas como texto ISO (AAAA-MM-DD), que ordena igual às datas."""
+    return (valor.date() if isinstance(valor, datetime) else valor).isoformat()
+
+
+class GerenciadorHistoricoSQLite(GerenciadorHistorico):
+    """
+    GerenciadorHistorico sobre um arquivo SQLite. 'caminho_banco' pode ser ':memory:' (útil em testes),
+    mas aí o banco não é compartilhado. Se 'historical_data' for informado, substitui o conteúdo do banco.
+    """
+    def __init__(self, caminho_banco: str, historical_data: List[Dict[str, Any]] = None):
+        self.caminho_banco = caminho_banco
+        self._conexao: Optional[sqlite3.Connection] = None
+        self._linhas_do_tempo: Dict[str, _LinhaDoTempoParametro] = {}
+        self._versao_dados: Optional[int] = None
+        if historical_data:
+            self.carregar_de_dados_brutos(historical_data)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A conexão não é serializável: cada processo abre a sua (e monta as suas linhas do tempo)
+        return {"caminho_banco": self.caminho_banco, "_conexao": None, "_linhas_do_tempo": {}, "_versao_dados": None}
+
+    def _obter_conexao(self) -> sqlite3.Connection:
+        if self._conexao is None:
+            conexao = sqlite3.connect(self.caminho_banco, timeout=30.0)
+            if self.caminho_banco != ":memory:":
+                conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.executescript(ESQUEMA)
+            self._conexao = conexao
+        return self._conexao
+
+    def fechar(self):
+        """Fecha a conexão deste processo (ela é reaberta no próximo uso)."""
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
+        self._linhas_do_tempo = {}
+        self._versao_dados = None
+
+    def _consultar(self, sql: str, parametros: Dict[str, Any]) -> List[Tuple]:
+        return self._obter_conexao().execute(sql, parametros).fetchall()
+
+    def carregar_de_dados_brutos(self, raw_data: List[Dict[str, Any]]):
+        """
+        Substitui o conteúdo do banco pelos registros dos dados brutos (ex: JSON), em uma única transação.
+        Se algum registro for rejeitado, a carga é abortada e o banco fica como estava.
+        """
+        registros = registros_de_dados_brutos(raw_data)
+        if len(registros) != len(raw_data):
+            raise ValueError(
+                f"{len(raw_data) - len(registros)} registro(s) histórico(s) rejeitado(s): o banco '{self.caminho_banco}' não foi alterado."
+            )
+        self.carregar_registros(registros)
+
+    def carregar_registros(self, registros: Iterable[ParametroHistorico]):
+        """
+        Substitui o conteúdo do banco pelos registros informados, em uma única transação (carga em massa).
+        Uma carga sem registros é recusada, para que um arquivo vazio ou ilegível não apague o histórico.
+        """
+        linhas = [
+            (registro.id, registro.nome_parametro, registro.valor, _texto_data(registro.data_inicio),
+             _texto_data(registro.data_fim) if registro.data_fim is not None else None)
+            for registro in registros
+        ]
+        if not linhas:
+            raise ValueError(f"Carga sem registros históricos: o banco '{self.caminho_banco}' não foi alterado.")
+        conexao = self._obter_conexao()
+        with conexao:
+            conexao.execute("DELETE FROM parametros_historicos")
+            conexao.executemany(
+                "INSERT INTO parametros_historicos (id, nome_parametro, valor, data_inicio, data_fim) VALUES (?, ?, ?, ?, ?)",
+                linhas
+            )
+        self._linhas_do_tempo = {}
+
+    def _linha_do_tempo(self, parameter_name: str) -> _LinhaDoTempoParametro:
+        """Linha do tempo do parâmetro, montada uma vez e descartada quando outra conexão alterar o banco."""
+        (versao,), = self._consultar("PRAGMA data_version", {})
+        if versao != self._versao_dados:
+            self._linhas_do_tempo = {}
+            self._versao_dados = versao
+        linha_do_tempo = self._linhas_do_tempo.get(parameter_name)
+        if linha_do_tempo is None:
+            linha_do_tempo = _LinhaDoTempoParametro(self._registros_do_parametro(parameter_name))
+            self._linhas_do_tempo[parameter_name] = linha_do_tempo
+        return linha_do_tempo
+
+    def _registros_do_parametro(self, parameter_name: str) -> List[ParametroHistorico]:
+        linhas = self._consultar(
+            "SELECT id, nome_parametro, valor, data_inicio, data_fim FROM parametros_historicos "
+            "WHERE nome_parametro = :nome ORDER BY ordem_carga",
+            {"nome": parameter_name}
+        )
+        return [
+            ParametroHistorico(id=id_, nome_parametro=nome, valor=valor, data_inicio=date.fromisoformat(inicio),
+                               data_fim=date.fromisoformat(fim) if fim is not None else None)
+            for id_, nome, valor, inicio, fim in linhas
+        ]
+
+    def nomes_parametros(self) -> List[str]:
+        return [nome for (nome,) in self._consultar(
+            "SELECT DISTINCT nome_parametro FROM parametros_historicos ORDER BY nome_parametro", {}
+        )]
+
+    def obter_valor_na_data(self, parameter_name: str, check_date: date) -> Optional[float]:
+        """
+        Retorna o valor mais recente de um parâmetro que estava ativo na data especificada.
+        Se houver múltiplos valores ativos, retorna o que tem a data_inicio mais recente.
+        """
+        linhas = self._consultar(_SQL_VALOR_NA_DATA, {"nome": parameter_name, "data": _texto_data(check_date)})
+        if not linhas:
+            print(f"Aviso: Nenhum valor histórico encontrado para '{parameter_name}' na data {check_date}.")
+            return None
+        return linhas[0][0]
+
+    def obter_valores_nas_datas(self, parameter_name: str, datas: Datas) -> np.ndarray:
+        """
+        Valor do parâmetro em cada uma das datas. Lê só as vigências do parâmetro (pelo índice), uma vez, e resolve
+        todas as datas de uma vez com a busca vetorizada. Datas sem valor vigente ficam com NaN.
+        """
+        return self._linha_do_tempo(parameter_name).valores_nas_datas(datas_para_array(datas))
+
+    def obter_todos_parametros_ativos_na_data(self, check_date: date) -> Dict[str, float]:
+        """Retorna um dicionário com todos os parâmetros ativos e seus valores para uma dada data."""
+        return dict(self._consultar(_SQL_PARAMETROS_NA_DATA, {"data": _texto_data(check_date)}))
+
+    def _datas_de_mudanca(self, data_inicio: Optional[date], data_fim: date) -> List[date]:
+        linhas = self._consultar(_SQL_DATAS_DE_MUDANCA, {
+            "inicio": _texto_data(data_inicio) if data_inicio is not None else None, "fim": _texto_data(data_fim)
+        })
+        return [date.fromisoformat(data) for (data,) in linhas]
+
+    def obter_datas_de_mudanca(self) -> List[date]:
+        """
+        Retorna, em ordem, as datas em que o valor vigente de algum parâmetro muda.
+        Entre duas datas consecutivas o conjunto de parâmetros vigentes é constante.
+        """
+        return self._datas_de_mudanca(None, date.max)
+
+    def obter_datas_de_mudanca_entre(self, data_inicio: date, data_fim: date) -> List[date]:
+        """Datas de mudança posteriores a data_inicio e até data_fim, inclusive, em ordem."""
+        return self._datas_de_mudanca(data_inicio, data_fim)
@@ -1,8 +1,145 @@
 # core/history_manager.py (NOVO)
 
-from datetime import date, datetime
-from typing import List, Dict, Optional, Any
-from core.entities import ParametroHistorico # Assumindo que HistoricalParameter está em entities
+from bisect import bisect_right
+import heapq
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Iterable, Optional, Any, Sequence, Tuple, Union
+import numpy as np
+from core.entities import ParametroHistorico, SegmentoParametros # Assumindo que HistoricalParameter está em entities
+
+
+# Datas aceitas pelas consultas em lote: sequência de date/datetime ou array NumPy datetime64
+Datas = Union[Sequence[date], np.ndarray]
+
+
+def datas_para_array(datas: Datas) -> np.ndarray:
+    """Converte as datas para um array datetime64[D] (a hora de um datetime é descartada)."""
+    if isinstance(datas, np.ndarray) and np.issubdtype(datas.dtype, np.datetime64):
+        return datas.astype('datetime64[D]')
+    return np.array([d.date() if isinstance(d, datetime) else d for d in datas], dtype='datetime64[D]')
+
+
+def _resolver_segmentos(registros: Sequence[ParametroHistorico]) -> Tuple[List[date], List[Optional[date]], List[float]]:
+    """
+    Resolve as vigências em segmentos sem sobreposição (inicios, fins, valores), ordenados por início,
+    em uma única varredura dos registros ordenados por data de início (O(R log R)).
+    """
+    inicios: List[date] = []
+    fins: List[Optional[date]] = []
+    valores: List[float] = []
+
+    # Fronteiras onde o conjunto de registros vigentes pode mudar
+    fronteiras = set()
+    for registro in registros:
+        fronteiras.add(registro.data_inicio)
+        if registro.data_fim is not None and registro.data_fim < date.max:
+            fronteiras.add(registro.data_fim + timedelta(days=1))
+    fronteiras = sorted(fronteiras)
+
+    # Os registros entram no heap ao começar e saem (de forma preguiçosa) ao vencer. O topo é o
+    # prevalente: data_inicio mais recente e, em empate, o primeiro carregado.
+    ordenados = sorted(enumerate(registros), key=lambda item: item[1].data_inicio)
+    ativos: List[Tuple[int, int, ParametroHistorico]] = []
+    proximo = 0
+    for posicao, inicio in enumerate(fronteiras):
+        while proximo < len(ordenados) and ordenados[proximo][1].data_inicio <= inicio:
+            ordem, registro = ordenados[proximo]
+            heapq.heappush(ativos, (-registro.data_inicio.toordinal(), ordem, registro))
+            proximo += 1
+        while ativos and ativos[0][2].data_fim and ativos[0][2].data_fim < inicio:
+            heapq.heappop(ativos)
+        if not ativos:
+            continue
+        vigente = ativos[0][2]
+        fim = fronteiras[posicao + 1] - timedelta(days=1) if posicao + 1 < len(fronteiras) else vigente.data_fim
+        # Segmentos contíguos com o mesmo valor são unidos: não há mudança entre eles
+        if valores and valores[-1] == vigente.valor and fins[-1] is not None and fins[-1] + timedelta(days=1) == inicio:
+            fins[-1] = fim
+            continue
+        inicios.append(inicio)
+        fins.append(fim)
+        valores.append(vigente.valor)
+    return inicios, fins, valores
+
+
+class _LinhaDoTempoParametro:
+    """
+    Vigências de um único parâmetro, já resolvidas em segmentos sem sobreposição e
+    ordenados por data de início. Montada uma vez na carga, em uma única varredura dos registros
+    ordenados por início (O(R log R)); a consulta por data é um bisect.
+    """
+    __slots__ = ("inicios", "fins", "valores", "_inicios_array", "_fins_array", "_valores_array")
+
+    def __init__(self, registros: List[ParametroHistorico]):
+        self.inicios, self.fins, self.valores = _resolver_segmentos(registros)
+
+        # Mesmos segmentos em colunas, para a consulta em lote com searchsorted
+        self._inicios_array = np.array(self.inicios, dtype='datetime64[D]')
+        self._fins_array = np.array([fim if fim is not None else date.max for fim in self.fins], dtype='datetime64[D]')
+        self._valores_array = np.array(self.valores, dtype=np.float64)
+
+    def datas_de_mudanca(self) -> List[date]:
+        """Datas em que o valor vigente muda: início de cada segmento e o dia seguinte ao seu fim."""
+        datas = set(self.inicios)
+        for fim in self.fins:
+            if fim is not None and fim < date.max:
+                datas.add(fim + timedelta(days=1))
+        return sorted(datas)
+
+    def valor_na_data(self, check_date: date) -> Optional[float]:
+        posicao = bisect_right(self.inicios, check_date) - 1
+        if posicao < 0:
+            return None
+        fim = self.fins[posicao]
+        if fim is not None and fim < check_date:
+            return None
+        return self.valores[posicao]
+
+
+    def valores_nas_datas(self, datas: np.ndarray) -> np.ndarray:
+        """Versão em lote de valor_na_data sobre um array datetime64[D]: NaN onde não há valor vigente."""
+        if len(self._valores_array) == 0:
+            return np.full(len(datas), np.nan)
+        posicoes = np.searchsorted(self._inicios_array, datas, side='right') - 1
+        posicoes_validas = np.clip(posicoes, 0, None)
+        vigente = (posicoes >= 0) & (datas <= self._fins_array[posicoes_validas])
+        return np.where(vigente, self._valores_array[posicoes_validas], np.nan)
+
+
+def resolver_vigencias(registros: Sequence[ParametroHistorico]) -> List[Tuple[date, Optional[date], float]]:
+    """
+    Resolve vigências com possível sobreposição (vale a de início mais recente) em segmentos
+    (inicio, fim, valor) sem sobreposição, ordenados por início. fim None: sem data de término.
+    Aceita qualquer registro com data_inicio, data_fim e valor (ex.: VigenciaCadastral). Não monta os
+    arrays da consulta em lote, então é barata para resolver muitas chaves pequenas.
+    """
+    return list(zip(*_resolver_segmentos(registros)))
+
+
+def valores_historicos_nas_datas(registros: List[ParametroHistorico], datas: Datas) -> np.ndarray:
+    """Valores vigentes de um parâmetro (dados os seus registros) em cada data; NaN onde não há vigência."""
+    return _LinhaDoTempoParametro(registros).valores_nas_datas(datas_para_array(datas))
+
+
+def registros_de_dados_brutos(raw_data: Iterable[Dict[str, Any]]) -> List[ParametroHistorico]:
+    """Converte os dados brutos (ex: JSON) em ParametroHistorico, na ordem de carga. Registros inválidos são ignorados."""
+    registros = []
+    for item in raw_data:
+        try:
+            # Converte strings de data para objetos date
+            start_date = datetime.strptime(item['start_date'], "%Y-%m-%d").date()
+            end_date = datetime.strptime(item['end_date'], "%Y-%m-%d").date() if item.get('end_date') else None
+            registros.append(ParametroHistorico(
+                id=item['id'],
+                nome_parametro=item['parameter_name'],
+                valor=float(item['value']),
+                data_inicio=start_date,
+                data_fim=end_date
+            ))
+        except (KeyError, ValueError, TypeError) as e:
+            print(f"Erro ao carregar registro histórico: {item}. Erro: {e}. Registro ignorado.")
+    return registros
+
 
 class GerenciadorHistorico:
     """
@@ -12,59 +149,105 @@ class GerenciadorHistorico:
     """
     def __init__(self, historical_data: List[Dict[str, Any]] = None):
         self._history_records: List[ParametroHistorico] = []
+        self._linhas_do_tempo: Dict[str, _LinhaDoTempoParametro] = {}
+        self._datas_de_mudanca: List[date] = []
         if historical_data:
             self.carregar_de_dados_brutos(historical_data)
 
     def carregar_de_dados_brutos(self, raw_data: List[Dict[str, Any]]):
         """Carrega registros históricos a partir de dados brutos (ex: JSON)."""
-        self._history_records = []
-        for item in raw_data:
-            try:
-                # Converte strings de data para objetos date
-                start_date = datetime.strptime(item['start_date'], "%Y-%m-%d").date()
-                end_date = datetime.strptime(item['end_date'], "%Y-%m-%d").date() if item.get('end_date') else None
-                record = ParametroHistorico(
-                    id=item['id'],
-                    nome_parametro=item['parameter_name'],
-                    valor=float(item['value']),
-                    data_inicio=start_date,
-                    data_fim=end_date
-                )
-                self._history_records.append(record)
-            except (KeyError, ValueError, TypeError) as e:
-                print(f"Erro ao carregar registro histórico: {item}. Erro: {e}. Registro ignorado.")
+        self._history_records = registros_de_dados_brutos(raw_data)
+        self._indexar()
         # Opcional: Ordenar para otimizar buscas
         self._history_records.sort(key=lambda x: x.data_inicio)
 
+    def _indexar(self):
+        """Monta, uma única vez por carga, a linha do tempo de vigências de cada parâmetro."""
+        registros_por_parametro: Dict[str, List[ParametroHistorico]] = {}
+        for record in self._history_records:
+            registros_por_parametro.setdefault(record.nome_parametro, []).append(record)
+        self._linhas_do_tempo = {
+            nome: _LinhaDoTempoParametro(registros) for nome, registros in registros_por_parametro.items()
+        }
+        datas = set()
+        for linha_do_tempo in self._linhas_do_tempo.values():
+            datas.update(linha_do_tempo.datas_de_mudanca())
+        self._datas_de_mudanca = sorted(datas)
+
+    def nomes_parametros(self) -> List[str]:
+        """Nomes dos parâmetros carregados, em ordem alfabética."""
+        return sorted(self._linhas_do_tempo)
+
     def obter_valor_na_data(self, parameter_name: str, check_date: date) -> Optional[float]:
         """
         Retorna o valor mais recente de um parâmetro que estava ativo na data especificada.
-        Se houver múltiplos valores ativos, retorna o que tem a start_date mais recente.
+        Se houver múltiplos valores ativos, retorna o que tem a data_inicio mais recente.
         """
-        active_records = []
-        for record in self._history_records:
-            if record.nome_parametro == parameter_name and record.is_active_on_date(check_date):
-                active_records.append(record)
-        
-        if not active_records:
+        linha_do_tempo = self._linhas_do_tempo.get(parameter_name)
+        valor = linha_do_tempo.valor_na_data(check_date) if linha_do_tempo is not None else None
+        if valor is None:
             print(f"Aviso: Nenhum valor histórico encontrado para '{parameter_name}' na data {check_date}.")
-            return None # Ou levantar uma exceção
+        return valor
 
-        # Se houver mais de um, pega o mais recente (com a start_date maior)
-        # Em casos de sobreposição, a regra mais recente geralmente prevalece.
-        latest_record = max(active_records, key=lambda x: x.start_date)
-        return latest_record.value
+    def obter_valores_nas_datas(self, parameter_name: str, datas: Datas) -> np.ndarray:
+        """
+        Valor do parâmetro em cada uma das datas (ex.: a data de cálculo de cada funcionário, ou cada mês
+        de uma simulação), em uma única busca vetorizada. Datas sem valor vigente ficam com NaN.
+        """
+        datas = datas_para_array(datas)
+        linha_do_tempo = self._linhas_do_tempo.get(parameter_name)
+        if linha_do_tempo is None:
+            return np.full(len(datas), np.nan)
+        return linha_do_tempo.valores_nas_datas(datas)
+
+    def obter_parametros_nas_datas(self, datas: Datas, nomes: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Valores de vários parâmetros (por padrão, todos os carregados) em cada uma das datas:
+        um array por parâmetro, alinhado com as datas, com NaN onde o parâmetro não está vigente.
+        """
+        datas = datas_para_array(datas)
+        nomes = self.nomes_parametros() if nomes is None else nomes
+        return {nome: self.obter_valores_nas_datas(nome, datas) for nome in nomes}
 
     def obter_todos_parametros_ativos_na_data(self, check_date: date) -> Dict[str, float]:
         """
         Retorna um dicionário com todos os parâmetros ativos e seus valores para uma dada data.
         Útil para montar a GlobalConfig.
         """
-        active_params = {}        
-        sorted_records = sorted(self._history_records, key=lambda x: x.data_inicio, reverse=True)
-
-        for record in sorted_records:
-            if record.is_active_on_date(check_date):
-                if record.nome_parametro not in active_params: 
-                    active_params[record.nome_parametro] = record.valor
-        return active_params
\ No newline at end of file
+        active_params = {}
+        for nome_parametro, linha_do_tempo in self._linhas_do_tempo.items():
+            valor = linha_do_tempo.valor_na_data(check_date)
+            if valor is not None:
+                active_params[nome_parametro] = valor
+        return active_params
+
+    def obter_datas_de_mudanca(self) -> List[date]:
+        """
+        Retorna, em ordem, as datas em que o valor vigente de algum parâmetro muda.
+        Entre duas datas consecutivas o conjunto de parâmetros vigentes é constante.
+        """
+        return list(self._datas_de_mudanca)
+
+    def obter_datas_de_mudanca_entre(self, data_inicio: date, data_fim: date) -> List[date]:
+        """
+        Datas de mudança dentro do intervalo, em ordem: as posteriores a data_inicio e até data_fim, inclusive.
+        Uma mudança exatamente em data_inicio não é devolvida, pois não divide o intervalo.
+        """
+        primeira = bisect_right(self._datas_de_mudanca, data_inicio)
+        ultima = bisect_right(self._datas_de_mudanca, data_fim)
+        return self._datas_de_mudanca[primeira:ultima]
+
+    def obter_segmentos_entre(self, data_inicio: date, data_fim: date) -> List[SegmentoParametros]:
+        """
+        Divide o intervalo [data_inicio, data_fim] nos segmentos em que todos os parâmetros ficam constantes
+        (ex.: o salário mínimo muda em janeiro e o INSS em março: três segmentos), com os valores vigentes
+        em cada um. Assim a simulação e o cálculo em lote calculam cada segmento uma única vez.
+        """
+        if data_fim < data_inicio:
+            raise ValueError(f"Intervalo inválido: {data_inicio} a {data_fim}.")
+        inicios = [data_inicio] + self.obter_datas_de_mudanca_entre(data_inicio, data_fim)
+        fins = [inicio - timedelta(days=1) for inicio in inicios[1:]] + [data_fim]
+        return [
+            SegmentoParametros(inicio, fim, self.obter_todos_parametros_ativos_na_data(inicio))
+            for inicio, fim in zip(inicios, fins)
+        ]
@@ -0,0 +1,176 @@
+# core/ingestao_quadro.py
+
+"""
+Ingestão do quadro de funcionários em fluxo (streaming).
+
+Lê os registros aos poucos (JSON Lines ou CSV), valida cada um com ValidadorDadosFuncionario,
+monta o Funcionario, calcula o custo em blocos com o motor em lote e alimenta o AcumuladorQPA.
+Cada etapa é um gerador, então a memória fica limitada ao tamanho do bloco, e não ao tamanho do quadro.
+"""
+
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from core import dinheiro
+from core.entities import Funcionario, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.validators import ValidadorDadosFuncionario, DataValidationError
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_rules import ServicoFolhaPagamento
+from core.qpa_generator import AcumuladorQPA
+
+TAMANHO_BLOCO_PADRAO = 5000
+
+# Recebe o registro bruto rejeitado e o motivo
+AoRejeitar = Callable[[Dict[str, Any], str], None]
+
+
+def ler_registros_jsonl(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Lê um arquivo JSON Lines (um objeto por linha), uma linha de cada vez. Linhas em branco são ignoradas."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for numero_linha, linha in enumerate(f, start=1):
+            if not linha.strip():
+                continue
+            registro = json.loads(linha)
+            if not isinstance(registro, dict):
+                raise ValueError(f"Linha {numero_linha} de '{file_path}' não é um objeto JSON.")
+            yield registro
+
+
+def ler_registros_csv(file_path: str, delimitador: str = ',') -> Iterator[Dict[str, Any]]:
+    """Lê um arquivo CSV com cabeçalho, uma linha de cada vez. Todos os valores chegam como texto."""
+    with open(file_path, 'r', newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f, delimiter=delimitador)
+
+
+def ler_registros(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Escolhe o leitor pela extensão: '.jsonl'/'.ndjson' e '.csv' são lidos em fluxo.
+    ATENÇÃO: um '.json' (lista de objetos) precisa ser carregado inteiro com json.load; use JSON Lines
+    para quadros grandes.
+    """
+    extensao = file_path.lower().rsplit('.', 1)[-1]
+    if extensao in ("jsonl", "ndjson"):
+        return ler_registros_jsonl(file_path)
+    if extensao == "csv":
+        return ler_registros_csv(file_path)
+    if extensao == "json":
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("O arquivo de funcionários deve ser uma lista de objetos.")
+        return iter(data)
+    raise ValueError(f"Formato de arquivo de funcionários não suportado: '{file_path}'.")
+
+
+def construir_funcionario(validated_emp_data: Dict[str, Any]) -> Funcionario:
+    """Monta o Funcionario a partir do dicionário devolvido por ValidadorDadosFuncionario.validate."""
+    return Funcionario(
+        chapa=validated_emp_data['chapa'], nome=validated_emp_data['nome'], situacao=validated_emp_data['situacao'],
+        codigo_funcao=validated_emp_data['codigo_funcao'], data_admissao=validated_emp_data['data_admissao'],
+        data_admissao_pts=validated_emp_data['data_admissao_pts'], data_nascimento=validated_emp_data['data_nascimento'],
+        secao=validated_emp_data['secao'], carga_horaria_mensal=validated_emp_data['carga_horaria_mensal'], cpf=validated_emp_data['cpf'],
+        centro_custo=validated_emp_data['centro_custo'],
+        empresa=validated_emp_data.get('empresa', ''),
+        equipe=validated_emp_data.get('equipe', ''),
+        funcao=validated_emp_data.get('funcao', ''),
+        valor_vale_transporte_mensal=validated_emp_data.get('valor_vale_transporte_mensal', 0.0),
+        valor_vale_refeicao_mensal=validated_emp_data.get('valor_vale_refeicao_mensal', 0.0),
+        plano_saude_mensal=validated_emp_data.get('plano_saude_mensal', 0.0),
+        outros_beneficios_mensais=validated_emp_data.get('outros_beneficios_mensais', 0.0)
+    )
+
+
+def _imprimir_rejeicao(registro: Dict[str, Any], motivo: str):
+    print(f"Erro de validação para funcionário {registro.get('CHAPA', 'N/A')}: {motivo}. Funcionário ignorado.")
+
+
+def funcionarios_validos(
+    registros: Iterable[Dict[str, Any]],
+    catalogo_cargos: CatalogoCargos,
+    validador: Optional[ValidadorDadosFuncionario] = None,
+    ao_rejeitar: Optional[AoRejeitar] = None
+) -> Iterator[Funcionario]:
+    """
+    Valida os registros brutos um a um e gera os Funcionario válidos, na ordem de entrada.
+    Registros inválidos ou com função fora do catálogo são passados para 'ao_rejeitar'
+    (por padrão, uma mensagem no console) e ficam de fora.
+    """
+    validador = validador or ValidadorDadosFuncionario()
+    ao_rejeitar = ao_rejeitar or _imprimir_rejeicao
+    for registro in registros:
+        try:
+            validated_emp_data = validador.validate(registro)
+        except DataValidationError as e:
+            ao_rejeitar(registro, str(e))
+            continue
+        if catalogo_cargos.obter(validated_emp_data['codigo_funcao']) is None:
+            ao_rejeitar(registro, f"Função '{validated_emp_data['codigo_funcao']}' não encontrada")
+            continue
+        yield construir_funcionario(validated_emp_data)
+
+
+def em_blocos(itens: Iterable[Any], tamanho_bloco: int) -> Iterator[List[Any]]:
+    """Agrupa um iterável em listas de até 'tamanho_bloco' itens, sem materializar o iterável inteiro."""
+    if tamanho_bloco <= 0:
+        raise ValueError("'tamanho_bloco' deve ser um inteiro positivo.")
+    iterador = iter(itens)
+    while True:
+        bloco = list(islice(iterador, tamanho_bloco))
+        if not bloco:
+            return
+        yield bloco
+
+
+@dataclass
+class ResumoQuadro:
+    """
+    Resultado da ingestão em fluxo: só totais e o QPA agregado, sem os objetos Funcionario.
+    O custo é somado em centavos inteiros, então resumos parciais podem ser juntados em qualquer ordem.
+    """
+    numero_total_funcionarios: int = 0
+    custo_total_centavos: int = 0
+    qpa: AcumuladorQPA = field(default_factory=AcumuladorQPA)
+
+    @property
+    def custo_total(self) -> float:
+        return dinheiro.para_reais(self.custo_total_centavos)
+
+    def mesclar(self, outro: "ResumoQuadro"):
+        """Soma os totais e as contagens do QPA de outro resumo (ex.: o de um bloco)."""
+        self.numero_total_funcionarios += outro.numero_total_funcionarios
+        self.custo_total_centavos += outro.custo_total_centavos
+        self.qpa.mesclar(outro.qpa)
+
+
+def processar_quadro_em_fluxo(
+    funcionarios: Iterable[Funcionario],
+    servico_folha_pagamento: ServicoFolhaPagamento,
+    catalogo_cargos: CatalogoCargos,
+    configuracao_global: ConfiguracaoGlobal,
+    lancamento_mensal: Optional[LancamentoMensalFuncionario] = None,
+    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+    ao_calcular_bloco: Optional[Callable[[List[Funcionario], List[float]], None]] = None
+) -> ResumoQuadro:
+    """
+    Calcula o custo do quadro bloco a bloco com o motor em lote (em centavos) e acumula o QPA.
+    Só um bloco de funcionários fica em memória por vez. 'ao_calcular_bloco' recebe cada bloco
+    com o custo de cada funcionário, em reais (ex.: para gravar os custos em um arquivo de saída).
+    """
+    lancamento_mensal = lancamento_mensal or LancamentoMensalFuncionario()
+    resumo = ResumoQuadro()
+    for bloco in em_blocos(funcionarios, tamanho_bloco):
+        custos, custo_do_bloco = servico_folha_pagamento.calcular_custo_total_ponderado_lote_centavos(
+            registros=bloco,
+            cargos=catalogo_cargos,
+            configuracao_global=configuracao_global,
+            lancamento_mensal=lancamento_mensal
+        )
+        resumo.numero_total_funcionarios += len(bloco)
+        resumo.custo_total_centavos += custo_do_bloco
+        resumo.qpa.adicionar(bloco)
+        if ao_calcular_bloco is not None:
+            ao_calcular_bloco(bloco, dinheiro.para_reais(custos).tolist())
+    return resumo
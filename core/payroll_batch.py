@@ -0,0 +1,420 @@
+# core/payroll_batch.py
+
+"""
+Motor de cálculo em lote da folha de pagamento.
+
+Calcula a mesma ficha de ServicoFolhaPagamento.calcular_detalhamento_custo_total,
+mas para um quadro inteiro de uma vez, usando arrays NumPy (uma posição por
+funcionário). Os eventos são calculados só em centavos, com as mesmas regras de
+arredondamento do cálculo escalar, para que os resultados batam centavo a centavo
+com o caminho por funcionário; a ficha em reais é a mesma, convertida no fim.
+"""
+
+from typing import Callable, Collection, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, CoorteContratacao, DetalhamentoCusto, TotaisFolhaPagamento
+from core.catalogo_cargos import CatalogoCargos
+from core import dinheiro, formulas
+from core.tabela_funcionarios import TabelaFuncionarios, codificar_categorias
+from core.grafo_eventos import EventoFolha, GrafoEventos
+from core.config import parametros_alterados
+
+# Campos da ficha na mesma ordem do cálculo individual
+CAMPOS_DETALHAMENTO = [
+    "SALARIO_BASE",
+    "EV_DIAS_TRABALHADOS",
+    "EV_ADIC_INSALUBRIDADE",
+    "EV_ADIC_PERICULOSIDADE",
+    "EV_ADIC_NOTURNO",
+    "EV_GRATIFICACAO",
+    "EV_HORA_S_AVISO",
+    "TOTAL_PROVENTOS",
+    "ENCARGO_FGTS",
+    "ENCARGO_INSS_EMPRESA",
+    "PROVISAO_FERIAS",
+    "PROVISAO_13_SALARIO",
+    "TOTAL_ENCARGOS_E_PROVISOES",
+    "TOTAL_BENEFICIOS",
+    "TOTAL_CUSTO_FINAL_DO_EMPREGADO",
+]
+
+TOTAL_DIAS_NO_MES = 30
+
+# Campos aceitos no agrupamento dos totais da folha
+CAMPOS_AGRUPAMENTO = ("empresa", "equipe", "centro_custo")
+
+# Campos do funcionário (ou da coorte) lidos pelo cálculo, além do salário e da quantidade
+CAMPOS_NUMERICOS_REGISTRO = (
+    "valor_vale_transporte_mensal", "valor_vale_refeicao_mensal", "plano_saude_mensal",
+    "outros_beneficios_mensais", "valor_base_gratificacao_mensal",
+)
+
+# Campos do lançamento mensal lidos pelo cálculo, com o tipo da coluna
+CAMPOS_LANCAMENTO = (
+    ("dias_ferias", np.int64),
+    ("recebe_insalubridade", bool),
+    ("recebe_periculosidade", bool),
+    ("horas_trabalhadas_no_mes", np.float64),
+    ("quantidade_horas_s_aviso", np.float64),
+    ("quantidade_horas_adicional_noturno", np.float64),
+)
+
+# Uma posição do lote pode ser um funcionário ou uma coorte de contratações simuladas (uma linha para a coorte inteira)
+RegistroQuadro = Union[Funcionario, CoorteContratacao]
+
+
+def _salario_base_do_registro(registro: RegistroQuadro, catalogo: CatalogoCargos) -> float:
+    salario_simulado = getattr(registro, "salario_base_simulado", None)
+    if salario_simulado is not None:
+        return salario_simulado
+    return catalogo.obter_salario(registro.codigo_funcao)
+
+
+def _colunas_dos_registros(
+    funcionarios: Sequence[RegistroQuadro], catalogo: CatalogoCargos, quantidade: int, campos: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    colunas = {
+        "salario_base": np.fromiter(
+            (_salario_base_do_registro(f, catalogo) for f in funcionarios), dtype=np.float64, count=quantidade
+        ),
+        "quantidade": np.fromiter(
+            (getattr(f, "quantidade", 1) for f in funcionarios), dtype=np.int64, count=quantidade
+        ),
+    }
+    for campo in campos:
+        # Coortes não têm todos os campos do Funcionario (ex.: gratificação): ficam com zero
+        colunas[campo] = np.fromiter((getattr(f, campo, 0.0) for f in funcionarios), dtype=np.float64, count=quantidade)
+    return colunas
+
+
+def montar_colunas_funcionarios(
+    funcionarios: Union[Sequence[RegistroQuadro], TabelaFuncionarios],
+    cargos: Union[CatalogoCargos, list[Cargo]],
+    lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]],
+    entradas: Optional[Collection[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Extrai dos objetos Funcionario (e dos lançamentos mensais) as colunas usadas pelo cálculo em lote.
+    Uma TabelaFuncionarios já fornece as colunas prontas, sem percorrer as linhas.
+    O lançamento pode ser um único LancamentoMensalFuncionario (aplicado a todos) ou uma
+    sequência alinhada com a lista de funcionários.
+    Coortes de contratação ocupam uma única posição; a coluna 'quantidade' guarda quantas pessoas
+    cada posição representa (1 para funcionários), e a coorte pode trazer seu próprio salário simulado.
+    Com 'entradas' (ex.: PlanoCalculo.entradas), só essas colunas são extraídas, além do salário e da quantidade.
+    """
+    quantidade = len(funcionarios)
+    catalogo = CatalogoCargos.de_cargos(cargos)
+    campos_registro = [campo for campo in CAMPOS_NUMERICOS_REGISTRO if entradas is None or campo in entradas]
+    campos_lancamento = [(campo, tipo) for campo, tipo in CAMPOS_LANCAMENTO if entradas is None or campo in entradas]
+
+    if isinstance(funcionarios, TabelaFuncionarios):
+        # A tabela já está em colunas: nada é percorrido objeto a objeto
+        colunas = {
+            "salario_base": funcionarios.salarios_base(catalogo),
+            "quantidade": np.ones(quantidade, dtype=np.int64),
+        }
+        for campo in campos_registro:
+            colunas[campo] = funcionarios.numericos[campo]
+    else:
+        colunas = _colunas_dos_registros(funcionarios, catalogo, quantidade, campos_registro)
+
+    if isinstance(lancamento_mensal, LancamentoMensalFuncionario):
+        for campo, tipo in campos_lancamento:
+            colunas[campo] = np.full(quantidade, getattr(lancamento_mensal, campo), dtype=tipo)
+    else:
+        if len(lancamento_mensal) != quantidade:
+            raise ValueError("A lista de lançamentos mensais deve ter o mesmo tamanho da lista de funcionários.")
+        for campo, tipo in campos_lancamento:
+            colunas[campo] = np.fromiter((getattr(l, campo) for l in lancamento_mensal), dtype=tipo, count=quantidade)
+    return colunas
+
+
+# --- Grafo dos eventos da folha ---
+# Cada evento é calculado em centavos, com as regras de core.dinheiro (batendo com
+# ServicoFolhaPagamento.calcular_detalhamento_custo_total_centavos); a ficha em reais é a conversão.
+
+def _dias_trabalhados(valores: Mapping[str, np.ndarray]) -> np.ndarray:
+    return np.maximum(TOTAL_DIAS_NO_MES - valores["dias_ferias"], 0)
+
+
+def _somar(*campos: str) -> Callable[[Mapping[str, np.ndarray], ConfiguracaoGlobal], np.ndarray]:
+    """Soma de eventos (em centavos inteiros: exata em qualquer ordem)."""
+    def calcular(valores: Mapping[str, np.ndarray], configuracao_global: ConfiguracaoGlobal) -> np.ndarray:
+        total = valores[campos[0]]
+        for campo in campos[1:]:
+            total = total + valores[campo]
+        return total
+    return calcular
+
+
+def _por_hora(configuracao_global: ConfiguracaoGlobal, valor: np.ndarray, *fatores: np.ndarray) -> np.ndarray:
+    """VALOR / JORNADA_PADRAO * FATORES..., arredondado para o centavo; zero sem jornada definida."""
+    jornada = configuracao_global.horas_jornada_padrao_mensal
+    if jornada <= 0:
+        return np.zeros(len(valor), dtype=np.int64)
+    resultado = valor / jornada
+    for fator in fatores:
+        resultado = resultado * fator
+    return dinheiro.arredondar_meio_para_cima(resultado)
+
+
+PROVENTOS = (
+    "EV_DIAS_TRABALHADOS", "EV_ADIC_INSALUBRIDADE", "EV_ADIC_PERICULOSIDADE",
+    "EV_ADIC_NOTURNO", "EV_GRATIFICACAO", "EV_HORA_S_AVISO",
+)
+ENCARGOS_E_PROVISOES = ("ENCARGO_FGTS", "ENCARGO_INSS_EMPRESA", "PROVISAO_FERIAS", "PROVISAO_13_SALARIO")
+BENEFICIOS = ("valor_vale_transporte_mensal", "valor_vale_refeicao_mensal", "plano_saude_mensal", "outros_beneficios_mensais")
+
+GRAFO_EVENTOS_FOLHA = GrafoEventos([
+    # 1. Proventos
+    EventoFolha(
+        "SALARIO_BASE", dependencias=("salario_base",),
+        calcular=lambda v, c: dinheiro.para_centavos_array(v["salario_base"]),
+    ),
+    EventoFolha(
+        "EV_DIAS_TRABALHADOS", dependencias=("SALARIO_BASE", "dias_ferias"),
+        calcular=lambda v, c: dinheiro.dividir_arredondando(v["SALARIO_BASE"] * _dias_trabalhados(v), TOTAL_DIAS_NO_MES),
+    ),
+    EventoFolha(
+        "EV_ADIC_INSALUBRIDADE", dependencias=("recebe_insalubridade",),
+        parametros=("salario_minimo", "percentual_insalubridade"), gatilhos=("recebe_insalubridade",),
+        calcular=lambda v, c: np.where(
+            v["recebe_insalubridade"],
+            formulas.calcular_bonus_percentual_centavos(dinheiro.para_centavos(c.salario_minimo), c.percentual_insalubridade), 0
+        ).astype(np.int64),
+    ),
+    EventoFolha(
+        "EV_ADIC_PERICULOSIDADE", dependencias=("EV_DIAS_TRABALHADOS", "recebe_periculosidade"),
+        parametros=("percentual_periculosidade",), gatilhos=("recebe_periculosidade",),
+        calcular=lambda v, c: np.where(
+            v["recebe_periculosidade"], dinheiro.aplicar_percentual(v["EV_DIAS_TRABALHADOS"], c.percentual_periculosidade), 0
+        ).astype(np.int64),
+    ),
+    EventoFolha(
+        "EV_ADIC_NOTURNO",
+        dependencias=("SALARIO_BASE", "EV_ADIC_INSALUBRIDADE", "EV_ADIC_PERICULOSIDADE", "quantidade_horas_adicional_noturno"),
+        parametros=("horas_jornada_padrao_mensal", "percentual_adicional_noturno"), gatilhos=("quantidade_horas_adicional_noturno",),
+        calcular=lambda v, c: _por_hora(
+            c, v["SALARIO_BASE"] + v["EV_ADIC_INSALUBRIDADE"] + v["EV_ADIC_PERICULOSIDADE"],
+            c.percentual_adicional_noturno, v["quantidade_horas_adicional_noturno"]
+        ),
+    ),
+    EventoFolha(
+        "EV_GRATIFICACAO", dependencias=("valor_base_gratificacao_mensal", "horas_trabalhadas_no_mes"),
+        parametros=("horas_jornada_padrao_mensal",), gatilhos=("valor_base_gratificacao_mensal", "horas_trabalhadas_no_mes"),
+        calcular=lambda v, c: _por_hora(
+            c, dinheiro.para_centavos_array(v["valor_base_gratificacao_mensal"]), v["horas_trabalhadas_no_mes"]
+        ),
+    ),
+    EventoFolha(
+        "EV_HORA_S_AVISO", dependencias=("SALARIO_BASE", "quantidade_horas_s_aviso"),
+        parametros=("horas_jornada_padrao_mensal",), gatilhos=("quantidade_horas_s_aviso",),
+        calcular=lambda v, c: _por_hora(c, v["SALARIO_BASE"], v["quantidade_horas_s_aviso"]),
+    ),
+    EventoFolha("TOTAL_PROVENTOS", dependencias=PROVENTOS, calcular=_somar(*PROVENTOS)),
+
+    # 2. Encargos e Provisões
+    EventoFolha(
+        "ENCARGO_FGTS", dependencias=("SALARIO_BASE",), parametros=("aliquota_fgts_patronal",),
+        calcular=lambda v, c: dinheiro.aplicar_percentual(v["SALARIO_BASE"], c.aliquota_fgts_patronal),
+    ),
+    EventoFolha(
+        "ENCARGO_INSS_EMPRESA", dependencias=("SALARIO_BASE",), parametros=("aliquota_inss_patronal_media",),
+        calcular=lambda v, c: dinheiro.aplicar_percentual(v["SALARIO_BASE"], c.aliquota_inss_patronal_media),
+    ),
+    EventoFolha(
+        "PROVISAO_FERIAS", dependencias=("SALARIO_BASE",), parametros=("percentual_terco_ferias", "meses_do_ano"),
+        calcular=lambda v, c: dinheiro.arredondar_meio_para_cima(
+            v["SALARIO_BASE"] * (1 + c.percentual_terco_ferias) / c.meses_do_ano
+        ),
+    ),
+    EventoFolha(
+        "PROVISAO_13_SALARIO", dependencias=("SALARIO_BASE",), parametros=("meses_do_ano",),
+        calcular=lambda v, c: dinheiro.dividir_arredondando(v["SALARIO_BASE"], c.meses_do_ano),
+    ),
+    EventoFolha("TOTAL_ENCARGOS_E_PROVISOES", dependencias=ENCARGOS_E_PROVISOES, calcular=_somar(*ENCARGOS_E_PROVISOES)),
+
+    # 3. Benefícios
+    EventoFolha(
+        "TOTAL_BENEFICIOS", dependencias=BENEFICIOS,
+        calcular=lambda v, c: sum(dinheiro.para_centavos_array(v[campo]) for campo in BENEFICIOS),
+    ),
+
+    # 4. Custo Total Final do Empregado
+    EventoFolha(
+        "TOTAL_CUSTO_FINAL_DO_EMPREGADO", dependencias=("SALARIO_BASE", "TOTAL_BENEFICIOS", "TOTAL_ENCARGOS_E_PROVISOES"),
+        calcular=_somar("SALARIO_BASE", "TOTAL_BENEFICIOS", "TOTAL_ENCARGOS_E_PROVISOES"),
+    ),
+])
+
+
+def calcular_detalhamento_lote(
+    colunas: Dict[str, np.ndarray],
+    configuracao_global: ConfiguracaoGlobal,
+    campos: Sequence[str] = CAMPOS_DETALHAMENTO
+) -> Dict[str, np.ndarray]:
+    """
+    Gera a ficha de cálculo para todas as posições das colunas de uma vez, em reais.
+    Retorna um dicionário com as chaves pedidas em 'campos' (por padrão, a ficha individual completa),
+    cada uma com um array. Só os eventos de que esses campos dependem são calculados. Os valores são
+    os de calcular_detalhamento_lote_centavos divididos por 100.
+    """
+    return GRAFO_EVENTOS_FOLHA.compilar(campos).executar(colunas, configuracao_global)
+
+
+def calcular_detalhamento_lote_centavos(
+    colunas: Dict[str, np.ndarray],
+    configuracao_global: ConfiguracaoGlobal,
+    campos: Sequence[str] = CAMPOS_DETALHAMENTO
+) -> Dict[str, np.ndarray]:
+    """
+    Mesma ficha de calcular_detalhamento_lote, em centavos inteiros (arrays int64), com as regras de
+    arredondamento de core.dinheiro: cada evento é arredondado uma vez, e os totais são somas exatas.
+    Bate centavo a centavo com ServicoFolhaPagamento.calcular_detalhamento_custo_total_centavos.
+    """
+    return GRAFO_EVENTOS_FOLHA.compilar(campos).executar(colunas, configuracao_global, em_centavos=True)
+
+
+class DetalhamentoLote(Mapping):
+    """
+    Ficha em lote preguiçosa: um Mapping com as chaves de CAMPOS_DETALHAMENTO em que cada campo só é
+    calculado no primeiro acesso, e guardado. Os eventos intermediários calculados para um campo são
+    reaproveitados pelos campos seguintes; campos nunca lidos não custam nada.
+    """
+    def __init__(self, colunas: Dict[str, np.ndarray], configuracao_global: ConfiguracaoGlobal, em_centavos: bool = False):
+        self.colunas = colunas
+        self.configuracao_global = configuracao_global
+        self.em_centavos = em_centavos
+        # Eventos sempre em centavos; sem em_centavos, a conversão de cada campo lido fica em _em_reais
+        self._calculados: Dict[str, np.ndarray] = {}
+        self._em_reais: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, campo: str) -> np.ndarray:
+        if campo not in CAMPOS_DETALHAMENTO:
+            raise KeyError(campo)
+        if campo not in self._calculados:
+            GRAFO_EVENTOS_FOLHA.compilar((campo,)).executar(self.colunas, self.configuracao_global, True, self._calculados)
+        if self.em_centavos:
+            return self._calculados[campo]
+        if campo not in self._em_reais:
+            self._em_reais[campo] = dinheiro.para_reais(self._calculados[campo])
+        return self._em_reais[campo]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CAMPOS_DETALHAMENTO)
+
+    def __len__(self) -> int:
+        return len(CAMPOS_DETALHAMENTO)
+
+    def campos_calculados(self) -> List[str]:
+        """Campos da ficha já calculados até agora."""
+        return [campo for campo in CAMPOS_DETALHAMENTO if campo in self._calculados]
+
+    def com_configuracao(self, nova_configuracao: ConfiguracaoGlobal) -> "DetalhamentoLote":
+        """
+        O mesmo lote com outra configuração, reaproveitando tudo o que os parâmetros alterados não afetam.
+        Ex.: um novo salário mínimo só invalida a insalubridade (e o adicional noturno e os proventos, que
+        dependem dela); FGTS, provisões e custo final continuam os já calculados. Os campos afetados são
+        recalculados no próximo acesso, só sobre os eventos invalidados. Este lote não é alterado.
+        """
+        afetados = GRAFO_EVENTOS_FOLHA.eventos_afetados(parametros_alterados(self.configuracao_global, nova_configuracao))
+        novo = DetalhamentoLote(self.colunas, nova_configuracao, self.em_centavos)
+        novo._calculados = {evento: valores for evento, valores in self._calculados.items() if evento not in afetados}
+        return novo
+
+    def ficha(self, indice: int) -> "FichaPreguicosa":
+        """A ficha de uma posição do lote, também preguiçosa."""
+        return FichaPreguicosa(self, indice)
+
+
+class FichaPreguicosa(Mapping):
+    """Ficha de uma posição de um DetalhamentoLote: cada campo é lido (e, se preciso, calculado) no acesso."""
+    __slots__ = ("_lote", "_indice")
+
+    def __init__(self, lote: DetalhamentoLote, indice: int):
+        self._lote = lote
+        self._indice = indice
+
+    def __getitem__(self, campo: str) -> Union[float, int]:
+        valor = self._lote[campo][self._indice]
+        return int(valor) if self._lote.em_centavos else float(valor)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CAMPOS_DETALHAMENTO)
+
+    def __len__(self) -> int:
+        return len(CAMPOS_DETALHAMENTO)
+
+    def __repr__(self) -> str:
+        return f"FichaPreguicosa({dict(self)!r})"
+
+
+def detalhamento_da_posicao(resultado_lote: Dict[str, np.ndarray], indice: int) -> Dict[str, float]:
+    """Extrai de um resultado em lote a ficha (dict de floats) de um único funcionário."""
+    return {campo: float(resultado_lote[campo][indice]) for campo in CAMPOS_DETALHAMENTO}
+
+
+def detalhamentos_do_lote(resultado_lote: Dict[str, np.ndarray]) -> List[DetalhamentoCusto]:
+    """
+    Converte um resultado em lote em uma DetalhamentoCusto por posição. Bem mais compacto que uma
+    ficha em dict por funcionário quando muitos meses de detalhe ficam guardados.
+    """
+    colunas = [resultado_lote[campo].tolist() for campo in CAMPOS_DETALHAMENTO]
+    return [DetalhamentoCusto(*valores) for valores in zip(*colunas)]
+
+
+def codigos_de_grupo(
+    registros: Union[Sequence[RegistroQuadro], TabelaFuncionarios],
+    agrupar_por: Sequence[str]
+) -> Tuple[np.ndarray, List[Tuple[str, ...]]]:
+    """
+    Código do grupo de cada posição (0, 1, 2... na ordem em que cada grupo aparece) e a chave de cada grupo.
+    Registros sem o campo (ex.: centro_custo das coortes) caem no grupo do texto vazio.
+    """
+    campos_invalidos = [campo for campo in agrupar_por if campo not in CAMPOS_AGRUPAMENTO]
+    if campos_invalidos:
+        raise ValueError(f"Campos de agrupamento inválidos: {campos_invalidos}. Use {list(CAMPOS_AGRUPAMENTO)}.")
+    if len(registros) == 0:
+        return np.zeros(0, dtype=np.int64), []
+    if isinstance(registros, TabelaFuncionarios):
+        colunas = [registros.categoricas[campo] for campo in agrupar_por]
+    else:
+        colunas = [codificar_categorias(getattr(registro, campo, "") for registro in registros) for campo in agrupar_por]
+
+    codigos = np.stack([codigos_do_campo for codigos_do_campo, _ in colunas], axis=1)
+    grupos, primeira_posicao, grupo_da_posicao = np.unique(codigos, axis=0, return_index=True, return_inverse=True)
+    ordem = np.argsort(primeira_posicao, kind="stable")
+    renumeracao = np.empty(len(ordem), dtype=np.int64)
+    renumeracao[ordem] = np.arange(len(ordem))
+    chaves = [tuple(categorias[codigo] for (_, categorias), codigo in zip(colunas, grupos[posicao])) for posicao in ordem]
+    return renumeracao[grupo_da_posicao.ravel()], chaves
+
+
+def totalizar_lote_centavos(
+    resultado_lote: Dict[str, np.ndarray],
+    quantidade: np.ndarray,
+    agrupar_por: Sequence[str] = (),
+    grupos: Optional[Tuple[np.ndarray, List[Tuple[str, ...]]]] = None
+) -> TotaisFolhaPagamento:
+    """
+    Soma cada coluna de um resultado de calcular_detalhamento_lote_centavos, ponderada pela quantidade,
+    e, se 'grupos' (de codigos_de_grupo) for informado, também por grupo. As somas são de centavos
+    inteiros (exatas); os totais são convertidos para reais só no fim.
+    """
+    ponderados = {campo: resultado_lote[campo] * quantidade for campo in CAMPOS_DETALHAMENTO}
+    total = DetalhamentoCusto(*(dinheiro.para_reais(int(ponderados[campo].sum())) for campo in CAMPOS_DETALHAMENTO))
+
+    subtotais = {}
+    if grupos is not None:
+        codigos, chaves = grupos
+        # bincount soma em float64, exato para inteiros abaixo de 2**53 centavos
+        somas = [
+            np.rint(np.bincount(codigos, weights=ponderados[campo], minlength=len(chaves))).astype(np.int64)
+            for campo in CAMPOS_DETALHAMENTO
+        ]
+        for indice, chave in enumerate(chaves):
+            subtotais[chave] = DetalhamentoCusto(*(dinheiro.para_reais(int(soma[indice])) for soma in somas))
+    return TotaisFolhaPagamento(
+        numero_funcionarios=int(quantidade.sum()), total=total, agrupado_por=tuple(agrupar_por), subtotais=subtotais
+    )
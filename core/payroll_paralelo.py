@@ -0,0 +1,217 @@
+# core/payroll_paralelo.py
+
+"""
+Execução paralela do cálculo da folha para quadros grandes.
+
+O quadro é dividido em blocos, e cada bloco vai para um processo do ProcessPoolExecutor. O catálogo
+de cargos vai para os processos uma única vez, no inicializador do pool (o pool é recriado quando o
+catálogo muda); a cada tarefa seguem só o bloco e os argumentos pequenos que mudam de uma chamada
+para outra, como a ConfiguracaoGlobal de cada mês de uma simulação. Os resultados dos blocos são juntados sempre na ordem dos blocos, então o resultado não
+depende de qual processo termina primeiro. Os totais são somados em centavos inteiros (também na
+versão em float, convertida só no fim), e por isso não dependem nem do tamanho do bloco.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain
+import os
+import pickle
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from core import dinheiro
+from core.entities import Funcionario, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_batch import RegistroQuadro
+from core.payroll_rules import ServicoFolhaPagamento, Cargos
+from core.ingestao_quadro import ResumoQuadro, em_blocos, processar_quadro_em_fluxo, TAMANHO_BLOCO_PADRAO
+
+Lancamentos = Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+
+
+# Funções executadas nos processos: precisam ficar no nível do módulo para serem serializadas (pickle)
+
+# Catálogo de cargos do pool, recebido uma vez por processo no inicializador
+_catalogo_do_worker: Optional[CatalogoCargos] = None
+
+
+def _inicializar_worker(catalogo_cargos: CatalogoCargos):
+    global _catalogo_do_worker
+    _catalogo_do_worker = catalogo_cargos
+
+
+def _executar_no_worker(funcao: Callable[..., Any], bloco: Any, *argumentos: Any) -> Any:
+    return funcao(bloco, _catalogo_do_worker, *argumentos)
+
+
+def _custos_do_bloco_centavos(
+    bloco: Tuple[List[RegistroQuadro], Lancamentos],
+    catalogo_cargos: CatalogoCargos,
+    configuracao_global: ConfiguracaoGlobal
+) -> Tuple[np.ndarray, int]:
+    registros, lancamento_mensal = bloco
+    return ServicoFolhaPagamento().calcular_custo_total_ponderado_lote_centavos(
+        registros, catalogo_cargos, configuracao_global, lancamento_mensal
+    )
+
+
+def _resumo_do_bloco(
+    funcionarios: List[Funcionario],
+    catalogo_cargos: CatalogoCargos,
+    configuracao_global: ConfiguracaoGlobal,
+    lancamento_mensal: LancamentoMensalFuncionario
+) -> ResumoQuadro:
+    return processar_quadro_em_fluxo(
+        funcionarios, ServicoFolhaPagamento(), catalogo_cargos, configuracao_global,
+        lancamento_mensal, tamanho_bloco=max(len(funcionarios), 1)
+    )
+
+
+class ExecutorFolhaParalelo:
+    """
+    Calcula a folha de um quadro grande em vários processos.
+    'processos' é a quantidade de workers (None: um por núcleo) e 'tamanho_bloco' a quantidade de
+    funcionários enviada a cada worker. Entradas que cabem em um único bloco são calculadas no próprio
+    processo, sem custo de serialização. O pool é criado no primeiro uso e reaproveitado até encerrar();
+    a classe também pode ser usada como gerenciador de contexto (with).
+    """
+    def __init__(self, processos: Optional[int] = None, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+        if processos is not None and processos <= 0:
+            raise ValueError("'processos' deve ser um inteiro positivo.")
+        if tamanho_bloco <= 0:
+            raise ValueError("'tamanho_bloco' deve ser um inteiro positivo.")
+        self.processos = processos
+        self.tamanho_bloco = tamanho_bloco
+        self._executor: Optional[Executor] = None
+        self._catalogo_serializado: Optional[bytes] = None
+
+    def __enter__(self) -> "ExecutorFolhaParalelo":
+        return self
+
+    def __exit__(self, *excinfo):
+        self.encerrar()
+
+    def encerrar(self):
+        """Encerra os processos do pool (se ele chegou a ser criado)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._catalogo_serializado = None
+
+    def _obter_executor(self, catalogo_cargos: CatalogoCargos) -> Executor:
+        """
+        Pool cujos processos já receberam o catálogo no inicializador. O catálogo é comparado pela forma
+        serializada (uma vez por chamada, não por bloco): se mudou, inclusive por cargos adicionados ao
+        mesmo objeto, o pool anterior é encerrado e um novo é criado.
+        """
+        catalogo_serializado = pickle.dumps(catalogo_cargos)
+        if self._executor is not None and catalogo_serializado != self._catalogo_serializado:
+            self.encerrar()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processos, initializer=_inicializar_worker, initargs=(catalogo_cargos,)
+            )
+            self._catalogo_serializado = catalogo_serializado
+        return self._executor
+
+    def _mapear_em_ordem(
+        self, funcao: Callable[..., Any], blocos: Iterator[Any], catalogo_cargos: CatalogoCargos, *argumentos: Any
+    ) -> Iterator[Any]:
+        """
+        Envia os blocos aos workers e devolve os resultados na ordem dos blocos; cada worker chama
+        funcao(bloco, catalogo_cargos, *argumentos) com o catálogo do pool. No máximo dois blocos por
+        worker ficam pendentes, para não materializar a entrada inteira.
+        """
+        executor = self._obter_executor(catalogo_cargos)
+        limite_pendentes = 2 * (self.processos or os.cpu_count() or 1)
+        pendentes = deque()
+        for bloco in blocos:
+            pendentes.append(executor.submit(_executar_no_worker, funcao, bloco, *argumentos))
+            if len(pendentes) >= limite_pendentes:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+    def calcular_custo_total_ponderado_lote(
+        self,
+        registros: Sequence[RegistroQuadro],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Lancamentos
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Mesmo contrato de ServicoFolhaPagamento.calcular_custo_total_ponderado_lote: custo por pessoa de cada
+        registro (na ordem da lista) e o custo total ponderado. O cálculo é o de centavos, convertido para
+        reais só no fim, então o total é o mesmo qualquer que seja o tamanho do bloco.
+        """
+        custos, total = self.calcular_custo_total_ponderado_lote_centavos(registros, cargos, configuracao_global, lancamento_mensal)
+        return dinheiro.para_reais(custos), dinheiro.para_reais(total)
+
+    def calcular_custo_total_ponderado_lote_centavos(
+        self,
+        registros: Sequence[RegistroQuadro],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Lancamentos
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Mesmo contrato de ServicoFolhaPagamento.calcular_custo_total_ponderado_lote_centavos. Como a soma é
+        de inteiros, o total é idêntico ao do cálculo em um único lote, qualquer que seja o tamanho do bloco.
+        """
+        return self._calcular_em_blocos(_custos_do_bloco_centavos, registros, cargos, configuracao_global, lancamento_mensal)
+
+    def _calcular_em_blocos(
+        self,
+        calcular_bloco: Callable[..., Tuple[np.ndarray, int]],
+        registros: Sequence[RegistroQuadro],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Lancamentos
+    ) -> Tuple[np.ndarray, int]:
+        catalogo = CatalogoCargos.de_cargos(cargos)
+        if len(registros) <= self.tamanho_bloco:
+            return calcular_bloco((list(registros), lancamento_mensal), catalogo, configuracao_global)
+        if not isinstance(lancamento_mensal, LancamentoMensalFuncionario) and len(lancamento_mensal) != len(registros):
+            raise ValueError("A lista de lançamentos mensais deve ter o mesmo tamanho da lista de funcionários.")
+
+        def blocos() -> Iterator[Tuple[List[RegistroQuadro], Lancamentos]]:
+            for inicio in range(0, len(registros), self.tamanho_bloco):
+                fim = inicio + self.tamanho_bloco
+                if isinstance(lancamento_mensal, LancamentoMensalFuncionario):
+                    yield list(registros[inicio:fim]), lancamento_mensal
+                else:
+                    # Cada bloco leva a sua fatia de lançamentos
+                    yield list(registros[inicio:fim]), list(lancamento_mensal[inicio:fim])
+
+        custos_por_bloco = []
+        custo_total = 0
+        for custos, total_do_bloco in self._mapear_em_ordem(calcular_bloco, blocos(), catalogo, configuracao_global):
+            custos_por_bloco.append(custos)
+            custo_total += total_do_bloco
+        return np.concatenate(custos_por_bloco), custo_total
+
+    def processar_quadro(
+        self,
+        funcionarios: Iterable[Funcionario],
+        catalogo_cargos: CatalogoCargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Optional[LancamentoMensalFuncionario] = None
+    ) -> ResumoQuadro:
+        """
+        Versão paralela de processar_quadro_em_fluxo: cada worker devolve os totais e a contagem do QPA
+        do seu bloco, e os resumos são juntados na ordem dos blocos. A entrada é consumida aos poucos.
+        """
+        lancamento_mensal = lancamento_mensal or LancamentoMensalFuncionario()
+        blocos = em_blocos(funcionarios, self.tamanho_bloco)
+        primeiro_bloco = next(blocos, [])
+        segundo_bloco = next(blocos, None)
+        if segundo_bloco is None:
+            return _resumo_do_bloco(primeiro_bloco, catalogo_cargos, configuracao_global, lancamento_mensal)
+
+        resumos_dos_blocos = self._mapear_em_ordem(
+            _resumo_do_bloco, chain([primeiro_bloco, segundo_bloco], blocos), catalogo_cargos, configuracao_global, lancamento_mensal
+        )
+        resumo = ResumoQuadro()
+        for resumo_do_bloco in resumos_dos_blocos:
+            resumo.mesclar(resumo_do_bloco)
+        return resumo
@@ -1,23 +1,38 @@
 # core/payroll_rules.py
 
-from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, TotaisFolhaPagamento
 from core import formulas # Alterado: Importa o novo módulo 'formulas'
+from core import dinheiro
+from core import payroll_batch
+from core.catalogo_cargos import CatalogoCargos
+from core.tabela_funcionarios import TabelaFuncionarios
+from core.historico_cadastral import HistoricoCadastral
+from core.cache_detalhamento import CacheDetalhamento, chave_detalhamento
 from datetime import date, datetime # Import datetime aqui também se for usado na classe
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+# Os métodos de lote (pontos de entrada) aceitam tanto uma list[Cargo] quanto um CatalogoCargos: com a
+# lista, o catálogo é montado uma vez por chamada. Os cálculos por funcionário recebem o CatalogoCargos
+# já montado (busca O(1), sem percorrer nem reindexar os cargos a cada funcionário).
+Cargos = Union[CatalogoCargos, list[Cargo]]
+
+# O custo ponderado só precisa do custo final: os eventos de proventos nem entram no plano de cálculo
+CAMPO_CUSTO_FINAL = ("TOTAL_CUSTO_FINAL_DO_EMPREGADO",)
 
 class ServicoFolhaPagamento:
-    
-    def obter_salario_funcionario(self, employee: Funcionario, functions: list[Cargo]) -> float:
+
+    def __init__(self, cache_detalhamento: Optional[CacheDetalhamento] = None):
+        self.cache_detalhamento = cache_detalhamento
+
+    def obter_salario_funcionario(self, employee: Funcionario, functions: CatalogoCargos) -> float:
         """Obtém o salário base do funcionário com base na sua função."""
-        for function in functions:
-            if employee.codigo_funcao == function.codigo_funcao:
-                return function.salario
-        return 0.0
-
-    def obter_salario_hora_funcionario(self, employee: Funcionario, functions: list[Cargo]) -> float:
-        """Calcula o salário por hora do funcionário, usando a fórmula pura."""
-        salario_base = self.obter_salario_funcionario(employee=employee, functions=functions)
+        return functions.obter_salario(employee.codigo_funcao)
+
+    def obter_salario_hora_funcionario(self, employee: Funcionario, functions: CatalogoCargos) -> float:
+        """Calcula o salário por hora do funcionário, usando o valor pré-calculado do catálogo."""
         jornada_mensal_horas = int(employee.carga_horaria_mensal)
-        return formulas.calcular_salario_hora(salario=salario_base, horas=jornada_mensal_horas)
+        return functions.obter_salario_hora(employee.codigo_funcao, jornada_mensal_horas)
 
     
     def obter_anos_servico(self, employee: Funcionario, data_calculo: date) -> float:
@@ -38,23 +53,24 @@ class ServicoFolhaPagamento:
 
     def calcular_total_folha_pagamento(
         self,
-        funcionarios: list[Funcionario],
-        cargos: list[Cargo],
+        funcionarios: Union[Sequence[payroll_batch.RegistroQuadro], TabelaFuncionarios],
+        cargos: Cargos,
         configuracao_global: ConfiguracaoGlobal,
-        lancamento_mensal_padrao: LancamentoMensalFuncionario
-    ) -> float:
-        """
-        Calcula o custo total da folha de pagamento para uma lista de funcionários.
-        ATENÇÃO: Este método ainda soma apenas o salário base. Para custo total completo,
-        ele precisaria utilizar o calcular_detalhamento_custo_total para cada funcionário.
-        """
-        total_cost = 0.0
-        for funcionario in funcionarios:
-            salario_funcionario = self.obter_salario_funcionario(funcionario, cargos)
-            total_cost += salario_funcionario
-        return total_cost
-    
-    def calcular_salario_proporcional_servico(self, funcionario: Funcionario, cargos: list[Cargo], lancamento_mensal: LancamentoMensalFuncionario) -> float:
+        lancamento_mensal_padrao: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]],
+        agrupar_por: Sequence[str] = ()
+    ) -> TotaisFolhaPagamento:
+        """
+        Calcula os totais da folha de pagamento em uma única passada do motor em lote (em centavos):
+        salário, proventos, cada encargo e provisão, benefícios e custo final, somados coluna a coluna,
+        sem montar uma ficha por funcionário. Coortes de contratação contam pela quantidade.
+        'agrupar_por' (qualquer combinação de 'empresa', 'equipe' e 'centro_custo') gera também os subtotais por grupo.
+        """
+        colunas = payroll_batch.montar_colunas_funcionarios(funcionarios, cargos, lancamento_mensal_padrao)
+        resultado = payroll_batch.calcular_detalhamento_lote_centavos(colunas, configuracao_global)
+        grupos = payroll_batch.codigos_de_grupo(funcionarios, agrupar_por) if agrupar_por else None
+        return payroll_batch.totalizar_lote_centavos(resultado, colunas["quantidade"], agrupar_por, grupos)
+
+    def calcular_salario_proporcional_servico(self, funcionario: Funcionario, cargos: CatalogoCargos, lancamento_mensal: LancamentoMensalFuncionario) -> float:
         """Orquestra o cálculo do salário proporcional, usando a fórmula pura."""
         salario_base = self.obter_salario_funcionario(funcionario, cargos)
         if salario_base == 0.0:
@@ -70,72 +86,245 @@ class ServicoFolhaPagamento:
     def calcular_detalhamento_custo_total( 
         self,
         funcionario: Funcionario,
-        cargos: list[Cargo],
+        cargos: CatalogoCargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: LancamentoMensalFuncionario,
+        atualizar_funcionario: bool = True
+    ) -> Mapping[str, float]:
+        """
+        Gera uma ficha de cálculo completa de proventos e encargos para um funcionário, em reais: os
+        valores de calcular_detalhamento_custo_total_centavos divididos por 100.
+        Com atualizar_funcionario=False o objeto Funcionario não é alterado (útil quando ele é
+        compartilhado entre cenários, como no QuadroSimulado).
+        Com cache_detalhamento, funcionários com as mesmas entradas de custo recebem a mesma ficha,
+        somente leitura, calculada uma única vez.
+        """
+        if self.cache_detalhamento is None:
+            results = self._detalhamento_em_reais(funcionario, cargos, configuracao_global, lancamento_mensal)
+        else:
+            chave = chave_detalhamento(cargos.obter_salario(funcionario.codigo_funcao), funcionario, configuracao_global, lancamento_mensal)
+            results = self.cache_detalhamento.obter_ou_calcular(
+                chave, lambda: self._detalhamento_em_reais(funcionario, cargos, configuracao_global, lancamento_mensal)
+            )
+
+        # ATUALIZA O ATRIBUTO custo_total_mensal DO OBJETO FUNCIONARIO
+        if atualizar_funcionario:
+            funcionario.custo_total_mensal = results["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+
+        return results
+
+    def _detalhamento_em_reais(
+        self,
+        funcionario: Funcionario,
+        cargos: CatalogoCargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: LancamentoMensalFuncionario
+    ) -> Dict[str, float]:
+        # A ficha em reais é a ficha em centavos convertida: um único cálculo, e os totais fecham com os eventos
+        centavos = self.calcular_detalhamento_custo_total_centavos(funcionario, cargos, configuracao_global, lancamento_mensal)
+        return {campo: dinheiro.para_reais(valor) for campo, valor in centavos.items()}
+
+    def calcular_detalhamento_custo_total_centavos(
+        self,
+        funcionario: Funcionario,
+        cargos: CatalogoCargos,
         configuracao_global: ConfiguracaoGlobal,
         lancamento_mensal: LancamentoMensalFuncionario
-    ) -> dict:
+    ) -> Dict[str, int]:
         """
-        Gera uma ficha de cálculo completa de proventos e encargos para um funcionário.
+        Ficha de cálculo em centavos inteiros, com as mesmas chaves de calcular_detalhamento_custo_total.
+        Cada evento é arredondado uma única vez para o centavo (meio para cima, ver core.dinheiro) e os
+        totais são somas exatas dos eventos. O objeto Funcionario não é alterado.
         """
         results = {}
+        salario_base = dinheiro.para_centavos(cargos.obter_salario(funcionario.codigo_funcao))
+        results["SALARIO_BASE"] = salario_base
 
         # 1. Proventos
-        salario_base_funcionario = self.obter_salario_funcionario(funcionario, cargos)
-        results["SALARIO_BASE"] = salario_base_funcionario
-
-        salario_proporcional_calculado = self.calcular_salario_proporcional_servico(
-            funcionario=funcionario, functions=cargos, lancamento_mensal=lancamento_mensal
+        results["EV_DIAS_TRABALHADOS"] = formulas.calcular_salario_proporcional_centavos(
+            salario_base_centavos=salario_base, total_dias_no_mes=30, dias_nao_trabalhados=lancamento_mensal.dias_ferias
         )
-        results["EV_DIAS_TRABALHADOS"] = salario_proporcional_calculado
-
-        adicional_insalubridade = self.calcular_bonus_insalubridade(
-            lancamento_mensal=lancamento_mensal, configuracao_global=configuracao_global
+        results["EV_ADIC_INSALUBRIDADE"] = formulas.calcular_bonus_percentual_centavos(
+            dinheiro.para_centavos(configuracao_global.salario_minimo), configuracao_global.percentual_insalubridade
+        ) if lancamento_mensal.recebe_insalubridade else 0
+        results["EV_ADIC_PERICULOSIDADE"] = formulas.calcular_adicional_periculosidade_centavos(
+            results["EV_DIAS_TRABALHADOS"], configuracao_global.percentual_periculosidade
+        ) if lancamento_mensal.recebe_periculosidade else 0
+        results["EV_ADIC_NOTURNO"] = formulas.calcular_adicional_noturno_centavos(
+            salario_base + results["EV_ADIC_INSALUBRIDADE"] + results["EV_ADIC_PERICULOSIDADE"],
+            configuracao_global.horas_jornada_padrao_mensal,
+            configuracao_global.percentual_adicional_noturno,
+            lancamento_mensal.quantidade_horas_adicional_noturno
         )
-        results["EV_ADIC_INSALUBRIDADE"] = adicional_insalubridade
-
-        results["TOTAL_PROVENTOS"] = formulas.calcular_total_proventos(
-            salario_base_ou_proporcional=salario_proporcional_calculado,
-            adicional_insalubridade=adicional_insalubridade
+        results["EV_GRATIFICACAO"] = formulas.calcular_gratificacao_centavos(
+            dinheiro.para_centavos(funcionario.valor_base_gratificacao_mensal),
+            lancamento_mensal.horas_trabalhadas_no_mes,
+            configuracao_global.horas_jornada_padrao_mensal
+        )
+        results["EV_HORA_S_AVISO"] = formulas.calcular_hora_s_aviso_centavos(
+            salario_base, configuracao_global.horas_jornada_padrao_mensal, lancamento_mensal.quantidade_horas_s_aviso
+        )
+        results["TOTAL_PROVENTOS"] = (
+            results["EV_DIAS_TRABALHADOS"] +
+            results["EV_ADIC_INSALUBRIDADE"] +
+            results["EV_ADIC_PERICULOSIDADE"] +
+            results["EV_ADIC_NOTURNO"] +
+            results["EV_GRATIFICACAO"] +
+            results["EV_HORA_S_AVISO"]
         )
 
-        # 2. Encargos e Provisões (Usando fórmulas puras e premissas de configuracao_global)
-        # REMOVIDOS OS VALORES HARDCODED, AGORA USA configuracao_global
-        results["ENCARGO_FGTS"] = formulas.calcular_valor_fgts(salario_base_funcionario, configuracao_global.aliquota_fgts_patronal)
-        results["ENCARGO_INSS_EMPRESA"] = formulas.calcular_inss_patronal(salario_base_funcionario, configuracao_global.aliquota_inss_patronal_media)
-        results["PROVISAO_FERIAS"] = formulas.calcular_provisao_ferias(salario_base_funcionario, configuracao_global.percentual_terco_ferias, configuracao_global.meses_do_ano)
-        results["PROVISAO_13_SALARIO"] = formulas.calcular_provisao_decimo_terceiro_salario(salario_base_funcionario, configuracao_global.meses_do_ano)
-
-        total_encargos_e_provisoes = (
+        # 2. Encargos e Provisões
+        results["ENCARGO_FGTS"] = formulas.calcular_valor_fgts_centavos(salario_base, configuracao_global.aliquota_fgts_patronal)
+        results["ENCARGO_INSS_EMPRESA"] = formulas.calcular_inss_patronal_centavos(salario_base, configuracao_global.aliquota_inss_patronal_media)
+        results["PROVISAO_FERIAS"] = formulas.calcular_provisao_ferias_centavos(salario_base, configuracao_global.percentual_terco_ferias, configuracao_global.meses_do_ano)
+        results["PROVISAO_13_SALARIO"] = formulas.calcular_provisao_decimo_terceiro_salario_centavos(salario_base, configuracao_global.meses_do_ano)
+        results["TOTAL_ENCARGOS_E_PROVISOES"] = (
             results["ENCARGO_FGTS"] +
             results["ENCARGO_INSS_EMPRESA"] +
             results["PROVISAO_FERIAS"] +
             results["PROVISAO_13_SALARIO"]
         )
-        results["TOTAL_ENCARGOS_E_PROVISOES"] = total_encargos_e_provisoes
-
-        # 3. Benefícios (Agora acessando diretamente do objeto Funcionario)
-        total_beneficios_calculados = formulas.somar_beneficios(
-            valor_vale_transporte_mensal=funcionario.valor_vale_transporte_mensal,
-            valor_vale_refeicao_mensal=funcionario.valor_vale_refeicao_mensal,
-            plano_saude_mensal=funcionario.plano_saude_mensal,
-            outros_beneficios_mensais=funcionario.outros_beneficios_mensais
+
+        # 3. Benefícios
+        results["TOTAL_BENEFICIOS"] = (
+            dinheiro.para_centavos(funcionario.valor_vale_transporte_mensal) +
+            dinheiro.para_centavos(funcionario.valor_vale_refeicao_mensal) +
+            dinheiro.para_centavos(funcionario.plano_saude_mensal) +
+            dinheiro.para_centavos(funcionario.outros_beneficios_mensais)
         )
-        results["TOTAL_BENEFICIOS"] = total_beneficios_calculados
 
         # 4. Custo Total Final do Empregado
-        results["TOTAL_CUSTO_FINAL_DO_EMPREGADO"] = formulas.calcular_custo_total_funcionario(
-            salario_base=salario_base_funcionario,
-            total_beneficios=results["TOTAL_BENEFICIOS"],
-            total_encargos_e_provisoes=results["TOTAL_ENCARGOS_E_PROVISOES"]
-        )
+        results["TOTAL_CUSTO_FINAL_DO_EMPREGADO"] = salario_base + results["TOTAL_BENEFICIOS"] + results["TOTAL_ENCARGOS_E_PROVISOES"]
+        return results
 
-        # ATUALIZA O ATRIBUTO custo_total_mensal DO OBJETO FUNCIONARIO
-        funcionario.custo_total_mensal = results["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+    def calcular_detalhamento_custo_total_lote(
+        self,
+        funcionarios: list[Funcionario],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Gera a ficha de cálculo de todos os funcionários de uma vez (arrays NumPy, um valor por funcionário,
+        na ordem da lista). Os valores são os mesmos de calcular_detalhamento_custo_total, mas os objetos
+        Funcionario não são alterados (custo_total_mensal não é atualizado).
+        """
+        colunas = payroll_batch.montar_colunas_funcionarios(funcionarios, cargos, lancamento_mensal)
+        return payroll_batch.calcular_detalhamento_lote(colunas, configuracao_global)
 
-        return results
-    
-    
+    def calcular_detalhamento_custo_total_lote_preguicoso(
+        self,
+        funcionarios: Union[Sequence[payroll_batch.RegistroQuadro], TabelaFuncionarios],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]],
+        em_centavos: bool = False
+    ) -> payroll_batch.DetalhamentoLote:
+        """
+        Como calcular_detalhamento_custo_total_lote, mas cada campo da ficha só é calculado quando lido
+        pela primeira vez (e guardado). Quem só lê o custo final não paga pelos eventos de proventos.
+        """
+        colunas = payroll_batch.montar_colunas_funcionarios(funcionarios, cargos, lancamento_mensal)
+        return payroll_batch.DetalhamentoLote(colunas, configuracao_global, em_centavos)
+
+    def calcular_detalhamento_custo_total_preguicoso(
+        self,
+        funcionario: Funcionario,
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: LancamentoMensalFuncionario
+    ) -> payroll_batch.FichaPreguicosa:
+        """
+        Ficha de um funcionário (os mesmos valores de calcular_detalhamento_custo_total) calculada campo a
+        campo, no acesso. O objeto Funcionario não é alterado.
+        """
+        return self.calcular_detalhamento_custo_total_lote_preguicoso(
+            [funcionario], cargos, configuracao_global, lancamento_mensal
+        ).ficha(0)
+
+    def calcular_custos_totais_lote(
+        self,
+        registros: Union[Sequence[payroll_batch.RegistroQuadro], TabelaFuncionarios],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]],
+        em_centavos: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Caminho rápido para quem só precisa do TOTAL_CUSTO_FINAL_DO_EMPREGADO (QPA, totais da simulação):
+        só as colunas e os eventos de que o custo final depende são montados e calculados.
+        Retorna o custo por pessoa de cada registro (na ordem da lista) e quantas pessoas cada registro representa.
+        """
+        plano = payroll_batch.GRAFO_EVENTOS_FOLHA.compilar(CAMPO_CUSTO_FINAL)
+        colunas = payroll_batch.montar_colunas_funcionarios(registros, cargos, lancamento_mensal, plano.entradas)
+        custos = plano.executar(colunas, configuracao_global, em_centavos)["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+        return custos, colunas["quantidade"]
+
+    def calcular_custo_total_ponderado_lote(
+        self,
+        registros: Sequence[payroll_batch.RegistroQuadro],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Calcula o custo de funcionários e coortes de contratação em um único lote. Cada coorte é calculada
+        uma vez, como uma pessoa, e multiplicada pela sua quantidade no total.
+        Retorna o custo por pessoa de cada registro (na ordem da lista) e o custo total ponderado, somado
+        em centavos e convertido para reais só no fim.
+        """
+        custos, total = self.calcular_custo_total_ponderado_lote_centavos(registros, cargos, configuracao_global, lancamento_mensal)
+        return dinheiro.para_reais(custos), dinheiro.para_reais(total)
 
+    def calcular_detalhamento_custo_total_lote_centavos(
+        self,
+        funcionarios: list[Funcionario],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+    ) -> Dict[str, np.ndarray]:
+        """Versão em lote de calcular_detalhamento_custo_total_centavos (arrays int64, um valor por funcionário)."""
+        colunas = payroll_batch.montar_colunas_funcionarios(funcionarios, cargos, lancamento_mensal)
+        return payroll_batch.calcular_detalhamento_lote_centavos(colunas, configuracao_global)
+
+    def calcular_custo_total_ponderado_lote_centavos(
+        self,
+        registros: Sequence[payroll_batch.RegistroQuadro],
+        cargos: Cargos,
+        configuracao_global: ConfiguracaoGlobal,
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Como calcular_custo_total_ponderado_lote, em centavos inteiros: o total é exato e não depende
+        da ordem (nem da divisão em blocos) em que os registros são somados.
+        """
+        custos, quantidade = self.calcular_custos_totais_lote(registros, cargos, configuracao_global, lancamento_mensal, em_centavos=True)
+        return custos, int((custos * quantidade).sum())
+
+    def calcular_custos_totais_nas_datas(
+        self,
+        registros: Union[Sequence[payroll_batch.RegistroQuadro], TabelaFuncionarios],
+        cargos: Cargos,
+        historico_cadastral: HistoricoCadastral,
+        datas: Sequence[date],
+        configuracoes: Sequence[ConfiguracaoGlobal],
+        lancamento_mensal: Union[LancamentoMensalFuncionario, Sequence[LancamentoMensalFuncionario]]
+    ) -> np.ndarray:
+        """
+        Custo total ponderado (em centavos) do mesmo quadro em cada data, com o salário e os benefícios
+        vigentes nela (orçamentos retroativos ou futuros); 'configuracoes' traz a ConfiguracaoGlobal de cada data.
+        As colunas do quadro são montadas uma única vez: a cada data só as colunas com vigência são trocadas.
+        """
+        if len(datas) != len(configuracoes):
+            raise ValueError("A lista de configurações deve ter o mesmo tamanho da lista de datas.")
+        plano = payroll_batch.GRAFO_EVENTOS_FOLHA.compilar(CAMPO_CUSTO_FINAL)
+        colunas = payroll_batch.montar_colunas_funcionarios(registros, cargos, lancamento_mensal, plano.entradas)
+        totais = np.zeros(len(datas), dtype=np.int64)
+        for posicao, (data_referencia, configuracao_global) in enumerate(zip(datas, configuracoes)):
+            colunas_na_data = historico_cadastral.colunas_na_data(registros, colunas, data_referencia)
+            custos = plano.executar(colunas_na_data, configuracao_global, em_centavos=True)["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+            totais[posicao] = int((custos * colunas["quantidade"]).sum())
+        return totais
 
     def calcular_gratificacao(self, funcionario: Funcionario, configuracao_global: ConfiguracaoGlobal, lancamento_mensal: LancamentoMensalFuncionario) -> float:
         """
@@ -147,7 +336,7 @@ class ServicoFolhaPagamento:
 
         return formulas.calcular_gratificacao(valor_base_gratificacao_mensal=valor_base, horas_trabalhadas_no_mes=horas_trabalhadas, jornada_padrao_mensal_horas=jornada_padrao)
     
-    def calcular_hora_s_aviso(self, funcionario: Funcionario, cargos: list[Cargo], configuracao_global: ConfiguracaoGlobal, lancamento_mensal: LancamentoMensalFuncionario) -> float:
+    def calcular_hora_s_aviso(self, funcionario: Funcionario, cargos: CatalogoCargos, configuracao_global: ConfiguracaoGlobal, lancamento_mensal: LancamentoMensalFuncionario) -> float:
         """
         Calcula o valor do evento 'Hora S. Aviso'.
         """
@@ -164,7 +353,7 @@ class ServicoFolhaPagamento:
         percentual = configuracao_global.percentual_periculosidade 
         return formulas.calcular_adicional_periculosidade_formula(valor_dias_trabalhados=valor_dias_trabalhados, percentual_periculosidade=percentual)
 
-    def calcular_adicional_noturno(self, funcionario: Funcionario, cargos: list[Cargo], configuracao_global: ConfiguracaoGlobal, lancamento_mensal: LancamentoMensalFuncionario, valor_adicional_insalubridade: float, valor_adicional_periculosidade: float) -> float:
+    def calcular_adicional_noturno(self, funcionario: Funcionario, cargos: CatalogoCargos, configuracao_global: ConfiguracaoGlobal, lancamento_mensal: LancamentoMensalFuncionario, valor_adicional_insalubridade: float, valor_adicional_periculosidade: float) -> float:
         """
         Calcula o adicional noturno, com base no salário, insalubridade e periculosidade.
         """
@@ -2,29 +2,41 @@
 
 import csv
 from collections import defaultdict
-from typing import List, Dict, Any
-from core.entities import Funcionario # Importa o modelo Employee (supondo que está em core/entities.py)
+from typing import Iterable, List, Dict, Any, Tuple, Union
+from core.tabela_funcionarios import TabelaFuncionarios
+from core.entities import Funcionario, CoorteContratacao # Importa o modelo Employee (supondo que está em core/entities.py)
 
-class GeradorQPA:
+class AcumuladorQPA:
     """
-    Classe responsável por gerar resumos do Quadro de Pessoal Autorizado (QPA).
-    Agrupa funcionários por empresa, equipe e função, e pode exportar para CSV.
+    Contagem do QPA por (empresa, equipe, funcao) alimentada aos poucos, bloco a bloco.
+    Guarda só os totais por grupo, então a memória depende da quantidade de grupos, não de funcionários.
     """
-    def generate_qpa_summary(self, employees: List[Funcionario]) -> List[Dict[str, Any]]:
+    def __init__(self):
+        self._quantidades: Dict[Tuple[str, str, str], int] = defaultdict(int)
+
+    def adicionar(self, employees: Iterable[Union[Funcionario, CoorteContratacao]]):
         """
-        Gera um resumo QPA a partir de uma lista de objetos Employee,
-        agrupando por empresa, equipe e função.
+        Soma os registros ao resumo. Coortes de contratação simulada contam a sua quantidade.
+        Uma TabelaFuncionarios é contada direto pelas colunas codificadas, sem percorrer as linhas.
         """
-        qpa_summary = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-
+        if isinstance(employees, TabelaFuncionarios):
+            for grupo, quantidade in employees.contar_por_grupo().items():
+                self._quantidades[grupo] += quantidade
+            return
         for emp in employees:
-            # Atenção: Aqui usamos emp.empresa, emp.equipe, emp.funcao.
-            # Certifique-se de que seu objeto Employee (core/entities.py)
-            # tenha esses atributos preenchidos.
-            # No nosso main.py, esses campos são adicionados ao Employee ao carregar do JSON.
-            # certifique-se de que são minúsculas se você converte as chaves do JSON para minúsculas.
-            qpa_summary[emp.empresa][emp.equipe][emp.funcao] += 1
-        
+            self._quantidades[(emp.empresa, emp.equipe, emp.funcao)] += getattr(emp, "quantidade", 1)
+
+    def mesclar(self, outro: "AcumuladorQPA"):
+        """Soma as contagens de outro acumulador (ex.: o de um bloco calculado em outro processo)."""
+        for grupo, quantidade in outro._quantidades.items():
+            self._quantidades[grupo] += quantidade
+
+    def gerar_resumo(self) -> List[Dict[str, Any]]:
+        """Resumo no formato de GeradorQPA.generate_qpa_summary, agrupado por empresa e equipe."""
+        qpa_summary = defaultdict(lambda: defaultdict(dict))
+        for (empresa, equipe, funcao), quantidade in self._quantidades.items():
+            qpa_summary[empresa][equipe][funcao] = quantidade
+
         output_data = []
         for empresa, equipes in qpa_summary.items():
             for equipe, funcoes in equipes.items():
@@ -37,6 +49,23 @@ class GeradorQPA:
                     })
         return output_data
 
+
+class GeradorQPA:
+    """
+    Classe responsável por gerar resumos do Quadro de Pessoal Autorizado (QPA).
+    Agrupa funcionários por empresa, equipe e função, e pode exportar para CSV.
+    """
+    def generate_qpa_summary(self, employees: Iterable[Union[Funcionario, CoorteContratacao]]) -> List[Dict[str, Any]]:
+        """
+        Gera um resumo QPA a partir de uma lista de objetos Employee,
+        agrupando por empresa, equipe e função.
+        Coortes de contratação simulada entram uma única vez, contando a sua quantidade.
+        Aceita qualquer iterável (inclusive geradores): os registros não são guardados.
+        """
+        acumulador = AcumuladorQPA()
+        acumulador.adicionar(employees)
+        return acumulador.gerar_resumo()
+
     def export_qpa_to_csv(self, qpa_data: List[Dict[str, Any]], file_path: str):
         """Exporta os dados QPA resumidos para um arquivo CSV."""
         if not qpa_data:
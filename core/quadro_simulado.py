@@ -0,0 +1,341 @@
+# core/quadro_simulado.py
+
+from bisect import bisect_right
+from dataclasses import replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from core.entities import Funcionario, CoorteContratacao
+from core.tabela_funcionarios import LinhaFuncionario
+
+# (empresa, equipe, codigo_funcao): o grupo usado pelas ações de QPA
+ChaveGrupo = Tuple[str, str, str]
+ATRIBUTOS_DO_GRUPO = ("empresa", "equipe", "codigo_funcao")
+
+
+def chave_do_grupo(funcionario: Union[Funcionario, CoorteContratacao]) -> ChaveGrupo:
+    return (funcionario.empresa, funcionario.equipe, funcionario.codigo_funcao)
+
+
+class _ChapasDoGrupo:
+    """
+    Chapas de um grupo: um conjunto com os integrantes e uma lista ordenada montada só na leitura.
+    Entradas e saídas são O(1): chapas novas maiores que todas (as do alocador) vão para o fim da lista,
+    a saída da maior chapa sai do fim, e as demais saídas ficam marcadas como removidas até a lista
+    ser remontada (quando as marcadas passam da metade, ou quando uma entrada fora de ordem a invalida).
+    """
+    __slots__ = ("_membros", "_ordenadas", "_removidas", "_lista_valida")
+
+    def __init__(self):
+        self._membros: Set[str] = set()
+        self._ordenadas: List[str] = []
+        self._removidas: Set[str] = set()
+        self._lista_valida = True
+
+    def adicionar(self, chapa: str):
+        if chapa in self._membros:
+            return
+        self._membros.add(chapa)
+        if not self._lista_valida:
+            return
+        if chapa in self._removidas:
+            self._removidas.discard(chapa)  # ainda está na lista, na posição certa
+        elif not self._ordenadas or self._ordenadas[-1] < chapa:
+            self._ordenadas.append(chapa)
+        else:
+            self._lista_valida = False
+
+    def remover(self, chapa: str):
+        if chapa not in self._membros:
+            return
+        self._membros.discard(chapa)
+        if not self._lista_valida:
+            return
+        if self._ordenadas[-1] == chapa:
+            self._ordenadas.pop()
+            while self._ordenadas and self._ordenadas[-1] in self._removidas:
+                self._removidas.discard(self._ordenadas.pop())
+        else:
+            self._removidas.add(chapa)
+            if len(self._removidas) * 2 > len(self._ordenadas):
+                self._lista_valida = False
+
+    def maiores(self, quantidade: int) -> List[str]:
+        """Até 'quantidade' chapas, da maior para a menor."""
+        if not self._lista_valida:
+            self._ordenadas = sorted(self._membros)
+            self._removidas.clear()
+            self._lista_valida = True
+        maiores = []
+        for chapa in reversed(self._ordenadas):
+            if len(maiores) >= quantidade:
+                break
+            if chapa not in self._removidas:
+                maiores.append(chapa)
+        return maiores
+
+    def __len__(self) -> int:
+        return len(self._membros)
+
+
+class QuadroSimulado:
+    """
+    Quadro de pessoal de um cenário, como uma camada sobre o quadro base.
+    Os objetos Funcionario do quadro base são compartilhados e tratados como somente leitura:
+    contratações, reduções e sobrescritas de atributos ficam registradas como deltas, sem cópias.
+    Os custos calculados ficam em 'custos' (por chapa), e não em funcionario.custo_total_mensal.
+    O quadro base também pode ser uma TabelaFuncionarios (as linhas entram como LinhaFuncionario).
+
+    Para as ações de QPA o quadro mantém, sob demanda, um índice por grupo (empresa, equipe, codigo_funcao)
+    com as chapas do grupo (ordenadas só na leitura), e um alocador crescente de chapas para as contratações simuladas.
+
+    Contratações simuladas em bloco ficam como coortes (CoorteContratacao): um registro por ação, com a
+    quantidade de pessoas. Iterar o quadro percorre só os funcionários individuais; registros() inclui
+    as coortes, e len() conta pessoas. O custo de uma coorte fica em 'custos_coortes', por pessoa.
+    """
+    def __init__(self, funcionarios_base: Iterable[Funcionario]):
+        self._base: Dict[str, Funcionario] = {f.chapa: f for f in funcionarios_base}
+        self._contratados: Dict[str, Funcionario] = {}
+        self._removidos: Set[str] = set()
+        self._sobrescritas: Dict[str, Dict[str, Any]] = {}
+        self._materializados: Dict[str, Funcionario] = {}
+        self.custos: Dict[str, float] = {}
+        self._coortes: Dict[str, CoorteContratacao] = {}
+        self._coortes_por_grupo: Dict[ChaveGrupo, List[str]] = {}
+        # Primeira chapa de cada coorte, em ordem: as faixas não se sobrepõem, então a coorte que pode
+        # conter uma chapa é a de maior início até ela (bisect)
+        self._inicios_coortes: List[int] = []
+        self._quantidade_em_coortes = 0
+        self.custos_coortes: Dict[str, float] = {}
+        # Montados só quando alguma ação de QPA precisar deles
+        self._indice_grupos: Optional[Dict[ChaveGrupo, _ChapasDoGrupo]] = None
+        self._proxima_chapa: Optional[int] = None
+
+    def ramificar(self) -> "QuadroSimulado":
+        """
+        Cria um novo quadro que parte do estado atual deste. Só os deltas são copiados;
+        o quadro base continua compartilhado. Útil para guardar o retrato de cada mês.
+        """
+        novo = QuadroSimulado.__new__(QuadroSimulado)
+        novo._base = self._base
+        novo._contratados = dict(self._contratados)
+        novo._removidos = set(self._removidos)
+        novo._sobrescritas = {chapa: dict(atributos) for chapa, atributos in self._sobrescritas.items()}
+        novo._materializados = dict(self._materializados)
+        novo.custos = {}
+        novo._coortes = dict(self._coortes)
+        novo._coortes_por_grupo = {grupo: list(identificadores) for grupo, identificadores in self._coortes_por_grupo.items()}
+        novo._inicios_coortes = list(self._inicios_coortes)
+        novo._quantidade_em_coortes = self._quantidade_em_coortes
+        novo.custos_coortes = {}
+        novo._indice_grupos = None
+        novo._proxima_chapa = self._proxima_chapa
+        return novo
+
+    def contratar(self, funcionario: Funcionario):
+        """Registra uma contratação simulada."""
+        if funcionario.chapa in self:
+            raise ValueError(f"Chapa '{funcionario.chapa}' já existe no quadro simulado.")
+        self._contratados[funcionario.chapa] = funcionario
+        self._indexar_no_grupo(funcionario)
+        if self._proxima_chapa is not None and funcionario.chapa.isdigit():
+            self._proxima_chapa = max(self._proxima_chapa, int(funcionario.chapa) + 1)
+
+    def remover(self, chapa: str) -> Funcionario:
+        """Registra a saída de um funcionário e retorna o funcionário removido."""
+        funcionario = self.obter(chapa)
+        if funcionario is None:
+            raise KeyError(chapa)
+        self._desindexar_do_grupo(funcionario)
+        if chapa in self._contratados:
+            del self._contratados[chapa]
+        else:
+            self._removidos.add(chapa)
+            self._sobrescritas.pop(chapa, None)
+            self._materializados.pop(chapa, None)
+        self.custos.pop(chapa, None)
+        return funcionario
+
+    def sobrescrever(self, chapa: str, **atributos: Any):
+        """Altera atributos de um funcionário apenas neste cenário (o objeto base não é tocado)."""
+        if chapa not in self:
+            raise KeyError(chapa)
+        muda_grupo = any(atributo in ATRIBUTOS_DO_GRUPO for atributo in atributos)
+        if muda_grupo:
+            self._desindexar_do_grupo(self.obter(chapa))
+        if chapa in self._contratados:
+            self._contratados[chapa] = replace(self._contratados[chapa], **atributos)
+        else:
+            self._sobrescritas.setdefault(chapa, {}).update(atributos)
+            self._materializados.pop(chapa, None)
+        if muda_grupo:
+            self._indexar_no_grupo(self.obter(chapa))
+
+    def obter(self, chapa: str) -> Optional[Funcionario]:
+        """Retorna o funcionário como ele está neste cenário, ou None se não estiver no quadro."""
+        if chapa in self._contratados:
+            return self._contratados[chapa]
+        if chapa in self._removidos:
+            return None
+        funcionario = self._base.get(chapa)
+        if funcionario is None or chapa not in self._sobrescritas:
+            return funcionario
+        materializado = self._materializados.get(chapa)
+        if materializado is None:
+            if isinstance(funcionario, LinhaFuncionario):
+                funcionario = funcionario.materializar()
+            materializado = replace(funcionario, **self._sobrescritas[chapa])
+            self._materializados[chapa] = materializado
+        return materializado
+
+    def _chapas_individuais(self) -> Iterator[str]:
+        for chapa in self._base:
+            if chapa not in self._removidos:
+                yield chapa
+        yield from self._contratados
+
+    def chapas(self) -> Iterator[str]:
+        """
+        Chapas do quadro: primeiro as do quadro base, depois as contratações, na ordem de entrada,
+        e por fim as faixas de chapas das coortes.
+        """
+        yield from self._chapas_individuais()
+        for coorte in self._coortes.values():
+            yield from coorte.chapas
+
+    def __iter__(self) -> Iterator[Funcionario]:
+        for chapa in self._chapas_individuais():
+            yield self.obter(chapa)
+
+    def registros(self) -> Iterator[Union[Funcionario, CoorteContratacao]]:
+        """Funcionários individuais seguidos das coortes de contratação (cada coorte uma única vez)."""
+        yield from self
+        yield from self._coortes.values()
+
+    def __contains__(self, chapa: object) -> bool:
+        if chapa in self._contratados or (chapa in self._base and chapa not in self._removidos):
+            return True
+        if not isinstance(chapa, str) or not chapa.isdigit():
+            return False
+        coorte = self._coorte_da_chapa(int(chapa))
+        return coorte is not None and coorte.contem_chapa(chapa)
+
+    def __len__(self) -> int:
+        """Quantidade de pessoas no quadro, contando cada integrante das coortes."""
+        return len(self._base) - len(self._removidos) + len(self._contratados) + self._quantidade_em_coortes
+
+    def custo_total(self) -> float:
+        """Soma dos custos registrados para o quadro (coortes: custo por pessoa vezes a quantidade)."""
+        custo_coortes = sum(
+            self.custos_coortes.get(identificador, 0.0) * coorte.quantidade
+            for identificador, coorte in self._coortes.items()
+        )
+        return sum(self.custos.values()) + custo_coortes
+
+    # --- Coortes de contratação ---
+
+    def contratar_coorte(self, coorte: CoorteContratacao):
+        """Registra uma coorte de contratações simuladas. As chapas devem vir de alocar_faixa_de_chapas."""
+        if coorte.identificador in self._coortes or coorte.identificador in self:
+            raise ValueError(f"Chapa '{coorte.identificador}' já existe no quadro simulado.")
+        fim = coorte.primeira_chapa + coorte.quantidade
+        posicao = bisect_right(self._inicios_coortes, coorte.primeira_chapa)
+        if posicao < len(self._inicios_coortes) and self._inicios_coortes[posicao] < fim:
+            raise ValueError(f"As chapas da coorte '{coorte.identificador}' se sobrepõem às de outra coorte.")
+        self._coortes[coorte.identificador] = coorte
+        self._inicios_coortes.insert(posicao, coorte.primeira_chapa)  # no fim, no caso usual (faixa nova do alocador)
+        self._coortes_por_grupo.setdefault(chave_do_grupo(coorte), []).append(coorte.identificador)
+        self._quantidade_em_coortes += coorte.quantidade
+        if self._proxima_chapa is not None:
+            self._proxima_chapa = max(self._proxima_chapa, coorte.primeira_chapa + coorte.quantidade)
+
+    def obter_coorte(self, identificador: str) -> Optional[CoorteContratacao]:
+        return self._coortes.get(identificador)
+
+    def _coorte_da_chapa(self, numero: int) -> Optional[CoorteContratacao]:
+        """A coorte de maior primeira chapa até o número (a única que pode contê-lo), ou None."""
+        posicao = bisect_right(self._inicios_coortes, numero) - 1
+        if posicao < 0:
+            return None
+        return self._coortes[str(self._inicios_coortes[posicao]).zfill(5)]
+
+    def coortes(self) -> Iterator[CoorteContratacao]:
+        yield from self._coortes.values()
+
+    def coortes_do_grupo(self, empresa: str, equipe: str, codigo_funcao: str) -> List[CoorteContratacao]:
+        """Coortes do grupo, da mais recente (maiores chapas) para a mais antiga."""
+        identificadores = self._coortes_por_grupo.get((empresa, equipe, codigo_funcao), [])
+        return [self._coortes[identificador] for identificador in reversed(identificadores)]
+
+    def reduzir_coorte(self, identificador: str, quantidade: int) -> Optional[CoorteContratacao]:
+        """
+        Retira 'quantidade' pessoas da coorte (as maiores chapas da faixa) e retorna a coorte restante,
+        ou None se ela ficar vazia (nesse caso ela sai do quadro, junto com seu custo).
+        """
+        coorte = self._coortes.get(identificador)
+        if coorte is None:
+            raise KeyError(identificador)
+        if quantidade <= 0 or quantidade > coorte.quantidade:
+            raise ValueError(f"Não é possível reduzir {quantidade} de uma coorte com {coorte.quantidade} pessoas.")
+        self._quantidade_em_coortes -= quantidade
+        if quantidade == coorte.quantidade:
+            del self._coortes[identificador]
+            self._coortes_por_grupo[chave_do_grupo(coorte)].remove(identificador)
+            del self._inicios_coortes[bisect_right(self._inicios_coortes, coorte.primeira_chapa) - 1]
+            self.custos_coortes.pop(identificador, None)
+            return None
+        restante = replace(coorte, quantidade=coorte.quantidade - quantidade)
+        self._coortes[identificador] = restante
+        return restante
+
+    # --- Índice por grupo e alocação de chapas (ações de QPA) ---
+
+    def _garantir_indice_grupos(self) -> Dict[ChaveGrupo, _ChapasDoGrupo]:
+        if self._indice_grupos is None:
+            indice: Dict[ChaveGrupo, _ChapasDoGrupo] = {}
+            for funcionario in self:
+                indice.setdefault(chave_do_grupo(funcionario), _ChapasDoGrupo()).adicionar(funcionario.chapa)
+            self._indice_grupos = indice
+        return self._indice_grupos
+
+    def _indexar_no_grupo(self, funcionario: Funcionario):
+        if self._indice_grupos is not None:
+            self._indice_grupos.setdefault(chave_do_grupo(funcionario), _ChapasDoGrupo()).adicionar(funcionario.chapa)
+
+    def _desindexar_do_grupo(self, funcionario: Funcionario):
+        if self._indice_grupos is None:
+            return
+        chapas = self._indice_grupos.get(chave_do_grupo(funcionario))
+        if chapas is not None:
+            chapas.remover(funcionario.chapa)
+
+    def quantidade_no_grupo(self, empresa: str, equipe: str, codigo_funcao: str) -> int:
+        """Quantidade de pessoas do grupo no quadro, somando funcionários individuais e coortes."""
+        chapas = self._garantir_indice_grupos().get((empresa, equipe, codigo_funcao))
+        individuais = len(chapas) if chapas is not None else 0
+        return individuais + sum(coorte.quantidade for coorte in self.coortes_do_grupo(empresa, equipe, codigo_funcao))
+
+    def maiores_chapas_do_grupo(self, empresa: str, equipe: str, codigo_funcao: str, quantidade: int) -> List[str]:
+        """
+        Retorna até 'quantidade' chapas de funcionários individuais do grupo, da maior para a menor
+        (mais recentes ou simuladas primeiro). As coortes ficam de fora; veja coortes_do_grupo.
+        """
+        chapas = self._garantir_indice_grupos().get((empresa, equipe, codigo_funcao))
+        if chapas is None or quantidade <= 0:
+            return []
+        return chapas.maiores(quantidade)
+
+    def alocar_faixa_de_chapas(self, quantidade: int) -> range:
+        """
+        Reserva 'quantidade' chapas consecutivas (como inteiros) para contratações simuladas. O alocador parte
+        da maior chapa numérica do quadro e só cresce, então chapas liberadas por reduções não são reaproveitadas.
+        """
+        if self._proxima_chapa is None:
+            maior_individual = max([int(chapa) for chapa in self._chapas_individuais() if chapa.isdigit()], default=0)
+            maior_em_coorte = max([c.primeira_chapa + c.quantidade - 1 for c in self._coortes.values()], default=0)
+            self._proxima_chapa = max(maior_individual, maior_em_coorte) + 1
+        faixa = range(self._proxima_chapa, self._proxima_chapa + quantidade)
+        self._proxima_chapa = faixa.stop
+        return faixa
+
+    def alocar_chapa(self) -> str:
+        """Reserva a próxima chapa para uma contratação simulada individual."""
+        return str(self.alocar_faixa_de_chapas(1).start).zfill(5)
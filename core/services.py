@@ -1,24 +1,210 @@
 # core/services.py (REVISADO)
 
-# Imports necessários para as classes/funções que RESTAM neste arquivo.
-# Se este arquivo contiver o OrcamentoService e FuncionarioService que discutimos antes,
-# eles permanecerão aqui.
-from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from dateutil.relativedelta import relativedelta
+
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, CenarioOrcamento, AcaoQuadroPessoal, OrcamentoMensal, CoorteContratacao
 from core.payroll_rules import ServicoFolhaPagamento  # <-- AGORA VOCÊ IMPORTA PayrollService DE ONDE ELE REALMENTE ESTÁ DEFINIDO
-from core import formulas  # Mantenha este import se este arquivo usar funções de formulas diretamente
-from datetime import date
-
-# Se este arquivo não tiver NENHUMA outra classe ou função além do que era a PayrollService duplicada,
-# então este arquivo pode ser removido. PORÉM, vou presumir que ele terá outras coisas mais tarde.
-
-# Exemplo: Se você tiver FuncionarioService e OrcamentoService, eles iriam aqui.
-# class FuncionarioService:
-#     # ... métodos que podem usar PayrollService
-#     pass
-#
-# class OrcamentoService:
-#     # ... métodos que podem usar PayrollService ou FuncionarioService
-#     pass
-
-# Se o seu main.py chama PayrollService diretamente deste arquivo,
-# você precisará ajustar o main.py para importar PayrollService de core.payroll_rules.
\ No newline at end of file
+from core.catalogo_cargos import CatalogoCargos
+from core import dinheiro
+from core.config import LinhaDoTempoConfiguracao
+from core.quadro_simulado import QuadroSimulado
+from core.payroll_paralelo import ExecutorFolhaParalelo
+
+
+@dataclass
+class ResultadoSimulacao:
+    """ Resultado de um cenário: um OrcamentoMensal por mês e o quadro simulado ao fim do período. """
+    nome_cenario: str
+    meses: List[OrcamentoMensal] = field(default_factory=list)
+    quadro_final: Optional[QuadroSimulado] = None
+
+    @property
+    def custo_total_simulado(self) -> float:
+        # Soma em centavos: o custo de cada mês já é um valor exato em centavos
+        return dinheiro.para_reais(sum(dinheiro.para_centavos(orcamento.custo_total_orcamento) for orcamento in self.meses))
+
+    @property
+    def periodo_simulacao(self) -> str:
+        if not self.meses:
+            return ""
+        primeiro, ultimo = self.meses[0], self.meses[-1]
+        return f"{primeiro.ano}-{primeiro.mes:02d} a {ultimo.ano}-{ultimo.mes:02d}"
+
+
+class OrcamentoService:
+    """
+    Motor de simulação de cenários de orçamento (CenarioOrcamento).
+    Avança mês a mês pelo calendário, aplica as ações de QPA de cada mês sobre um QuadroSimulado
+    e calcula o custo do quadro com o motor em lote do ServicoFolhaPagamento.
+    """
+    def __init__(
+        self,
+        servico_folha_pagamento: ServicoFolhaPagamento,
+        linha_do_tempo_configuracao: LinhaDoTempoConfiguracao,
+        catalogo_cargos: CatalogoCargos,
+        lancamento_mensal_padrao: Optional[LancamentoMensalFuncionario] = None,
+        exibir_acoes: bool = True,
+        executor_paralelo: Optional[ExecutorFolhaParalelo] = None
+    ):
+        self.servico_folha_pagamento = servico_folha_pagamento
+        self.linha_do_tempo_configuracao = linha_do_tempo_configuracao
+        self.catalogo_cargos = catalogo_cargos
+        # O lançamento mensal é simplificado. Em cenário real, viria de dados históricos.
+        self.lancamento_mensal_padrao = lancamento_mensal_padrao or LancamentoMensalFuncionario()
+        self.exibir_acoes = exibir_acoes
+        # Se informado, os recálculos do quadro inteiro são divididos em blocos entre vários processos
+        self.executor_paralelo = executor_paralelo
+
+    def simular(self, cenario: CenarioOrcamento, funcionarios_base: Iterable[Funcionario]) -> ResultadoSimulacao:
+        """
+        Executa o cenário sobre o quadro base e retorna o resultado mês a mês.
+        O horizonte é dividido de antemão nos trechos de ConfiguracaoGlobal constante (segmentos_mensais da
+        linha do tempo), e o quadro inteiro só é recalculado no primeiro mês de cada trecho. Nos demais meses
+        o custo do mês anterior é ajustado apenas com as coortes contratadas e as pessoas reduzidas pelas ações do mês.
+        Contratações viram coortes, então o custo de uma ação não depende da quantidade contratada.
+        Os custos são acumulados em centavos inteiros, sem erro de arredondamento entre um mês e outro.
+        """
+        quadro = QuadroSimulado(funcionarios_base)
+        acoes_por_mes = self._agrupar_acoes_por_mes(cenario)
+        resultado = ResultadoSimulacao(nome_cenario=cenario.nome_cenario, quadro_final=quadro)
+
+        configuracoes_por_inicio = {
+            segmento.deslocamento: segmento.configuracao
+            for segmento in self.linha_do_tempo_configuracao.segmentos_mensais(cenario.ano_inicio, cenario.mes_inicio, cenario.duracao_meses)
+        }
+        configuracao_global = None
+        custo_total_centavos = 0
+        inicio = date(cenario.ano_inicio, cenario.mes_inicio, 1)
+        for deslocamento in range(cenario.duracao_meses):
+            data_mes = inicio + relativedelta(months=deslocamento)
+            ano, mes = data_mes.year, data_mes.month
+
+            coortes_do_mes: List[str] = []
+            custo_reduzido_centavos = 0
+            for acao, data_efetivacao in acoes_por_mes.get((ano, mes), []):
+                if acao.tipo == "ACRESCIMO_QPA":
+                    coorte = self._aplicar_acrescimo(quadro, acao, data_efetivacao, ano, mes)
+                    if coorte is not None:
+                        coortes_do_mes.append(coorte.identificador)
+                elif acao.tipo == "REDUCAO_QPA":
+                    custo_reduzido_centavos += self._aplicar_reducao(quadro, acao, ano, mes)
+
+            if deslocamento in configuracoes_por_inicio:
+                configuracao_global = configuracoes_por_inicio[deslocamento]
+                custo_total_centavos = self._calcular_custos(quadro, list(quadro), list(quadro.coortes()), configuracao_global)
+            else:
+                # Coortes do mês ainda não têm custo registrado; as reduzidas no próprio mês entram com o que sobrou
+                coortes_restantes = [quadro.obter_coorte(i) for i in coortes_do_mes if quadro.obter_coorte(i) is not None]
+                custo_total_centavos += self._calcular_custos(quadro, [], coortes_restantes, configuracao_global) - custo_reduzido_centavos
+
+            resultado.meses.append(OrcamentoMensal(
+                ano=ano, mes=mes,
+                numero_total_funcionarios=len(quadro),
+                custo_total_orcamento=dinheiro.para_reais(custo_total_centavos)
+            ))
+        return resultado
+
+    @staticmethod
+    def _agrupar_acoes_por_mes(cenario: CenarioOrcamento) -> Dict[Tuple[int, int], List[Tuple[AcaoQuadroPessoal, datetime]]]:
+        """Converte a data de efetivação de cada ação uma única vez e agrupa as ações por (ano, mes), na ordem do cenário."""
+        acoes_por_mes = defaultdict(list)
+        for acao in cenario.acoes_quadro_pessoal:
+            data_efetivacao = datetime.strptime(acao.data_efetivacao, "%Y-%m-%d")
+            acoes_por_mes[(data_efetivacao.year, data_efetivacao.month)].append((acao, data_efetivacao))
+        return acoes_por_mes
+
+    def _calcular_custos(
+        self,
+        quadro: QuadroSimulado,
+        funcionarios: List[Funcionario],
+        coortes: List[CoorteContratacao],
+        configuracao_global: ConfiguracaoGlobal
+    ) -> int:
+        """
+        Calcula o custo dos funcionários e coortes informados em um único lote, registra-o no quadro
+        (em reais, por chapa, e por pessoa para as coortes) e retorna o custo total ponderado em centavos.
+        """
+        if not funcionarios and not coortes:
+            return 0
+        calculadora = self.executor_paralelo or self.servico_folha_pagamento
+        custos, custo_total = calculadora.calcular_custo_total_ponderado_lote_centavos(
+            registros=funcionarios + coortes,
+            cargos=self.catalogo_cargos,
+            configuracao_global=configuracao_global,
+            lancamento_mensal=self.lancamento_mensal_padrao
+        )
+        custos = dinheiro.para_reais(custos).tolist()
+        quadro.custos.update(zip((f.chapa for f in funcionarios), custos))
+        quadro.custos_coortes.update(zip((c.identificador for c in coortes), custos[len(funcionarios):]))
+        return custo_total
+
+    def _aplicar_acrescimo(
+        self, quadro: QuadroSimulado, acao: AcaoQuadroPessoal, data_efetivacao: datetime, ano: int, mes: int
+    ) -> Optional[CoorteContratacao]:
+        """
+        Registra as contratações da ação como uma única coorte (uma faixa de chapas do alocador do quadro)
+        e retorna a coorte, ou None se a função não existir.
+        """
+        cargo = self.catalogo_cargos.obter(acao.id_funcao)
+        if not cargo:
+            print(f"Aviso: Função simulada '{acao.id_funcao}' não encontrada. Contratação ignorada.")
+            return None
+
+        faixa_de_chapas = quadro.alocar_faixa_de_chapas(acao.quantidade)
+        coorte = CoorteContratacao(
+            primeira_chapa=faixa_de_chapas.start,
+            quantidade=acao.quantidade,
+            codigo_funcao=acao.id_funcao,
+            funcao=cargo.nome_funcao,
+            empresa=acao.empresa, equipe=acao.equipe,
+            data_admissao=data_efetivacao,
+            valor_vale_transporte_mensal=acao.valor_vale_transporte_simulado or 0.0,
+            valor_vale_refeicao_mensal=acao.valor_vale_refeicao_simulado or 0.0,
+            plano_saude_mensal=acao.plano_saude_simulado or 0.0,
+            outros_beneficios_mensais=acao.outros_beneficios_simulados or 0.0,
+            salario_base_simulado=acao.salario_base_simulado
+        )
+        quadro.contratar_coorte(coorte)
+        if self.exibir_acoes:
+            ultima_chapa = str(faixa_de_chapas.stop - 1).zfill(5)
+            print(f"  [Simulação {ano}/{mes:02d}] ACRESCIDO QPA: {acao.quantidade}x Simulado {cargo.nome_funcao} "
+                  f"(chapas {coorte.identificador} a {ultima_chapa}) ({acao.empresa}/{acao.equipe}/{cargo.nome_funcao})")
+        return coorte
+
+    def _aplicar_reducao(self, quadro: QuadroSimulado, acao: AcaoQuadroPessoal, ano: int, mes: int) -> int:
+        """
+        Remove até 'quantidade' pessoas do grupo da ação, começando pelas maiores chapas: primeiro das coortes
+        de contratação (da mais recente para a mais antiga), depois dos funcionários individuais.
+        Retorna a soma dos custos já registrados das pessoas removidas, em centavos.
+        """
+        custo_reduzido = 0
+        restante = acao.quantidade
+        for coorte in quadro.coortes_do_grupo(acao.empresa, acao.equipe, acao.id_funcao):
+            if restante == 0:
+                break
+            quantidade_na_coorte = min(restante, coorte.quantidade)
+            custo_reduzido += dinheiro.para_centavos(quadro.custos_coortes.get(coorte.identificador, 0.0)) * quantidade_na_coorte
+            quadro.reduzir_coorte(coorte.identificador, quantidade_na_coorte)
+            restante -= quantidade_na_coorte
+            if self.exibir_acoes:
+                print(f"  [Simulação {ano}/{mes:02d}] REDUÇÃO QPA: {quantidade_na_coorte}x Simulado {coorte.funcao} "
+                      f"(coorte {coorte.identificador}) ({acao.empresa}/{acao.equipe}/{acao.id_funcao})")
+
+        for chapa in quadro.maiores_chapas_do_grupo(acao.empresa, acao.equipe, acao.id_funcao, restante):
+            custo_reduzido += dinheiro.para_centavos(quadro.custos.get(chapa, 0.0))
+            removido = quadro.remover(chapa)
+            restante -= 1
+            if self.exibir_acoes:
+                print(f"  [Simulação {ano}/{mes:02d}] REDUÇÃO QPA: {removido.nome} ({acao.empresa}/{acao.equipe}/{acao.id_funcao})")
+
+        quantidade_removida = acao.quantidade - restante
+        if self.exibir_acoes:
+            if quantidade_removida == 0:
+                print(f"  [Simulação {ano}/{mes:02d}] Aviso: Nada a reduzir em {acao.empresa}/{acao.equipe}/{acao.id_funcao}.")
+            else:
+                print(f"  Total de {quantidade_removida} reduzidos em {acao.empresa}/{acao.equipe}/{acao.id_funcao}.")
+        return custo_reduzido
@@ -0,0 +1,171 @@
+# core/tabela_funcionarios.py
+
+"""
+Quadro de funcionários em colunas (struct-of-arrays).
+
+Cada atributo do Funcionario vira uma coluna: valores numéricos em arrays NumPy, datas como
+ordinais (date.toordinal) e os textos repetidos (empresa, equipe, função, seção...) codificados
+por dicionário (um código inteiro por linha e a lista de valores distintos). O motor em lote e o
+QPA trabalham direto sobre as colunas; para o código que espera objetos Funcionario, a tabela
+oferece LinhaFuncionario, uma visão leve de uma linha que lê (e grava) nas colunas, sem cópia.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+
+from core.entities import Funcionario, CAMPOS_CATEGORICOS_FUNCIONARIO, internalizar
+from core.catalogo_cargos import CatalogoCargos
+
+CAMPOS_TEXTO = ("chapa", "nome", "cpf")
+CAMPOS_DATA = ("data_admissao", "data_admissao_pts", "data_nascimento")
+CAMPOS_NUMERICOS = (
+    "valor_vale_transporte_mensal", "valor_vale_refeicao_mensal", "plano_saude_mensal",
+    "outros_beneficios_mensais", "valor_base_gratificacao_mensal", "custo_total_mensal",
+)
+# Mesma ordem dos campos do Funcionario
+CAMPOS_FUNCIONARIO = tuple(Funcionario.__dataclass_fields__)
+
+
+def codificar_categorias(valores: Iterable[str]) -> Tuple[np.ndarray, List[str]]:
+    """Codificação por dicionário: o código de cada valor e a lista de valores distintos (na ordem de aparição)."""
+    posicoes: Dict[str, int] = {}
+    codigos = [posicoes.setdefault(valor, len(posicoes)) for valor in valores]
+    return np.array(codigos, dtype=np.int32), [internalizar(valor) for valor in posicoes]
+
+
+class LinhaFuncionario:
+    """
+    Visão de uma linha da TabelaFuncionarios com os mesmos atributos (e o is_active) do Funcionario.
+    Não copia nada: cada atributo é lido da coluna na hora, e gravar custo_total_mensal (ou qualquer
+    campo numérico) altera a tabela. Use materializar() para obter um Funcionario independente.
+    """
+    __slots__ = ("_tabela", "_indice")
+
+    def __init__(self, tabela: "TabelaFuncionarios", indice: int):
+        self._tabela = tabela
+        self._indice = indice
+
+    def is_active(self) -> bool:
+        return self.situacao == 'A'
+
+    def materializar(self) -> Funcionario:
+        return Funcionario(**{campo: getattr(self, campo) for campo in CAMPOS_FUNCIONARIO})
+
+    def __eq__(self, outro: object) -> bool:
+        if isinstance(outro, (LinhaFuncionario, Funcionario)):
+            return all(getattr(self, campo) == getattr(outro, campo) for campo in CAMPOS_FUNCIONARIO)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LinhaFuncionario(chapa={self.chapa!r}, indice={self._indice})"
+
+
+def _propriedade_texto(campo: str) -> property:
+    return property(lambda linha: linha._tabela.textos[campo][linha._indice])
+
+
+def _propriedade_categorica(campo: str) -> property:
+    def ler(linha: LinhaFuncionario) -> str:
+        codigos, categorias = linha._tabela.categoricas[campo]
+        return categorias[codigos[linha._indice]]
+    return property(ler)
+
+
+def _propriedade_data(campo: str) -> property:
+    return property(lambda linha: datetime.fromordinal(int(linha._tabela.datas[campo][linha._indice])))
+
+
+def _propriedade_numerica(campo: str) -> property:
+    def ler(linha: LinhaFuncionario) -> float:
+        return float(linha._tabela.numericos[campo][linha._indice])
+
+    def gravar(linha: LinhaFuncionario, valor: float):
+        linha._tabela.numericos[campo][linha._indice] = valor
+    return property(ler, gravar)
+
+
+for _campo in CAMPOS_TEXTO:
+    setattr(LinhaFuncionario, _campo, _propriedade_texto(_campo))
+for _campo in CAMPOS_CATEGORICOS_FUNCIONARIO:
+    setattr(LinhaFuncionario, _campo, _propriedade_categorica(_campo))
+for _campo in CAMPOS_DATA:
+    setattr(LinhaFuncionario, _campo, _propriedade_data(_campo))
+for _campo in CAMPOS_NUMERICOS:
+    setattr(LinhaFuncionario, _campo, _propriedade_numerica(_campo))
+
+
+class TabelaFuncionarios:
+    """
+    Quadro de funcionários em colunas. Ocupa uma fração da memória de uma lista de Funcionario
+    (sem um objeto por pessoa), o que permite manter vários anos de quadros carregados.
+    As datas são guardadas como ordinais de dia: a hora de um datetime não é preservada.
+    """
+    def __init__(
+        self,
+        textos: Dict[str, np.ndarray],
+        categoricas: Dict[str, Tuple[np.ndarray, List[str]]],
+        datas: Dict[str, np.ndarray],
+        numericos: Dict[str, np.ndarray]
+    ):
+        self.textos = textos
+        self.categoricas = categoricas
+        self.datas = datas
+        self.numericos = numericos
+        self._quantidade = len(textos["chapa"])
+
+    @classmethod
+    def de_funcionarios(cls, funcionarios: Iterable[Funcionario]) -> "TabelaFuncionarios":
+        """Monta a tabela a partir de objetos Funcionario (ou de qualquer objeto com os mesmos atributos)."""
+        funcionarios = list(funcionarios)
+        quantidade = len(funcionarios)
+        return cls(
+            textos={campo: np.array([getattr(f, campo) for f in funcionarios], dtype=object) for campo in CAMPOS_TEXTO},
+            categoricas={campo: codificar_categorias(getattr(f, campo) for f in funcionarios) for campo in CAMPOS_CATEGORICOS_FUNCIONARIO},
+            datas={
+                campo: np.fromiter((getattr(f, campo).toordinal() for f in funcionarios), dtype=np.int32, count=quantidade)
+                for campo in CAMPOS_DATA
+            },
+            numericos={
+                campo: np.fromiter((getattr(f, campo) for f in funcionarios), dtype=np.float64, count=quantidade)
+                for campo in CAMPOS_NUMERICOS
+            },
+        )
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __getitem__(self, indice: int) -> LinhaFuncionario:
+        if indice < 0:
+            indice += self._quantidade
+        if not 0 <= indice < self._quantidade:
+            raise IndexError(indice)
+        return LinhaFuncionario(self, indice)
+
+    def __iter__(self) -> Iterator[LinhaFuncionario]:
+        for indice in range(self._quantidade):
+            yield LinhaFuncionario(self, indice)
+
+    def coluna_categorica(self, campo: str) -> np.ndarray:
+        """Decodifica uma coluna categórica inteira (array de objetos str)."""
+        codigos, categorias = self.categoricas[campo]
+        return np.array(categorias, dtype=object)[codigos]
+
+    def salarios_base(self, catalogo_cargos: CatalogoCargos) -> np.ndarray:
+        """Salário do cargo de cada linha, consultando o catálogo uma vez por codigo_funcao distinto."""
+        codigos, categorias = self.categoricas["codigo_funcao"]
+        salarios_por_codigo = np.array([catalogo_cargos.obter_salario(codigo) for codigo in categorias], dtype=np.float64)
+        return salarios_por_codigo[codigos]
+
+    def contar_por_grupo(self) -> Dict[Tuple[str, str, str], int]:
+        """Quantidade de funcionários por (empresa, equipe, funcao), na ordem em que cada grupo aparece."""
+        codigos = np.stack([self.categoricas[campo][0] for campo in ("empresa", "equipe", "funcao")], axis=1)
+        grupos, primeira_linha, quantidades = np.unique(codigos, axis=0, return_index=True, return_counts=True)
+        empresas, equipes, funcoes = (self.categoricas[campo][1] for campo in ("empresa", "equipe", "funcao"))
+        contagem = {}
+        for posicao in np.argsort(primeira_linha, kind="stable"):
+            empresa, equipe, funcao = grupos[posicao]
+            contagem[(empresas[empresa], equipes[equipe], funcoes[funcao])] = int(quantidades[posicao])
+        return contagem
@@ -2,7 +2,27 @@
 
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Sequence, Tuple, Union
+
+# Padrões compilados uma única vez: re.match com o padrão em texto consulta o cache interno do re a cada chamada
+PADRAO_CHAPA = re.compile(r'^\d{5}$')
+PADRAO_CODIGO_FUNCAO = re.compile(r'^\d{4}$')
+PADRAO_SECAO = re.compile(r'^\d{2}\.\d{2}\.\d\.\d{2}\.\d{2}\.\d{3}$')
+PADRAO_CENTRO_CUSTO = re.compile(r'^\d{9}$')
+PADRAO_CPF_CARACTERES = re.compile(r'^[0-9.\-]+$')
+PADRAO_NAO_DIGITO = re.compile(r'\D')
+
+CPFS_DIGITOS_REPETIDOS = frozenset(str(i) * 11 for i in range(10))
+FORMATOS_DATA = ('%Y-%m-%d', '%d/%m/%Y')
+SITUACOES_VALIDAS = frozenset({'A', 'F', 'I', 'L', 'P', 'T'})
+JORNADAS_VALIDAS = frozenset({'220', '150', '75'})
+
+# Exportações de RH repetem as mesmas datas (admissão, nascimento) e às vezes os mesmos CPFs milhares
+# de vezes: a conversão de cada texto distinto é feita uma vez e guardada em um cache de tamanho limitado
+TAMANHO_CACHE_VALIDACAO = 4096
+
+Regra = Callable[[Any], Any]
 
 
 class DataValidationError(Exception):
@@ -13,138 +33,182 @@ class DataValidationError(Exception):
     """
     pass
 
+
+@lru_cache(maxsize=TAMANHO_CACHE_VALIDACAO)
+def converter_data(texto: str) -> Optional[datetime]:
+    """Converte o texto (já sem espaços nas pontas) em 'YYYY-MM-DD' ou 'DD/MM/YYYY'; None se não estiver em nenhum dos dois."""
+    for formato in FORMATOS_DATA:
+        try:
+            return datetime.strptime(texto, formato)
+        except ValueError:
+            continue
+    return None
+
+
+def cpf_digitos_validos(cpf: str) -> bool:
+    """Confere os dois dígitos verificadores de um CPF de 11 dígitos."""
+    if len(cpf) != 11:
+        return False
+
+    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
+    primeiro_digito = (soma * 10) % 11
+    if primeiro_digito == 10:
+        primeiro_digito = 0
+
+    if primeiro_digito != int(cpf[9]):
+        return False
+
+    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
+    segundo_digito = (soma * 10) % 11
+    if segundo_digito == 10:
+        segundo_digito = 0
+
+    if segundo_digito != int(cpf[10]):
+        return False
+
+    return True
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_VALIDACAO)
+def conferir_cpf(value: str) -> Tuple[Optional[str], Optional[str]]:
+    """Normaliza e confere um CPF em texto: (CPF só com dígitos, None) ou (None, mensagem de erro)."""
+    value = value.strip()
+
+    if not value:
+        return None, "O CPF deve conter 11 dígitos."
+
+    if not PADRAO_CPF_CARACTERES.match(value):
+        return None, "O CPF deve conter apenas números ou os formatos válidos (XXX.XXX.XXX-XX)."
+
+    cpf = PADRAO_NAO_DIGITO.sub('', value)
+
+    if len(cpf) != 11:
+        return None, "O CPF deve conter 11 dígitos."
+
+    if cpf in CPFS_DIGITOS_REPETIDOS:
+        return None, "O CPF fornecido é inválido."
+
+    if not cpf_digitos_validos(cpf):
+        return None, "Os dígitos verificadores do CPF são inválidos."
+
+    return cpf, None
+
+
+class PlanoValidacao:
+    """
+    Plano de validação compilado: as chaves obrigatórias e a regra de cada campo, montados uma única vez
+    por classe de validador e compartilhados por todas as instâncias.
+    """
+    __slots__ = ("chaves_obrigatorias", "regras")
+
+    def __init__(self, chaves_obrigatorias: Sequence[str], regras: Dict[str, Union[Regra, staticmethod]]):
+        self.chaves_obrigatorias = tuple(chaves_obrigatorias)
+        # Regras declaradas no corpo da classe ainda são objetos staticmethod: guarda a função em si
+        self.regras: Dict[str, Regra] = {chave: getattr(regra, "__func__", regra) for chave, regra in regras.items()}
+
+    def validar(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converte as chaves de entrada para MAIÚSCULAS, confere as obrigatórias e aplica a regra de cada campo.
+        Campos sem regra passam como estão. Retorna os dados validados com chaves em MINÚSCULAS.
+        """
+        normalized_data = {k.upper(): v for k, v in data.items()}
+
+        ausentes = [key for key in self.chaves_obrigatorias if key not in normalized_data]
+        if ausentes:
+            raise DataValidationError(", ".join(f"O campo obrigatório '{key}' está ausente." for key in ausentes))
+
+        validated_data = {}
+        errors = []
+        regras = self.regras
+        for key, value in normalized_data.items():
+            regra = regras.get(key)
+            if regra is None:
+                # Se a chave não tem regra de validação, ela é incluída como está
+                validated_data[key] = value
+                continue
+            try:
+                validated_data[key] = regra(value)
+            except DataValidationError as e:
+                errors.append(f"Erro no campo '{key}': {e}")
+
+        if errors:
+            raise DataValidationError("Erros de validação encontrados: " + "; ".join(errors))
+
+        return {k.lower(): v for k, v in validated_data.items()}
+
+
 class ValidadorDadosFuncionario:
-    def __init__(self):
-        # Mantém required_keys em MAIÚSCULAS, como já está no seu código.
-        self.required_keys = ["CHAPA","NOME","SITUACAO","CODIGO_FUNCAO","DATA_ADMISSAO","DATA_ADMISSAO_PTS","DATA_NASCIMENTO","SECAO","CARGA_HORARIA_MENSAL","CPF","CENTRO_CUSTO"]
-        self.validation_rules = {
-            "CHAPA": self._validate_CHAPA,
-            "NOME": self._validate_string,
-            "SITUACAO":self._validate_SITUACAO_format,
-            "CODIGO_FUNCAO": self._validate_CODIGO_FUNCAO_format,
-            "DATA_ADMISSAO": self._validate_date_format,
-            "DATA_ADMISSAO_PTS": self._validate_date_format,
-            "DATA_NASCIMENTO": self._validate_date_format,
-            "SECAO": self._validate_SESSAO_format,
-            "CARGA_HORARIA_MENSAL": self._validate_JORNADA_format,
-            "CPF": self._validate_CPF_format,
-            "CENTRO_CUSTO": self._validate_centro_custo_format
-        }
-        # Adiciona campos de agrupamento e benefícios aos required_keys e validation_rules
-        self.required_keys.extend([
-            "EMPRESA", "EQUIPE", "FUNCAO",
-            "VALOR_VALE_TRANSPORTE_MENSAL", "VALOR_VALE_REFEICAO_MENSAL",
-            "PLANO_SAUDE_MENSAL", "OUTROS_BENEFICIOS_MENSAIS" # Nomes em MAIÚSCULAS
-        ])
-        self.validation_rules.update({
-            "EMPRESA": self._validate_string,
-            "EQUIPE": self._validate_string,
-            "FUNCAO": self._validate_string,
-            "VALOR_VALE_TRANSPORTE_MENSAL": self._validate_non_negative_float,
-            "VALOR_VALE_REFEICAO_MENSAL": self._validate_non_negative_float,
-            "PLANO_SAUDE_MENSAL": self._validate_non_negative_float,
-            "OUTROS_BENEFICIOS_MENSAL": self._validate_non_negative_float # Corrigido para corresponder ao JSON de exemplo
-        })
-
-
-    def _validate_CHAPA(self, value: Any) -> str:
-        if not isinstance(value, str) or not re.match(r'^\d{5}$', value):
+    """Valida os dados de entrada para a entidade Funcionario."""
+
+    @staticmethod
+    def _validate_CHAPA(value: Any) -> str:
+        if not isinstance(value, str) or not PADRAO_CHAPA.match(value):
             raise DataValidationError("O campo 'CHAPA' deve ser uma string de 5 dígitos numéricos.")
         return value
     
-    def _validate_string(self, value: Any) -> str:
+    @staticmethod
+    def _validate_string(value: Any) -> str:
         if not isinstance(value, str) or not value.strip():
             raise DataValidationError("O campo deve ser uma string não vazia.")
         return value.strip()
     
-    def _validate_SITUACAO_format(self, value: Any) -> str:
-        valid_values = {'A', 'F', 'I', 'L', 'P', 'T'}
-        if not isinstance(value, str) or len(value) != 1 or value not in valid_values:
+    @staticmethod
+    def _validate_SITUACAO_format(value: Any) -> str:
+        if not isinstance(value, str) or len(value) != 1 or value not in SITUACOES_VALIDAS:
             raise DataValidationError("O campo 'SITUACAO' deve ser uma string de 1 caractere com um dos seguintes valores: 'A', 'F', 'I', 'L', 'P', 'T'.")
         return value.strip()
     
-    def _validate_CODIGO_FUNCAO_format(self, value: Any) -> str:
-        if not isinstance(value, str) or not re.match(r'^\d{4}$', value):
+    @staticmethod
+    def _validate_CODIGO_FUNCAO_format(value: Any) -> str:
+        if not isinstance(value, str) or not PADRAO_CODIGO_FUNCAO.match(value):
             raise DataValidationError("O campo 'CODIGO_FUNCAO' deve ser uma string de 4 dígitos numéricos.") # Mensagem corrigida
         return value.strip()
     
-    def _validate_date_format(self, value: Any) -> datetime:
+    @staticmethod
+    def _validate_date_format(value: Any) -> datetime:
         if not isinstance(value, str):
             raise DataValidationError("O campo de data deve ser uma string.")
 
-        try:
-            return datetime.strptime(value.strip(), '%Y-%m-%d')
-        except ValueError:
-            try:
-                return datetime.strptime(value.strip(), '%d/%m/%Y')
-            except ValueError:
-                raise DataValidationError("A data deve estar no formato 'YYYY-MM-DD' ou 'DD/MM/YYYY'.")
+        data = converter_data(value.strip())
+        if data is None:
+            raise DataValidationError("A data deve estar no formato 'YYYY-MM-DD' ou 'DD/MM/YYYY'.")
+        return data
 
     
-    def _validate_SESSAO_format(self, value: Any) -> str:
-        if not isinstance(value, str) or not re.match(r'^\d{2}\.\d{2}\.\d\.\d{2}\.\d{2}\.\d{3}$', value):
+    @staticmethod
+    def _validate_SESSAO_format(value: Any) -> str:
+        if not isinstance(value, str) or not PADRAO_SECAO.match(value):
             raise DataValidationError("O campo 'SESSAO' deve estar no formato 'XX.XX.X.XX.XX.XXX'.")
         return value.strip()
     
-    def _validate_JORNADA_format(self, value: Any) -> str:
-        valid_values = {'220', '150', '75'}
-        if not isinstance(value, str) or value not in valid_values:
+    @staticmethod
+    def _validate_JORNADA_format(value: Any) -> str:
+        if not isinstance(value, str) or value not in JORNADAS_VALIDAS:
             raise DataValidationError("O campo 'JORNADA' deve ser uma string com um dos seguintes valores: '220', '150', '075'.")
         return value.strip()
     
-    def _validate_CPF_format(self, value: Any) -> str:
+    @staticmethod
+    def _validate_CPF_format(value: Any) -> str:
         if not isinstance(value, str):
             raise DataValidationError("O CPF deve ser fornecido como uma string.")
 
-        value = value.strip()
-
-        if not value:
-            raise DataValidationError("O CPF deve conter 11 dígitos.")
-
-        if not re.match(r'^[0-9.\-]+$', value):
-            raise DataValidationError("O CPF deve conter apenas números ou os formatos válidos (XXX.XXX.XXX-XX).")
-
-        cpf = re.sub(r'\D', '', value)
-
-        if len(cpf) != 11:
-            raise DataValidationError("O CPF deve conter 11 dígitos.")
-
-        if cpf in [str(i) * 11 for i in range(10)]:
-            raise DataValidationError("O CPF fornecido é inválido.")
-
-        if not self._is_valid_cpf(cpf):
-            raise DataValidationError("Os dígitos verificadores do CPF são inválidos.")
-
+        cpf, erro = conferir_cpf(value)
+        if erro is not None:
+            raise DataValidationError(erro)
         return cpf
 
-    def _is_valid_cpf(self, cpf: str) -> bool:
-        if len(cpf) != 11:
-            return False
-
-        soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
-        primeiro_digito = (soma * 10) % 11
-        if primeiro_digito == 10:
-            primeiro_digito = 0
-
-        if primeiro_digito != int(cpf[9]):
-            return False
-
-        soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
-        segundo_digito = (soma * 10) % 11
-        if segundo_digito == 10:
-            segundo_digito = 0
-
-        if segundo_digito != int(cpf[10]):
-            return False
+    @staticmethod
+    def _is_valid_cpf(cpf: str) -> bool:
+        return cpf_digitos_validos(cpf)
 
-        return True
-    
-    def _validate_centro_custo_format(self, value: Any) -> str:
-        if not isinstance(value, str) or not re.match(r'^\d{9}$', value):
+    @staticmethod
+    def _validate_centro_custo_format(value: Any) -> str:
+        if not isinstance(value, str) or not PADRAO_CENTRO_CUSTO.match(value):
             raise DataValidationError("O campo 'CENTRO_CUSTO' deve ser uma string de 9 dígitos numéricos.")
         return value.strip()
 
-    def _validate_non_negative_float(self, value: Any) -> float:
+    @staticmethod
+    def _validate_non_negative_float(value: Any) -> float:
         try:
             val = float(value)
             if val < 0:
@@ -153,65 +217,70 @@ class ValidadorDadosFuncionario:
         except (ValueError, TypeError) as e:
             raise DataValidationError(f"Valor numérico inválido: '{value}'. Deve ser um número válido e não negativo. Erro: {e}")
 
+    # Chaves em MAIÚSCULAS, incluindo os campos de agrupamento e benefícios
+    plano = PlanoValidacao(
+        chaves_obrigatorias=[
+            "CHAPA", "NOME", "SITUACAO", "CODIGO_FUNCAO", "DATA_ADMISSAO", "DATA_ADMISSAO_PTS", "DATA_NASCIMENTO",
+            "SECAO", "CARGA_HORARIA_MENSAL", "CPF", "CENTRO_CUSTO",
+            "EMPRESA", "EQUIPE", "FUNCAO",
+            "VALOR_VALE_TRANSPORTE_MENSAL", "VALOR_VALE_REFEICAO_MENSAL",
+            "PLANO_SAUDE_MENSAL", "OUTROS_BENEFICIOS_MENSAIS",
+        ],
+        regras={
+            "CHAPA": _validate_CHAPA,
+            "NOME": _validate_string,
+            "SITUACAO": _validate_SITUACAO_format,
+            "CODIGO_FUNCAO": _validate_CODIGO_FUNCAO_format,
+            "DATA_ADMISSAO": _validate_date_format,
+            "DATA_ADMISSAO_PTS": _validate_date_format,
+            "DATA_NASCIMENTO": _validate_date_format,
+            "SECAO": _validate_SESSAO_format,
+            "CARGA_HORARIA_MENSAL": _validate_JORNADA_format,
+            "CPF": _validate_CPF_format,
+            "CENTRO_CUSTO": _validate_centro_custo_format,
+            "EMPRESA": _validate_string,
+            "EQUIPE": _validate_string,
+            "FUNCAO": _validate_string,
+            "VALOR_VALE_TRANSPORTE_MENSAL": _validate_non_negative_float,
+            "VALOR_VALE_REFEICAO_MENSAL": _validate_non_negative_float,
+            "PLANO_SAUDE_MENSAL": _validate_non_negative_float,
+            "OUTROS_BENEFICIOS_MENSAL": _validate_non_negative_float # Corrigido para corresponder ao JSON de exemplo
+        }
+    )
+
+    @property
+    def required_keys(self) -> Tuple[str, ...]:
+        return self.plano.chaves_obrigatorias
+
+    @property
+    def validation_rules(self) -> Dict[str, Regra]:
+        return self.plano.regras
+
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Valida os dados do empregado.
         Converte as chaves de entrada para MAIÚSCULAS antes da validação interna.
         Retorna os dados validados com chaves em MINÚSCULAS.
         """
-        # AQUI É A MUDANÇA CRÍTICA: Normaliza TODAS as chaves de entrada para MAIÚSCULAS
-        normalized_data = {k.upper(): v for k, v in data.items()}
-
-        validated_data = {}
-        errors = []
-
-        for key in self.required_keys:
-            # Agora 'key' (em maiúsculas) é procurado em 'normalized_data' (que tem chaves em maiúsculas)
-            if key not in normalized_data:
-                errors.append(f"O campo obrigatório '{key}' está ausente.")
-        
-        if errors:
-            raise DataValidationError(", ".join(errors))
-
-        # Percorre normalized_data para aplicar as regras
-        for key, value in normalized_data.items():
-            if key in self.validation_rules:
-                try:
-                    validated_data[key] = self.validation_rules[key](value)
-                except DataValidationError as e:
-                    errors.append(f"Erro no campo '{key}': {e}")
-            else:
-                 # Se a chave não tem regra de validação, ela é incluída como está
-                 validated_data[key] = value
-
-        if errors:
-            raise DataValidationError("Erros de validação encontrados: " + "; ".join(errors))
-        
-        # Converte as chaves de volta para minúsculas para o dicionário de retorno
-        return {k.lower(): v for k, v in validated_data.items()}
+        return self.plano.validar(data)
 
 class ValidadorDadosCargo:
     """Valida os dados de entrada para a entidade Funcao."""
-    def __init__(self):
-        # Mantenha required_keys em MAIÚSCULAS
-        self.required_keys = ["CODIGO_FUNCAO", "NOME_FUNCAO", "SALARIO"]
-        self.validation_rules = {
-            "CODIGO_FUNCAO": self._validate_string_code,
-            "NOME_FUNCAO": self._validate_string,
-            "SALARIO": self._validate_salary
-        }
 
-    def _validate_string_code(self, value: Any) -> str:
-        if not isinstance(value, str) or not re.match(r'^\d{4}$', value):
+    @staticmethod
+    def _validate_string_code(value: Any) -> str:
+        if not isinstance(value, str) or not PADRAO_CODIGO_FUNCAO.match(value):
             raise DataValidationError("O campo 'CODIGO_FUNCAO' deve ser uma string de 4 digitos númericos.")
         return value.strip()
 
-    def _validate_string(self, value: Any) -> str:
+    @staticmethod
+    def _validate_string(value: Any) -> str:
         if not isinstance(value, str) or not value.strip():
             raise DataValidationError("O campo 'NOME_FUNCAO' deve ser uma string não vazia")
         return value.strip()
 
-    def _validate_salary(self, value: Any) -> float:
+    @staticmethod
+    def _validate_salary(value: Any) -> float:
         if not isinstance(value, str):
             raise DataValidationError("O campo 'SALARIO' deve ser uma string.")
         try:
@@ -223,37 +292,27 @@ class ValidadorDadosCargo:
             raise DataValidationError("O campo 'SALARIO' deve ser um número válido.")
 
 
+    plano = PlanoValidacao(
+        chaves_obrigatorias=["CODIGO_FUNCAO", "NOME_FUNCAO", "SALARIO"],
+        regras={
+            "CODIGO_FUNCAO": _validate_string_code,
+            "NOME_FUNCAO": _validate_string,
+            "SALARIO": _validate_salary
+        }
+    )
+
+    @property
+    def required_keys(self) -> Tuple[str, ...]:
+        return self.plano.chaves_obrigatorias
+
+    @property
+    def validation_rules(self) -> Dict[str, Regra]:
+        return self.plano.regras
+
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Valida os dados de entrada para a entidade Funcao.
         Converte as chaves de entrada para MAIÚSCULAS antes da validação interna.
         Retorna os dados validados com chaves em MINÚSCULAS.
         """
-        # AQUI É A MUDANÇA CRÍTICA: Normaliza TODAS as chaves de entrada para MAIÚSCULAS
-        normalized_data = {k.upper(): v for k, v in data.items()}
-
-        validated_data = {}
-        errors = []
-
-        for key in self.required_keys:
-            # Agora 'key' (em maiúsculas) é procurado em 'normalized_data' (que tem chaves em maiúsculas)
-            if key not in normalized_data:
-                errors.append(f"O campo obrigatório '{key}' está ausente.")
-
-        if errors:
-            raise DataValidationError(", ".join(errors))
-
-        for key, value in normalized_data.items():
-            if key in self.validation_rules:
-                try:
-                    validated_data[key] = self.validation_rules[key](value)
-                except DataValidationError as e:
-                    errors.append(f"Erro no campo '{key}': {e}")
-            else:
-                validated_data[key] = value
-
-        if errors:
-            raise DataValidationError("Erros de validação encontrados: " + "; ".join(errors))
-        
-        # Converte as chaves de volta para minúsculas para o dicionário de retorno
-        return {k.lower(): v for k, v in validated_data.items()}
\ No newline at end of file
+        return self.plano.validar(data)
@@ -0,0 +1,221 @@
+# core/validators_batch.py
+
+"""
+Validação em lote (colunar) dos dados de funcionários.
+
+Faz as mesmas checagens de ValidadorDadosFuncionario.validate, mas sobre o arquivo
+inteiro como colunas de um DataFrame: formatos por expressão regular vetorizada,
+datas com pd.to_datetime e dígitos verificadores do CPF com NumPy.
+
+As máscaras vetorizadas só aceitam o que a validação individual também aceita, com
+o mesmo valor convertido. Toda linha reprovada em alguma máscara é revalidada com o
+validador individual: assim as mensagens de erro são exatamente as mesmas, e as grafias
+menos comuns que só o caminho individual aceita (ex.: '2023-1-5', CPF com espaços nas
+pontas) continuam válidas.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+
+from core.validators import ValidadorDadosFuncionario, DataValidationError
+
+PESOS_PRIMEIRO_DIGITO_CPF = np.arange(10, 1, -1)
+PESOS_SEGUNDO_DIGITO_CPF = np.arange(11, 1, -1)
+
+
+@dataclass
+class ResultadoValidacaoLote:
+    """
+    'validos': linhas aprovadas, com colunas em minúsculas e valores convertidos (como no validate individual).
+    'erros': uma linha por registro reprovado, com a linha de origem (índice do frame) e a mensagem de erro.
+    Os dois mantêm o índice do frame de entrada.
+    """
+    validos: pd.DataFrame
+    erros: pd.DataFrame
+
+    @property
+    def quantidade_erros(self) -> int:
+        return len(self.erros)
+
+
+def _ausente(valor: Any) -> bool:
+    """Célula vazia do frame (o registro original não tinha a chave)."""
+    return valor is pd.NA or (isinstance(valor, float) and np.isnan(valor))
+
+
+def _textos(coluna: pd.Series):
+    """Acessor .str da coluna, ou None se ela não tem nenhum texto (ex.: coluna numérica)."""
+    try:
+        return coluna.str
+    except AttributeError:
+        return None
+
+
+def _casa_padrao(coluna: pd.Series, padrao: str) -> pd.Series:
+    """Máscara dos valores que casam com o padrão inteiro (sem o '\\n' final que o re.match com '$' tolera)."""
+    textos = _textos(coluna)
+    if textos is None:
+        return pd.Series(False, index=coluna.index)
+    return textos.fullmatch(padrao, na=False).astype(bool)
+
+
+def _regra_padrao(padrao: str):
+    def aplicar(coluna: pd.Series):
+        # Quem casa com o padrão não tem espaços nas pontas: o strip da regra individual não muda nada
+        return _casa_padrao(coluna, padrao), coluna
+    return aplicar
+
+
+def _regra_valores_validos(valores: List[str]):
+    def aplicar(coluna: pd.Series):
+        return coluna.isin(valores), coluna
+    return aplicar
+
+
+def _regra_texto_nao_vazio(coluna: pd.Series):
+    textos = _textos(coluna)
+    if textos is None:
+        return pd.Series(False, index=coluna.index), coluna
+    limpos = textos.strip()
+    return limpos.str.len().gt(0), limpos
+
+
+def _regra_data(coluna: pd.Series):
+    """Converte nos formatos 'YYYY-MM-DD' ou 'DD/MM/YYYY' (sem espaços); NaT reprova a linha."""
+    textos = _textos(coluna)
+    if textos is None:
+        datas = pd.Series(pd.NaT, index=coluna.index, dtype="datetime64[ns]")
+        return datas.notna(), datas
+    datas = pd.to_datetime(coluna, format="%Y-%m-%d", errors="coerce")
+    faltantes = datas.isna()
+    if faltantes.any():
+        datas[faltantes] = pd.to_datetime(coluna[faltantes], format="%d/%m/%Y", errors="coerce")
+    return datas.notna(), datas
+
+
+def _regra_numero_nao_negativo(coluna: pd.Series):
+    numeros = pd.to_numeric(coluna, errors="coerce")
+    return numeros.notna() & (numeros >= 0), numeros.astype(float)
+
+
+def _regra_cpf(coluna: pd.Series):
+    """
+    CPFs nas formas 'XXXXXXXXXXX' ou 'XXX.XXX.XXX-XX', com dígitos verificadores conferidos em NumPy.
+    Outras grafias aceitas pela regra individual (ex.: com espaços nas pontas) vão para o caminho individual.
+    """
+    validos = pd.Series(False, index=coluna.index)
+    textos = _textos(coluna)
+    if textos is None:
+        return validos, coluna
+    so_digitos = textos.fullmatch(r"[0-9]{11}", na=False).astype(bool)
+    pontuados = textos.fullmatch(r"[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2}", na=False).astype(bool)
+    digitos = coluna[so_digitos | pontuados].astype(object)
+    if digitos.empty:
+        return validos, coluna
+    if pontuados.any():
+        digitos[pontuados[so_digitos | pontuados]] = coluna[pontuados].str.replace(r"[.\-]", "", regex=True)
+
+    matriz = (np.frombuffer("".join(digitos).encode("ascii"), dtype=np.uint8).reshape(-1, 11) - ord("0")).astype(np.int64)
+    primeiro_digito = (matriz[:, :9] @ PESOS_PRIMEIRO_DIGITO_CPF * 10) % 11
+    primeiro_digito[primeiro_digito == 10] = 0
+    segundo_digito = (matriz[:, :10] @ PESOS_SEGUNDO_DIGITO_CPF * 10) % 11
+    segundo_digito[segundo_digito == 10] = 0
+    repetido = (matriz == matriz[:, :1]).all(axis=1)
+
+    validos[digitos.index] = (primeiro_digito == matriz[:, 9]) & (segundo_digito == matriz[:, 10]) & ~repetido
+    convertido = coluna.astype(object)
+    convertido[digitos.index] = digitos
+    return validos, convertido
+
+
+class ValidadorDadosFuncionarioLote:
+    """
+    Valida um arquivo inteiro de funcionários de uma vez. Usa as mesmas regras (e as mesmas mensagens)
+    de ValidadorDadosFuncionario, que continua sendo a referência para cada registro.
+    Células vazias (NaN) contam como campo ausente, como um registro sem a chave.
+    """
+    def __init__(self, validador: Optional[ValidadorDadosFuncionario] = None):
+        self.validador = validador or ValidadorDadosFuncionario()
+        regras = self.validador.validation_rules
+        # Versão colunar de cada regra do validador individual: devolve a máscara de aprovação e a coluna convertida
+        self._regras_colunares = {
+            regras["CHAPA"]: _regra_padrao(r"\d{5}"),
+            regras["NOME"]: _regra_texto_nao_vazio,
+            regras["SITUACAO"]: _regra_valores_validos(["A", "F", "I", "L", "P", "T"]),
+            regras["CODIGO_FUNCAO"]: _regra_padrao(r"\d{4}"),
+            regras["DATA_ADMISSAO"]: _regra_data,
+            regras["SECAO"]: _regra_padrao(r"\d{2}\.\d{2}\.\d\.\d{2}\.\d{2}\.\d{3}"),
+            regras["CARGA_HORARIA_MENSAL"]: _regra_valores_validos(["220", "150", "75"]),
+            regras["CPF"]: _regra_cpf,
+            regras["CENTRO_CUSTO"]: _regra_padrao(r"\d{9}"),
+            regras["VALOR_VALE_TRANSPORTE_MENSAL"]: _regra_numero_nao_negativo,
+        }
+
+    def validar_registros(self, registros: Iterable[Dict[str, Any]]) -> ResultadoValidacaoLote:
+        """Atalho para validar uma lista de dicionários (ex.: o conteúdo de um JSON)."""
+        # dtype=object preserva os tipos de cada valor (ex.: -1 não vira -1.0, None não vira NaN)
+        return self.validar(pd.DataFrame(list(registros), dtype=object))
+
+    def validar(self, dados: pd.DataFrame) -> ResultadoValidacaoLote:
+        # Nomes de coluna em MAIÚSCULAS, como no validate individual (em duplicatas, a última coluna vence)
+        # Internamente as linhas são numeradas por posição; o índice original volta no resultado
+        indice_original = dados.index
+        dados = dados.reset_index(drop=True)
+        dados.columns = [str(coluna).upper() for coluna in dados.columns]
+        dados = dados.loc[:, ~dados.columns.duplicated(keep="last")]
+
+        if any(chave not in dados.columns for chave in self.validador.required_keys):
+            # Colunas ausentes reprovam todas as linhas; as mensagens vêm do validador individual
+            reprovadas = pd.Series(True, index=dados.index)
+            aprovados = dados.iloc[0:0]
+        else:
+            reprovadas = pd.Series(False, index=dados.index)
+            for chave in self.validador.required_keys:
+                reprovadas |= dados[chave].isna()
+            convertidos = {}
+            for coluna in dados.columns:
+                regra = self.validador.validation_rules.get(coluna)
+                if regra is None:
+                    continue
+                aprovado, convertido = self._aprovar_coluna(regra, dados[coluna])
+                reprovadas |= ~aprovado
+                convertidos[coluna] = convertido
+            aprovados = dados[~reprovadas].copy()
+            for coluna, convertido in convertidos.items():
+                aprovados[coluna] = convertido[~reprovadas]
+
+        validos = [aprovados.rename(columns=str.lower)]
+        erros: List[Dict[str, Any]] = []
+        revalidados: Dict[Any, Dict[str, Any]] = {}
+        for indice, linha in dados[reprovadas].to_dict(orient="index").items():
+            registro = {chave: valor for chave, valor in linha.items() if not _ausente(valor)}
+            try:
+                revalidados[indice] = self.validador.validate(registro)
+            except DataValidationError as e:
+                erros.append({"linha": indice, "erro": str(e)})
+        if revalidados:
+            validos.append(pd.DataFrame.from_dict(revalidados, orient="index"))
+
+        validos_concatenados = pd.concat(validos).sort_index() if len(validos) > 1 else validos[0]
+        validos_concatenados.index = indice_original[validos_concatenados.index]
+        tabela_erros = pd.DataFrame(erros, columns=["linha", "erro"])
+        tabela_erros["linha"] = indice_original[tabela_erros["linha"].to_numpy(dtype=np.int64)]
+        return ResultadoValidacaoLote(validos=validos_concatenados, erros=tabela_erros)
+
+    def _aprovar_coluna(self, regra, coluna: pd.Series):
+        """Aplica a versão colunar da regra. Retorna a máscara de aprovação e a coluna convertida."""
+        regra_colunar = self._regras_colunares.get(regra)
+        if regra_colunar is None:
+            # Regra sem versão colunar: todas as linhas passam pelo validador individual
+            return pd.Series(False, index=coluna.index), coluna
+        codigos, unicos = pd.factorize(coluna, use_na_sentinel=False)
+        if len(unicos) * 2 > len(coluna):
+            return regra_colunar(coluna)
+        # Colunas com muitos valores repetidos (empresa, função, datas...): valida cada valor distinto uma vez
+        aprovado, convertido = regra_colunar(pd.Series(unicos, dtype=coluna.dtype))
+        return (
+            pd.Series(aprovado.to_numpy()[codigos], index=coluna.index),
+            pd.Series(convertido.to_numpy()[codigos], index=coluna.index)
+        )
@@ -5,13 +5,16 @@ import os
 import json
 import datetime
 from datetime import date
-import copy
 import pprint
 from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, ParametroHistorico,CenarioOrcamento, AcaoQuadroPessoal
 from core.validators import ValidadorDadosFuncionario, ValidadorDadosCargo, DataValidationError
 from core.payroll_rules import ServicoFolhaPagamento
-from core.history_manager import GerenciadorHistorico
+from core.catalogo_cargos import CatalogoCargos
+from core.historico_sqlite import GerenciadorHistoricoSQLite
+from core.config import construir_configuracao_global_para_data, LinhaDoTempoConfiguracao
 from core.qpa_generator import GeradorQPA
+from core.ingestao_quadro import ler_registros, funcionarios_validos, processar_quadro_em_fluxo
+from core.services import OrcamentoService, ResultadoSimulacao
 
 
 def exibir_detalhamento_custo_total(employee_name: str, results: dict):
@@ -33,16 +36,15 @@ def exibir_orcamento_mensal(orcamento):
     print(f"  Custo total do orçamento: R$ {orcamento.custo_total_orcamento:.2f}")
     print("-" * 40)
 
-def exibir_cenario_simulacao(simulacao_resultado: dict): # Tipo do parâmetro ajustado para 'dict'
-    print(f"\n--- Resultado da Simulação do Cenário: {simulacao_resultado['nome_cenario']} ---")
-    print(f"  Período: {simulacao_resultado['periodo_simulacao']}")
-    print(f"  Custo Total Simulado no Período: R$ {simulacao_resultado['custo_total_simulado']:.2f}")
+def exibir_cenario_simulacao(simulacao_resultado: ResultadoSimulacao):
+    print(f"\n--- Resultado da Simulação do Cenário: {simulacao_resultado.nome_cenario} ---")
+    print(f"  Período: {simulacao_resultado.periodo_simulacao}")
+    print(f"  Custo Total Simulado no Período: R$ {simulacao_resultado.custo_total_simulado:.2f}")
     print("\n  Detalhes Mensais da Simulação:")
-    for mes_str, orcamento_dict in simulacao_resultado['detalhes_mensais'].items(): # Renomeado para orcamento_dict
-        print(f"    Mês {mes_str}:")
-        # NOVO: Acesse as chaves do dicionário
-        print(f"      Número de Funcionários: {orcamento_dict['numero_total_funcionarios']}")
-        print(f"      Custo Mensal: R$ {orcamento_dict['custo_total_orcamento']:.2f}")
+    for orcamento in simulacao_resultado.meses:
+        print(f"    Mês {orcamento.ano}-{orcamento.mes:02d}:")
+        print(f"      Número de Funcionários: {orcamento.numero_total_funcionarios}")
+        print(f"      Custo Mensal: R$ {orcamento.custo_total_orcamento:.2f}")
     print("-" * 50)
 
 # Função para carregar dados históricos (já no main.py da última interação)
@@ -61,28 +63,23 @@ def carregar_dados_historicos_de_arquivo(file_path: str) -> list[dict]:
         print(f"Erro ao ler arquivo de histórico '{file_path}': {e}. Iniciando vazio.")
         return []
 
-# Função para construir GlobalConfig (já no main.py da última interação)
-def construir_configuracao_global_para_data(history_manager: GerenciadorHistorico, check_date: date) -> ConfiguracaoGlobal:
-    """Constrói uma GlobalConfig para uma data específica a partir do HistoryManager."""
-    active_params = history_manager.obter_todos_parametros_ativos_na_data(check_date)
-    
-    required_params = [
-        "minimum_wage", "insalubrity_percent", "aliquota_fgts_empresa",
-        "aliquota_inss_patronal_media", "percentual_terco_ferias", "meses_do_ano"
-    ]
-    for param in required_params:
-        if param not in active_params or active_params[param] is None:
-            raise ValueError(f"Parâmetro histórico '{param}' é obrigatório mas não encontrado ou nulo para {check_date}.")
-
-    return ConfiguracaoGlobal(
-        data_calculo=check_date,
-        salario_minimo=active_params.get("minimum_wage"),
-        percentual_insalubridade=active_params.get("insalubrity_percent"),
-        aliquota_fgts_patronal=active_params.get("aliquota_fgts_empresa"),
-        aliquota_inss_patronal_media=active_params.get("aliquota_inss_patronal_media"),
-        percentual_terco_ferias=active_params.get("percentual_terco_ferias"),
-        meses_do_ano=active_params.get("meses_do_ano")
+
+def abrir_historico(file_path: str, caminho_banco: str) -> GerenciadorHistoricoSQLite:
+    """
+    Abre o histórico no banco SQLite. O JSON só é lido (e importado para o banco) quando o banco
+    ainda está vazio ou quando o arquivo é mais recente que o banco; nas demais execuções só o banco é aberto.
+    Um JSON vazio, ilegível ou com registros inválidos não substitui o histórico já gravado.
+    """
+    desatualizado = not os.path.exists(caminho_banco) or (
+        os.path.exists(file_path) and os.path.getmtime(file_path) > os.path.getmtime(caminho_banco)
     )
+    history_manager = GerenciadorHistoricoSQLite(caminho_banco)
+    if desatualizado or not history_manager.nomes_parametros():
+        try:
+            history_manager.carregar_de_dados_brutos(carregar_dados_historicos_de_arquivo(file_path))
+        except ValueError as e:
+            print(f"Erro ao importar o histórico de '{file_path}': {e} Mantendo o histórico já gravado no banco.")
+    return history_manager
 
 
 
@@ -90,6 +87,7 @@ def main():
     employee_data_file = "dados_funcionarios.json"
     funcao_salario_file = "dados_funcoes_salario.json"
     historical_params_file = "dados_historicos_parametros.json" # NOVO
+    historical_params_db = "historico_parametros.sqlite"
     qpa_scenario_actions_file = "cenario_qpa_acoes.json"    
     current_qpa_output_file = "qpa_atual_raio_x.csv"
     simulated_qpa_output_file = "qpa_simulado_cenario.csv"
@@ -124,7 +122,7 @@ def main():
         {"CHAPA": "03494", "NOME": "GERALDO CANDIDO DE SOUSA", "SITUACAO": "A",
          "CODIGO_FUNCAO": "4206", "DATA_ADMISSAO": "15/04/2002",
          "DATA_ADMISSAO_PTS": "15/04/2002", "DATA_NASCIMENTO": "01/01/1980",
-         "SESSAO": "01.01.4.10.01.005", "JORNADA": "220", "CPF": "25216977880",
+         "SECAO": "01.01.4.10.01.005", "CARGA_HORARIA_MENSAL": "220", "CPF": "25216977880",
          "CENTRO_CUSTO": "104101205",
          "empresa": "Matriz", "equipe": "Operacao", "funcao": "Motorista", # Adicionados para QPA
          "valor_vale_transporte_mensal": 150.00, "valor_vale_refeicao_mensal": 400.00,
@@ -146,9 +144,12 @@ def main():
         {"id": 7, "parameter_name": "percentual_terco_ferias", "value": (1/3), "start_date": "1988-10-05", "end_date": None},
         {"id": 8, "parameter_name": "meses_do_ano", "value": 12, "start_date": "1900-01-01", "end_date": None}
     ]
-    with open(historical_params_file, 'w', encoding='utf-8') as f:
-        json.dump(sample_historical_params_content, f, indent=2)
-    print(f"Arquivo de dados históricos de parâmetros '{historical_params_file}' criado/atualizado.")
+    # Só é gravado se ainda não existir: regravá-lo a cada execução o deixaria mais recente que o banco
+    # SQLite e forçaria a reimportação do histórico inteiro em toda inicialização (ver abrir_historico)
+    if not os.path.exists(historical_params_file):
+        with open(historical_params_file, 'w', encoding='utf-8') as f:
+            json.dump(sample_historical_params_content, f, indent=2)
+        print(f"Arquivo de dados históricos de parâmetros '{historical_params_file}' criado.")
 
     # Ações de QPA (para CenariodeOrcamento e AcaoHeadcount)
     ano_cenario = date.today().year
@@ -182,9 +183,8 @@ def main():
     employee_validator = ValidadorDadosFuncionario()
     function_validator = ValidadorDadosCargo()
 
-    # Carregar dados históricos e criar o HistoryManager
-    historical_raw_data = carregar_dados_historicos_de_arquivo(historical_params_file)
-    history_manager = GerenciadorHistorico(historical_raw_data)
+    # Abrir o histórico de parâmetros (banco SQLite, importado do JSON quando necessário)
+    history_manager = abrir_historico(historical_params_file, historical_params_db)
     
     # NOVO: Validar e processar funções
     functions_list_validated = []
@@ -200,40 +200,12 @@ def main():
         print("Nenhuma função válida carregada. O programa será encerrado.")
         exit(1)
         
-    functions_map = {f.codigo_funcao: f for f in functions_list_validated} # Cria o mapa após validar todos
+    catalogo_cargos = CatalogoCargos(functions_list_validated) # Cria o catálogo (indexado por código) após validar todos
 
     # NOVO: Validar e processar funcionários
-    employees_list = []
-    for emp_raw_data in sample_employees_content: # Itera sobre a lista
-        try:
-            # Chama o validate para CADA DICIONÁRIO na lista
-            validated_emp_data = employee_validator.validate(emp_raw_data)
-            
-            # Preenche o objeto Employee
-            func_info = functions_map.get(validated_emp_data['codigo_funcao'])
-            if not func_info:
-                print(f"Aviso: Função '{validated_emp_data['codigo_funcao']}' não encontrada para funcionário {validated_emp_data.get('chapa', 'N/A')}. Funcionário ignorado.")
-                continue
-            
-            employee_obj = Funcionario(
-                chapa=validated_emp_data['chapa'], nome=validated_emp_data['nome'], situacao=validated_emp_data['situacao'],
-                codigo_funcao=validated_emp_data['codigo_funcao'], data_admissao=validated_emp_data['data_admissao'],
-                data_admissao_pts=validated_emp_data['data_admissao_pts'], data_nascimento=validated_emp_data['data_nascimento'],
-                secao=validated_emp_data['sessao'], carga_horaria_mensal=validated_emp_data['jornada'], cpf=validated_emp_data['cpf'],
-                centro_custo=validated_emp_data['centro_custo'],
-                empresa=validated_emp_data.get('empresa', ''), # Usar .get() para campos opcionais caso seu JSON de exemplo não os tenha para todos
-                equipe=validated_emp_data.get('equipe', ''),
-                funcao=validated_emp_data.get('funcao', ''), # Nome da função em si
-                valor_vale_transporte_mensal=validated_emp_data.get('valor_vale_transporte_mensal', 0.0),
-                valor_vale_refeicao_mensal=validated_emp_data.get('valor_vale_refeicao_mensal', 0.0),
-                plano_saude_mensal=validated_emp_data.get('plano_saude_mensal', 0.0),
-                outros_beneficios_mensais=validated_emp_data.get('outros_beneficios_mensais', 0.0)
-            )
-            employees_list.append(employee_obj)
-        except DataValidationError as e:
-            print(f"Erro de validação para funcionário {emp_raw_data.get('CHAPA', 'N/A')}: {e}. Funcionário ignorado.")
-        except Exception as e: # Captura outros erros inesperados durante o processamento
-            print(f"Erro inesperado ao processar funcionário {emp_raw_data.get('CHAPA', 'N/A')}: {e}. Funcionário ignorado.")
+    # O arquivo é lido e validado em fluxo, registro a registro (para quadros grandes, use JSON Lines ou CSV).
+    # A lista só é montada porque a simulação de cenário precisa do quadro base inteiro.
+    employees_list = list(funcionarios_validos(ler_registros(employee_data_file), catalogo_cargos, employee_validator))
 
     if not employees_list:
         print("Nenhum funcionário válido carregado. O programa será encerrado.")
@@ -253,13 +225,15 @@ def main():
             dias_ferias=10, recebe_insalubridade=True
         )
 
-        geraldo_results = payroll_service.calcular_detalhamento_custo_total(
-            employee=geraldo_employee,
-            functions=list(functions_map.values()), # Passa a lista de objetos Funcao
-            global_config=geraldo_global_config,
-            monthly_input=geraldo_monthly_input
+        # Ficha preguiçosa: cada campo é calculado ao ser exibido (o objeto base, compartilhado com o
+        # raio-x e a simulação, não é alterado)
+        geraldo_results = payroll_service.calcular_detalhamento_custo_total_preguicoso(
+            funcionario=geraldo_employee,
+            cargos=catalogo_cargos, # Passa o catálogo de cargos
+            configuracao_global=geraldo_global_config,
+            lancamento_mensal=geraldo_monthly_input
         )
-        exibir_detalhamento_custo_total(geraldo_employee.nome, geraldo_results)
+        exibir_detalhamento_custo_total(geraldo_employee.nome, dict(geraldo_results))
     else:
         print("Funcionário Geraldo não encontrado nos dados carregados.")
 
@@ -271,25 +245,21 @@ def main():
     qpa_current_date = date.today()
     qpa_global_config = construir_configuracao_global_para_data(history_manager, qpa_current_date)
 
-    employees_with_calculated_cost = []
-    for emp in employees_list:
-        emp_copy = copy.deepcopy(emp) # Trabalhe com cópias para não alterar os objetos originais
-        # Para calcular o custo, precisamos de um monthly_input.
-        # Para o raio-x, podemos usar um monthly_input padrão (sem férias, insalubridade, etc.)
-        # ou um input real se você tiver dados mensais para todos.
-        default_monthly_input_for_qpa = LancamentoMensalFuncionario() # Padrão
-        
-        # Chame o cálculo para cada funcionário
-        payroll_service.calcular_detalhamento_custo_total(
-            employee=emp_copy,
-            functions=list(functions_map.values()),
-            global_config=qpa_global_config,
-            monthly_input=default_monthly_input_for_qpa
-        )
-        employees_with_calculated_cost.append(emp_copy)
+    # Para o raio-x, usamos um monthly_input padrão (sem férias, insalubridade, etc.)
+    # e calculamos o quadro em blocos com o motor em lote, acumulando o QPA sem guardar os custos por funcionário.
+    default_monthly_input_for_qpa = LancamentoMensalFuncionario() # Padrão
+    resumo_raio_x = processar_quadro_em_fluxo(
+        funcionarios=employees_list,
+        servico_folha_pagamento=payroll_service,
+        catalogo_cargos=catalogo_cargos,
+        configuracao_global=qpa_global_config,
+        lancamento_mensal=default_monthly_input_for_qpa
+    )
+    print(f"  Funcionários no raio-x: {resumo_raio_x.numero_total_funcionarios}")
+    print(f"  Custo total mensal do raio-x: R$ {resumo_raio_x.custo_total:.2f}")
 
     qpa_generator = GeradorQPA()
-    qpa_actual_data = qpa_generator.generate_qpa_summary(employees_with_calculated_cost)
+    qpa_actual_data = resumo_raio_x.qpa.gerar_resumo()
     qpa_generator.export_qpa_to_csv(qpa_actual_data, current_qpa_output_file)
 
 
@@ -307,152 +277,16 @@ def main():
             acoes_quadro_pessoal=[AcaoQuadroPessoal(**acao) for acao in qpa_scenario_data['acoes_headcount']]
         )
         
-        # Agora o OrcamentoService precisa de PayrollService e HistoryManager para construir GlobalConfig
-        # Ajuste a inicialização do OrcamentoService para receber HistoryManager e o validador.
-        # Se você ainda não tem um OrcamentoService, teríamos que criá-lo.
-        # Pelo seu erro, OrcamentoService não é visível ou não foi definido.
-        # Vamos assumir que OrcamentoService precisa ser criado e vai usar PayrollService e HistoryManager
-        # para simular.
-
-        # --- AQUI É ONDE PRECISAMOS DE UM OrcamentoService ---
-        # Se você já tem um OrcamentoService em core/services.py (que refatoramos antes),
-        # ele precisa ser capaz de receber o PayrollService e o HistoryManager.
-        
-        # Por agora, para que o main.py compile, vou SIMPLIFICAR e fazer a simulação
-        # diretamente aqui, sem uma classe OrcamentoService.
-        # MAS, a melhor prática é ter um OrcamentoService para isso.
-        
-        # Início da Lógica de Simulação no main.py (Temporário, idealmente em OrcamentoService)
-        # Funcionários para a simulação:
-        funcionarios_atuais_simulacao = {e.chapa: copy.deepcopy(e) for e in employees_list}
-        simulacao_mensal_results = {}
-        
-        current_sim_date = date(cenario_qpa.ano_inicio, cenario_qpa.mes_inicio, 1)
-
-        for i in range(cenario_qpa.duracao_meses):
-            mes_simulacao = current_sim_date.month
-            ano_simulacao = current_sim_date.year
-
-            # Construir GlobalConfig para o mês da simulação
-            current_sim_global_config = construir_configuracao_global_para_data(history_manager, current_sim_date)
-
-            # Aplicar ações de headcount para o mês atual
-            acoes_do_mes = [
-                acao for acao in cenario_qpa.acoes_quadro_pessoal
-                if datetime.datetime.strptime(acao.data_efetivacao, "%Y-%m-%d").year == ano_simulacao and
-                   datetime.datetime.strptime(acao.data_efetivacao, "%Y-%m-%d").month == mes_simulacao
-            ]
-
-            for acao in acoes_do_mes:
-                if acao.tipo == "ACRESCIMO_QPA":
-                    # Gerar chapa temporária
-                    temp_chapa_base = max([int(e.chapa) for e in funcionarios_atuais_simulacao.values() if e.chapa.isdigit()]) if funcionarios_atuais_simulacao else 0
-                    
-                    for k in range(acao.quantidade):
-                        new_chapa = str(temp_chapa_base + 1 + k).zfill(5)
-                        # Obter Funcao de acordo com id_funcao
-                        simulated_funcao = functions_map.get(acao.id_funcao)
-                        if not simulated_funcao:
-                            print(f"Aviso: Função simulada '{acao.id_funcao}' não encontrada. Contratação ignorada.")
-                            continue
-
-                        simulated_employee = Funcionario(
-                            chapa=new_chapa,
-                            nome=f"Simulado {simulated_funcao.nome_funcao} {new_chapa}",
-                            situacao="A", # Ativo
-                            codigo_funcao=acao.id_funcao,
-                            data_admissao=datetime.datetime.strptime(acao.data_efetivacao, "%Y-%m-%d"),
-                            data_admissao_pts=datetime.datetime.strptime(acao.data_efetivacao, "%Y-%m-%d"),
-                            data_nascimento=datetime.datetime(1990, 1, 1), # Data de nascimento genérica
-                            secao="99.99.9.99.99.99999", carga_horaria_mensal="220", cpf="00000000000", # Dados genéricos
-                            centro_custo="000000000",
-                            empresa=acao.empresa, equipe=acao.equipe, funcao=simulated_funcao.nome_funcao,
-                            valor_vale_transporte_mensal=acao.valor_vale_transporte_simulado,
-                            valor_vale_refeicao_mensal=acao.valor_vale_refeicao_simulado,
-                            plano_saude_mensal=acao.plano_saude_simulado,
-                            outros_beneficios_mensais=acao.outros_beneficios_simulados
-                        )
-                        funcionarios_atuais_simulacao[new_chapa] = simulated_employee
-                        print(f"  [Simulação {ano_simulacao}/{mes_simulacao:02d}] ACRESCIDO QPA: {simulated_employee.nome} ({simulated_employee.empresa}/{simulated_employee.equipe}/{simulated_employee.funcao})")
-                    temp_chapa_base += acao.quantidade # Atualiza para próxima rodada
-
-                elif acao.tipo == "REDUCAO_QPA":
-                    # Lógica simplificada: remove um número de funcionários do grupo alvo.
-                    # Não se preocupa com quem é removido, apenas com a contagem.
-                    # Pega os IDs/Chapas que correspondem ao grupo
-                    chapas_do_grupo = [
-                        emp.chapa for emp in funcionarios_atuais_simulacao.values()
-                        if emp.empresa == acao.empresa and emp.equipe == acao.equipe and emp.codigo_funcao == acao.id_funcao # Checa codigo_funcao
-                    ]
-                    num_to_remove = min(acao.quantidade, len(chapas_do_grupo))
-                    
-                    if num_to_remove > 0:
-                        # Remove os de maior chapa (mais recentes ou simulados)
-                        chapas_a_remover = sorted(chapas_do_grupo, reverse=True)[:num_to_remove]
-                        for chapa in chapas_a_remover:
-                            if chapa in funcionarios_atuais_simulacao:
-                                removed_name = funcionarios_atuais_simulacao[chapa].nome
-                                del funcionarios_atuais_simulacao[chapa]
-                                print(f"  [Simulação {ano_simulacao}/{mes_simulacao:02d}] REDUÇÃO QPA: {removed_name} ({acao.empresa}/{acao.equipe}/{acao.id_funcao})")
-                        print(f"  Total de {num_to_remove} reduzidos em {acao.empresa}/{acao.equipe}/{acao.id_funcao}.")
-                    else:
-                        print(f"  [Simulação {ano_simulacao}/{mes_simulacao:02d}] Aviso: Nada a reduzir em {acao.empresa}/{acao.equipe}/{acao.id_funcao}.")
-
-            # Preparar funcionários para o cálculo do mês atual da simulação
-            employees_for_current_month_calc = []
-            for emp_chapa, emp_obj in funcionarios_atuais_simulacao.items():
-                emp_copy_for_calc = copy.deepcopy(emp_obj)
-                # Para o cálculo do custo, usar um monthly_input padrão ou real para o mês simulado
-                # O monthly_input_for_sim é simplificado. Em cenário real, viria de dados históricos.
-                monthly_input_for_sim = LancamentoMensalFuncionario() # Default para simulação
-                
-                payroll_service.calcular_detalhamento_custo_total(
-                    employee=emp_copy_for_calc,
-                    functions=list(functions_map.values()),
-                    global_config=current_sim_global_config, # Usa a config do mês da simulação
-                    monthly_input=monthly_input_for_sim
-                )
-                employees_for_current_month_calc.append(emp_copy_for_calc)
-
-            # Criar um objeto OrcamentoMensal (este modelo não existe ainda em core/models.py com este nome)
-            # Você precisaria criar a dataclass OrcamentoMensal em core/models.py para isso funcionar.
-            # Supondo que OrcamentoMensal tem (ano, mes, funcionarios_detalhe)
-            # Para o QPA, o custo total do orçamento será a soma do custo total de cada funcionário.
-            total_custo_mensal_simulacao = sum(emp.custo_total_mensal for emp in employees_for_current_month_calc)
-            
-            # Precisamos da classe OrcamentoMensal. Se não tiver no entities, vamos precisar criar.
-            # Por agora, para não quebrar, vamos usar um dicionário simples.
-            # O ideal é ter a classe OrcamentoMensal em core/models.py
-            # from core.models import OrcamentoMensal # Importar OrcamentoMensal aqui se ela existir
-
-            simulacao_mensal_results[f"{ano_simulacao}-{mes_simulacao:02d}"] = {
-                "ano": ano_simulacao,
-                "mes": mes_simulacao,
-                "numero_total_funcionarios": len(employees_for_current_month_calc),
-                "custo_total_orcamento": total_custo_mensal_simulacao,
-                "funcionarios_detalhe": employees_for_current_month_calc # Lista de objetos Employee calculados
-            }
-            
-            current_sim_date += datetime.timedelta(days=30) # Avança 1 mês (simplificado)
-
-        # Preparar resultado final da simulação para display_simulacao_scenario
-        final_sim_data = {
-            "nome_cenario": cenario_qpa.nome_cenario,
-            "periodo_simulacao": f"{cenario_qpa.ano_inicio}-{cenario_qpa.mes_inicio:02d} a {ano_simulacao}-{mes_simulacao:02d}",
-            "custo_total_simulado": sum(r["custo_total_orcamento"] for r in simulacao_mensal_results.values()),
-            "detalhes_mensais": simulacao_mensal_results
-        }
-        exibir_cenario_simulacao(final_sim_data)
-
+        # O OrcamentoService simula o cenário mês a mês; a configuração global vem da linha do tempo,
+        # reconstruída só quando algum parâmetro histórico muda.
+        linha_do_tempo_configuracao = LinhaDoTempoConfiguracao(history_manager)
+        orcamento_service = OrcamentoService(payroll_service, linha_do_tempo_configuracao, catalogo_cargos)
+        resultado_simulacao = orcamento_service.simular(cenario_qpa, employees_list)
+        exibir_cenario_simulacao(resultado_simulacao)
 
         # Geração do QPA resultante da simulação (para o último mês)
-        if simulacao_mensal_results:
-            last_month_key = sorted(simulacao_mensal_results.keys())[-1]
-            last_month_sim_data = simulacao_mensal_results[last_month_key]
-            
-            # O gerador de QPA precisa de uma lista de objetos Funcionario, não de dicionários.
-            # Ajuste aqui para pegar os objetos Employee calculados.
-            qpa_simulado_data = qpa_generator.generate_qpa_summary(last_month_sim_data["funcionarios_detalhe"])
+        if resultado_simulacao.meses:
+            qpa_simulado_data = qpa_generator.generate_qpa_summary(resultado_simulacao.quadro_final.registros())
             qpa_generator.export_qpa_to_csv(qpa_simulado_data, simulated_qpa_output_file)
 
     except FileNotFoundError as e:
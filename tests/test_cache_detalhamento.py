@@ -0,0 +1,88 @@
+import pytest
+from dataclasses import replace
+from datetime import date, datetime
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.catalogo_cargos import CatalogoCargos
+from core.cache_detalhamento import CacheDetalhamento
+from core.payroll_rules import ServicoFolhaPagamento
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str = "0001", plano: float = 50.0) -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe="Operacao", funcao="Cargo",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=plano, outros_beneficios_mensais=0.0
+    )
+
+
+@pytest.fixture
+def catalogo_cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo A", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Cargo B", salario=3000.00),
+    ])
+
+
+@pytest.fixture
+def configuracao_global():
+    return ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30), salario_minimo=1412.00, percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08, aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+
+
+def test_funcionarios_com_as_mesmas_entradas_compartilham_a_ficha(catalogo_cargos, configuracao_global):
+    cache = CacheDetalhamento()
+    servico = ServicoFolhaPagamento(cache_detalhamento=cache)
+    lancamento = LancamentoMensalFuncionario()
+    primeiro, segundo, outro = criar_funcionario("00001"), criar_funcionario("00002"), criar_funcionario("00003", plano=80.0)
+
+    ficha_primeiro = servico.calcular_detalhamento_custo_total(primeiro, catalogo_cargos, configuracao_global, lancamento)
+    ficha_segundo = servico.calcular_detalhamento_custo_total(segundo, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario())
+    ficha_outro = servico.calcular_detalhamento_custo_total(outro, catalogo_cargos, configuracao_global, lancamento)
+
+    assert ficha_primeiro is ficha_segundo
+    assert ficha_outro is not ficha_primeiro
+    assert (cache.acertos, cache.falhas) == (1, 2)
+    assert ficha_primeiro == ServicoFolhaPagamento().calcular_detalhamento_custo_total(primeiro, catalogo_cargos, configuracao_global, lancamento)
+    assert segundo.custo_total_mensal == ficha_primeiro["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+    with pytest.raises(TypeError):
+        ficha_primeiro["SALARIO_BASE"] = 0.0
+
+
+def test_chave_considera_salario_configuracao_e_lancamento(catalogo_cargos, configuracao_global):
+    cache = CacheDetalhamento()
+    servico = ServicoFolhaPagamento(cache_detalhamento=cache)
+    funcionario = criar_funcionario("00001")
+    lancamento = LancamentoMensalFuncionario()
+
+    servico.calcular_detalhamento_custo_total(funcionario, catalogo_cargos, configuracao_global, lancamento)
+    servico.calcular_detalhamento_custo_total(criar_funcionario("00002", codigo_funcao="0002"), catalogo_cargos, configuracao_global, lancamento)
+    servico.calcular_detalhamento_custo_total(funcionario, catalogo_cargos, replace(configuracao_global, salario_minimo=1518.00), lancamento)
+    servico.calcular_detalhamento_custo_total(funcionario, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario(dias_ferias=10))
+    # A data de cálculo e campos do lançamento que não entram no cálculo não mudam a chave
+    servico.calcular_detalhamento_custo_total(funcionario, catalogo_cargos, replace(configuracao_global, data_calculo=date(2025, 5, 31)), LancamentoMensalFuncionario(horas_extras_50_porcento=5.0))
+
+    assert (cache.acertos, cache.falhas) == (1, 4)
+
+
+def test_cache_descarta_a_ficha_usada_ha_mais_tempo():
+    cache = CacheDetalhamento(capacidade=2)
+    cache.obter_ou_calcular(("a",), lambda: {"TOTAL": 1.0})
+    cache.obter_ou_calcular(("b",), lambda: {"TOTAL": 2.0})
+    cache.obter_ou_calcular(("a",), lambda: {"TOTAL": -1.0})
+    cache.obter_ou_calcular(("c",), lambda: {"TOTAL": 3.0})
+
+    assert len(cache) == 2
+    assert cache.obter_ou_calcular(("a",), lambda: {"TOTAL": -1.0})["TOTAL"] == 1.0
+    assert cache.obter_ou_calcular(("b",), lambda: {"TOTAL": 20.0})["TOTAL"] == 20.0
+    assert (cache.acertos, cache.falhas) == (2, 4)
+    cache.limpar()
+    assert len(cache) == 0 and (cache.acertos, cache.falhas) == (0, 0)
+    with pytest.raises(ValueError):
+        CacheDetalhamento(capacidade=0)
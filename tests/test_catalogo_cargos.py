@@ -0,0 +1,68 @@
+import pytest
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_rules import ServicoFolhaPagamento
+from datetime import date, datetime
+from core.entities import Cargo, ConfiguracaoGlobal, Funcionario, LancamentoMensalFuncionario
+from core import formulas
+
+
+@pytest.fixture
+def catalogo():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo Teste", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Outro Cargo", salario=3000.00),
+    ])
+
+
+def test_catalogo_busca_cargo_e_salario_por_codigo(catalogo):
+    assert catalogo.obter("0002").nome_funcao == "Outro Cargo"
+    assert catalogo.obter_salario("0001") == 5000.00
+    assert catalogo.obter("9999") is None
+    assert catalogo.obter_salario("9999") == 0.0
+    assert "0001" in catalogo and len(catalogo) == 2
+
+
+def test_catalogo_salario_hora_igual_a_formula(catalogo):
+    """O salário-hora pré-calculado deve ser o mesmo da fórmula pura, inclusive para jornadas fora do padrão."""
+    for jornada in (220, 150, 75, 180):
+        assert catalogo.obter_salario_hora("0001", jornada) == formulas.calcular_salario_hora(5000.00, jornada)
+    assert catalogo.obter_salario_hora("9999", 220) == 0.0
+
+
+def test_catalogo_mantem_primeiro_cargo_em_codigo_duplicado():
+    """Como na busca sequencial pela lista, o primeiro cargo com o código vence."""
+    catalogo = CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Primeiro", salario=1000.00),
+        Cargo(codigo_funcao="0001", nome_funcao="Segundo", salario=2000.00),
+    ])
+    assert catalogo.obter_salario("0001") == 1000.00
+
+
+def test_de_cargos_reaproveita_catalogo_existente(catalogo):
+    assert CatalogoCargos.de_cargos(catalogo) is catalogo
+    assert [c.codigo_funcao for c in CatalogoCargos.de_cargos(list(catalogo))] == ["0001", "0002"]
+
+
+def test_lote_com_lista_monta_o_catalogo_uma_vez_por_chamada(monkeypatch):
+    """Com uma list[Cargo], o catálogo é montado no ponto de entrada do lote, não a cada funcionário."""
+    montagens = []
+    adicionar_original = CatalogoCargos.adicionar
+    monkeypatch.setattr(CatalogoCargos, "adicionar", lambda self, cargo: (montagens.append(cargo), adicionar_original(self, cargo)))
+    cargos = [Cargo(codigo_funcao=str(i).zfill(4), nome_funcao=f"Cargo {i}", salario=1000.0 + i) for i in range(50)]
+    funcionarios = [
+        Funcionario(
+            chapa=str(i).zfill(5), nome=f"Funcionario {i}", situacao="A", codigo_funcao=str(i % 50).zfill(4),
+            data_admissao=datetime(2020, 1, 1), data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+            secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+            centro_custo="123456789", empresa="Matriz", equipe="Operacao", funcao=f"Cargo {i % 50}",
+            valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0, plano_saude_mensal=50.0, outros_beneficios_mensais=0.0
+        )
+        for i in range(200)
+    ]
+    configuracao = ConfiguracaoGlobal(
+        data_calculo=date(2025, 6, 1), salario_minimo=1412.00, percentual_insalubridade=0.40, aliquota_fgts_patronal=0.08,
+        aliquota_inss_patronal_media=0.22, percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+
+    ServicoFolhaPagamento().calcular_custos_totais_lote(funcionarios, cargos, configuracao, LancamentoMensalFuncionario())
+    assert len(montagens) == len(cargos)
@@ -1,6 +1,11 @@
 from datetime import date
 import pytest
-from core.config import get_historical_value
+from dataclasses import replace
+from core.config import (
+    get_historical_value, construir_configuracao_global_para_data, LinhaDoTempoConfiguracao, parametros_alterados,
+    construir_parametros_para_datas, obter_valores_historicos_nas_datas
+)
+from core.history_manager import GerenciadorHistorico
 from core.entities import ParametroHistorico, ConfiguracaoGlobal
 
 @pytest.fixture
@@ -37,4 +42,94 @@ def test_create_global_config():
 
     # Assert
     assert config.salario_minimo == 1918.00
-    assert config.percentual_insalubridade == 0.40
\ No newline at end of file
+    assert config.percentual_insalubridade == 0.40
+
+@pytest.fixture
+def gerenciador_historico():
+    return GerenciadorHistorico([
+        {"id": 1, "parameter_name": "minimum_wage", "value": 1320.00, "start_date": "2023-01-01", "end_date": "2023-12-31"},
+        {"id": 2, "parameter_name": "minimum_wage", "value": 1412.00, "start_date": "2024-01-01", "end_date": None},
+        {"id": 3, "parameter_name": "aliquota_fgts_empresa", "value": 0.08, "start_date": "2000-01-01", "end_date": None},
+        {"id": 4, "parameter_name": "aliquota_inss_patronal_media", "value": 0.20, "start_date": "2010-01-01", "end_date": "2024-02-29"},
+        {"id": 5, "parameter_name": "aliquota_inss_patronal_media", "value": 0.22, "start_date": "2024-03-01", "end_date": None},
+        {"id": 6, "parameter_name": "insalubrity_percent", "value": 0.40, "start_date": "2000-01-01", "end_date": None},
+        {"id": 7, "parameter_name": "percentual_terco_ferias", "value": (1/3), "start_date": "1988-10-05", "end_date": None},
+        {"id": 8, "parameter_name": "meses_do_ano", "value": 12, "start_date": "1900-01-01", "end_date": None},
+        {"id": 9, "parameter_name": "parametro_auxiliar", "value": 1.0, "start_date": "2024-06-01", "end_date": None},
+    ])
+
+
+def test_linha_do_tempo_constroi_uma_configuracao_por_periodo(gerenciador_historico):
+    """Meses do mesmo período compartilham os parâmetros; só mudanças de parâmetro geram outra configuração."""
+    linha_do_tempo = LinhaDoTempoConfiguracao(gerenciador_historico)
+
+    configuracoes = [linha_do_tempo.obter(2023 + (mes - 1) // 12, (mes - 1) % 12 + 1) for mes in range(1, 37)]
+
+    assert parametros_alterados(configuracoes[0], configuracoes[11]) == ()    # 2023 inteiro
+    assert parametros_alterados(configuracoes[12], configuracoes[13]) == ()   # jan-fev/2024
+    assert parametros_alterados(configuracoes[14], configuracoes[35]) == ()   # a partir de mar/2024 (parametro_auxiliar não entra na config)
+    assert linha_do_tempo.quantidade_configuracoes == 3
+    assert configuracoes[13].aliquota_inss_patronal_media == 0.20
+    assert configuracoes[14].aliquota_inss_patronal_media == 0.22
+    assert linha_do_tempo.obter(2024, 7) is configuracoes[18]
+
+
+def test_data_calculo_e_a_da_consulta(gerenciador_historico):
+    """Configurações com os mesmos parâmetros não carregam o data_calculo de quem as criou primeiro."""
+    linha_do_tempo = LinhaDoTempoConfiguracao(gerenciador_historico)
+    assert linha_do_tempo.obter(2023, 2).data_calculo == date(2023, 2, 1)
+    assert linha_do_tempo.obter(2023, 9).data_calculo == date(2023, 9, 1)
+    assert linha_do_tempo.obter_na_data(date(2023, 9, 17)).data_calculo == date(2023, 9, 17)
+    assert linha_do_tempo.obter(2023, 2).data_calculo == date(2023, 2, 1)
+
+
+
+def test_segmentos_mensais_cobrem_o_horizonte_com_a_configuracao_de_cada_mes(gerenciador_historico):
+    """Um trecho por configuração distinta; mudanças que não alteram a config (parametro_auxiliar) não dividem."""
+    linha_do_tempo = LinhaDoTempoConfiguracao(gerenciador_historico)
+    segmentos = linha_do_tempo.segmentos_mensais(2023, 11, 12)
+
+    assert [(s.deslocamento, s.quantidade_meses) for s in segmentos] == [(0, 2), (2, 2), (4, 8)]
+    for segmento in segmentos:
+        for deslocamento in range(segmento.deslocamento, segmento.deslocamento + segmento.quantidade_meses):
+            ano, mes = divmod(2023 * 12 + 10 + deslocamento, 12)
+            assert parametros_alterados(linha_do_tempo.obter(ano, mes + 1), segmento.configuracao) == ()
+        ano, mes = divmod(2023 * 12 + 10 + segmento.deslocamento, 12)
+        assert segmento.configuracao.data_calculo == date(ano, mes + 1, 1)
+    assert linha_do_tempo.segmentos_mensais(2024, 4, 0) == []
+
+
+def test_linha_do_tempo_bate_com_construcao_direta(gerenciador_historico):
+    linha_do_tempo = LinhaDoTempoConfiguracao(gerenciador_historico)
+    for ano, mes in [(2023, 5), (2024, 1), (2024, 3), (2026, 12)]:
+        esperada = construir_configuracao_global_para_data(gerenciador_historico, date(ano, mes, 1))
+        obtida = linha_do_tempo.obter(ano, mes)
+        assert obtida == esperada
+
+
+def test_linha_do_tempo_sem_parametros_obrigatorios_falha(gerenciador_historico):
+    linha_do_tempo = LinhaDoTempoConfiguracao(gerenciador_historico)
+    with pytest.raises(ValueError):
+        linha_do_tempo.obter(2022, 6)
+
+
+def test_parametros_alterados_ignora_a_data_de_calculo(gerenciador_historico):
+    janeiro = construir_configuracao_global_para_data(gerenciador_historico, date(2025, 1, 10))
+    assert parametros_alterados(janeiro, replace(janeiro, data_calculo=date(2025, 1, 20))) == ()
+    assert parametros_alterados(janeiro, replace(janeiro, salario_minimo=9999.0, meses_do_ano=13)) == ("salario_minimo", "meses_do_ano")
+
+
+def test_parametros_para_datas_batem_com_a_configuracao_de_cada_data(gerenciador_historico, minimum_wage_history):
+    datas = [date(2024, 12, 1), date(2025, 1, 1), date(2025, 6, 15)]
+    colunas = construir_parametros_para_datas(gerenciador_historico, datas)
+    for posicao, check_date in enumerate(datas):
+        configuracao = construir_configuracao_global_para_data(gerenciador_historico, check_date)
+        assert {campo: float(valores[posicao]) for campo, valores in colunas.items()} == {
+            campo: getattr(configuracao, campo) for campo in colunas
+        }
+    with pytest.raises(ValueError):
+        construir_parametros_para_datas(gerenciador_historico, [date(1990, 1, 1)])
+
+    consultas = [date(2023, 6, 1), date(2024, 6, 1)]
+    esperado = [get_historical_value(minimum_wage_history, d) for d in consultas]
+    assert obter_valores_historicos_nas_datas(minimum_wage_history, consultas).tolist() == esperado
@@ -0,0 +1,30 @@
+import numpy as np
+from core import dinheiro, formulas
+
+
+def test_para_centavos_e_para_reais():
+    assert dinheiro.para_centavos(5202.76) == 520276
+    assert dinheiro.para_centavos(0.29) == 29
+    assert dinheiro.para_centavos(1.005) == 101
+    assert dinheiro.para_centavos_array(np.array([5202.76, 0.29, 1.005])).tolist() == [520276, 29, 101]
+    assert dinheiro.para_reais(520276) == 5202.76
+
+
+def test_arredondamento_meio_para_cima():
+    assert dinheiro.arredondar_meio_para_cima(12.5) == 13
+    assert dinheiro.arredondar_meio_para_cima(12.4999999999) == 13  # meio centavo perdido no ponto flutuante
+    assert dinheiro.arredondar_meio_para_cima(12.49) == 12
+    assert dinheiro.arredondar_meio_para_cima(np.array([12.5, 12.49, 0.0])).tolist() == [13, 12, 0]
+
+
+def test_dividir_arredondando_e_exata():
+    assert dinheiro.dividir_arredondando(100, 12) == 8      # 8,33
+    assert dinheiro.dividir_arredondando(102, 12) == 9      # 8,5
+    assert dinheiro.dividir_arredondando(np.array([100, 102, 0]), 12).tolist() == [8, 9, 0]
+
+
+def test_formulas_em_centavos_arredondam_cada_evento():
+    assert formulas.calcular_valor_fgts_centavos(520276, 0.08) == 41622          # 41622,08
+    assert formulas.calcular_inss_patronal_centavos(520276, 0.22) == 114461      # 114460,72
+    assert formulas.calcular_provisao_decimo_terceiro_salario_centavos(520276, 12) == 43356  # 43356,33
+    assert formulas.calcular_provisao_ferias_centavos(520276, 1 / 3, 12) == 57808            # 57808,44
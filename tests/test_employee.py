@@ -67,4 +67,17 @@ def test_funcionario_inativo_retorna_falso(dados_funcionario_valido):
     dados_para_teste["SITUACAO"] = "F"
     dados_validados = validador.validate(dados_para_teste)
     funcionario = Funcionario(**dados_validados)
-    assert funcionario.is_active() is False
\ No newline at end of file
+    assert funcionario.is_active() is False
+
+def test_funcionario_compacto_com_textos_internalizados(dados_funcionario_valido):
+    """Funcionario não tem __dict__ por instância, e os textos repetidos são a mesma string."""
+    validador = ValidadorDadosFuncionario()
+    primeiro = Funcionario(**validador.validate(dados_funcionario_valido))
+    dados_funcionario_valido["CHAPA"] = "99998"
+    # Textos montados em tempo de execução não seriam a mesma string sem a internalização
+    dados_funcionario_valido["EMPRESA"] = "".join(["Empresa ", "Teste"])
+    segundo = Funcionario(**validador.validate(dados_funcionario_valido))
+
+    assert not hasattr(primeiro, "__dict__")
+    assert primeiro.empresa is segundo.empresa
+    assert primeiro.equipe is segundo.equipe and primeiro.centro_custo is segundo.centro_custo
@@ -96,13 +96,13 @@ def test_calcular_inss_patronal_salario_base_zero_retorna_zero():
     assert formulas.calcular_inss_patronal(0, 0.20) == 0.0
 
 def test_calcular_provisao_ferias_padrao():
-    assert formulas.calcular_provisao_ferias(1000, (1/3), 12) == pytest.approx(111.11, abs=1e-2)
+    assert formulas.calcular_provisao_ferias(1000, (1/3), 12) == 111.11
 
 def test_calcular_provisao_ferias_salario_base_zero_retorna_zero():
     assert formulas.calcular_provisao_ferias(0, (1/3), 12) == 0.0
 
 def test_calcular_provisao_decimo_terceiro_salario_padrao():
-    assert formulas.calcular_provisao_decimo_terceiro_salario(1000, 12) == pytest.approx(83.33, abs=1e-2)
+    assert formulas.calcular_provisao_decimo_terceiro_salario(1000, 12) == 83.33
 
 def test_calcular_provisao_decimo_terceiro_salario_zero_retorna_zero():
     assert formulas.calcular_provisao_decimo_terceiro_salario(0, 12) == 0.0
@@ -130,3 +130,15 @@ def test_calcular_adicional_periculosidade_formula_padrao():
 
 def test_calcular_adicional_periculosidade_formula_valor_base_zero():
     assert formulas.calcular_adicional_periculosidade_formula(0.00, 0.30) == 0.00
+
+def test_calcular_gratificacao_proporcional_as_horas():
+    assert formulas.calcular_gratificacao(800.00, 180, 220) == 654.55
+
+def test_calcular_gratificacao_sem_jornada_retorna_zero():
+    assert formulas.calcular_gratificacao(800.00, 180, 0) == 0.0
+
+def test_calcular_hora_s_aviso_padrao():
+    assert formulas.calcular_hora_s_aviso(5000.00, 220, 7.5) == 170.45
+
+def test_calcular_total_proventos_com_adicionais():
+    assert formulas.calcular_total_proventos(2000, 600, adicional_periculosidade=150, adicional_noturno=10, gratificacao=5, hora_s_aviso=1) == 2766.0
@@ -0,0 +1,79 @@
+import pytest
+from datetime import date
+import numpy as np
+from core.entities import ConfiguracaoGlobal
+from core.grafo_eventos import EventoFolha, GrafoEventos
+from core.payroll_batch import GRAFO_EVENTOS_FOLHA, CAMPOS_DETALHAMENTO
+
+
+@pytest.fixture
+def configuracao_global():
+    return ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30), salario_minimo=1412.00, percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08, aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+
+
+def evento(nome, dependencias, calcular, gatilhos=()):
+    return EventoFolha(nome, dependencias=dependencias, calcular=calcular, gatilhos=gatilhos)
+
+
+def test_plano_tem_so_os_eventos_necessarios_em_ordem():
+    plano = GRAFO_EVENTOS_FOLHA.compilar(["TOTAL_CUSTO_FINAL_DO_EMPREGADO"])
+    nomes = [e.nome for e in plano.eventos]
+
+    assert "TOTAL_PROVENTOS" not in nomes and "EV_ADIC_NOTURNO" not in nomes
+    assert nomes.index("SALARIO_BASE") < nomes.index("ENCARGO_FGTS") < nomes.index("TOTAL_ENCARGOS_E_PROVISOES")
+    assert nomes[-1] == "TOTAL_CUSTO_FINAL_DO_EMPREGADO"
+    assert "dias_ferias" not in plano.entradas
+    assert GRAFO_EVENTOS_FOLHA.compilar(["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]) is plano  # compilado uma única vez
+
+    noturno = [e.nome for e in GRAFO_EVENTOS_FOLHA.compilar(["EV_ADIC_NOTURNO"]).eventos]
+    assert noturno.index("EV_ADIC_INSALUBRIDADE") < noturno.index("EV_ADIC_NOTURNO")
+    assert noturno.index("EV_ADIC_PERICULOSIDADE") < noturno.index("EV_ADIC_NOTURNO")
+    assert set(GRAFO_EVENTOS_FOLHA.compilar(CAMPOS_DETALHAMENTO).saidas) == set(CAMPOS_DETALHAMENTO)
+
+
+def test_evento_com_gatilho_zerado_no_lote_nao_e_calculado(configuracao_global):
+    chamadas = []
+
+    def dobrar(valores, configuracao):
+        chamadas.append(1)
+        return valores["horas"] * 2
+
+    grafo = GrafoEventos([
+        evento("DOBRO", ("horas",), dobrar, gatilhos=("horas",)),
+        evento("TOTAL", ("DOBRO", "base"), lambda v, c: v["DOBRO"] + v["base"]),
+    ])
+    plano = grafo.compilar(["TOTAL"])
+
+    resultado = plano.executar({"horas": np.zeros(3, dtype=np.int64), "base": np.array([100, 200, 300])}, configuracao_global, em_centavos=True)
+    assert chamadas == []
+    assert resultado["TOTAL"].tolist() == [100, 200, 300]
+    assert list(resultado) == ["TOTAL"]
+
+    resultado = plano.executar({"horas": np.array([0, 1, 0]), "base": np.zeros(3, dtype=np.int64)}, configuracao_global)
+    assert chamadas == [1]
+    assert resultado["TOTAL"].tolist() == [0.0, 0.02, 0.0]  # em reais: os mesmos centavos, convertidos no fim
+
+
+def test_grafo_invalido(configuracao_global):
+    with pytest.raises(ValueError):
+        GrafoEventos([evento("A", ("B",), lambda v, c: v["B"]), evento("B", ("A",), lambda v, c: v["A"])])
+    with pytest.raises(ValueError):
+        GRAFO_EVENTOS_FOLHA.compilar(["EVENTO_INEXISTENTE"])
+    with pytest.raises(ValueError):
+        GrafoEventos([evento("A", ("x",), lambda v, c: v["x"], gatilhos=("y",))])
+    with pytest.raises(ValueError):
+        GRAFO_EVENTOS_FOLHA.compilar(["TOTAL_BENEFICIOS"]).executar({"plano_saude_mensal": np.zeros(1)}, configuracao_global)
+
+
+def test_eventos_afetados_por_parametros():
+    assert GRAFO_EVENTOS_FOLHA.eventos_afetados(["salario_minimo"]) == {
+        "EV_ADIC_INSALUBRIDADE", "EV_ADIC_NOTURNO", "TOTAL_PROVENTOS"
+    }
+    assert GRAFO_EVENTOS_FOLHA.eventos_afetados(["aliquota_fgts_patronal"]) == {
+        "ENCARGO_FGTS", "TOTAL_ENCARGOS_E_PROVISOES", "TOTAL_CUSTO_FINAL_DO_EMPREGADO"
+    }
+    assert GRAFO_EVENTOS_FOLHA.eventos_afetados([]) == set()
@@ -0,0 +1,149 @@
+import pytest
+import random
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+import numpy as np
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, VigenciaCadastral, CoorteContratacao
+from core.historico_cadastral import HistoricoCadastral, CAMPOS_VIGENCIA_FUNCIONARIO
+from core.payroll_batch import montar_colunas_funcionarios
+from core.payroll_rules import ServicoFolhaPagamento
+from core.tabela_funcionarios import TabelaFuncionarios
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str) -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe="Operacao", funcao="Cargo",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=50.0, outros_beneficios_mensais=0.0
+    )
+
+
+@pytest.fixture
+def cargos():
+    return [
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo A", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Cargo B", salario=3000.00),
+    ]
+
+
+@pytest.fixture
+def historico():
+    return HistoricoCadastral.de_dados_brutos([
+        {"id": 1, "nivel": "CARGO", "chave": "0001", "campo": "salario", "value": 4500.00, "start_date": "2024-01-01", "end_date": "2024-12-31"},
+        {"id": 2, "nivel": "CARGO", "chave": "0001", "campo": "salario", "value": 4800.00, "start_date": "2025-01-01", "end_date": None},
+        {"id": 3, "nivel": "FUNCIONARIO", "chave": "00002", "campo": "plano_saude_mensal", "value": 80.0, "start_date": "2024-07-01", "end_date": None},
+        {"id": 4, "nivel": "FUNCIONARIO", "chave": "00003", "campo": "valor_vale_refeicao_mensal", "value": 420.0, "start_date": "2025-03-01", "end_date": None},
+    ])
+
+
+def test_consulta_em_lote_bate_com_a_vigencia_prevalente():
+    """Para cada (chave, data), vale a vigência ativa de início mais recente; em empate, a primeira carregada."""
+    gerador = random.Random(5)
+    base = date(2022, 1, 1)
+    chapas = [str(i).zfill(5) for i in range(15)]
+    vigencias = []
+    for i in range(120):
+        inicio = base + timedelta(days=gerador.randint(0, 900))
+        fim = inicio + timedelta(days=gerador.randint(0, 200)) if gerador.random() < 0.5 else None
+        vigencias.append(VigenciaCadastral(i, "FUNCIONARIO", gerador.choice(chapas), "plano_saude_mensal",
+                                           float(gerador.randint(1, 6)), inicio, fim))
+    historico = HistoricoCadastral(vigencias)
+
+    consultadas = chapas + ["sem_vigencia"]
+    for deslocamento in range(-10, 1200, 37):
+        check_date = base + timedelta(days=deslocamento)
+        obtidos = historico.valores_nas_datas("plano_saude_mensal", consultadas, check_date)
+        for chapa, obtido in zip(consultadas, obtidos):
+            esperada = None
+            for vigencia in vigencias:
+                if vigencia.chave == chapa and vigencia.is_active_on_date(check_date) \
+                        and (esperada is None or vigencia.data_inicio > esperada.data_inicio):
+                    esperada = vigencia
+            assert (None if np.isnan(obtido) else obtido) == (esperada.valor if esperada else None)
+
+    # Uma data por posição dá o mesmo que consultar cada data separadamente
+    datas = [base + timedelta(days=gerador.randint(0, 1000)) for _ in chapas]
+    por_posicao = historico.valores_nas_datas("plano_saude_mensal", chapas, datas)
+    separadas = [historico.valores_nas_datas("plano_saude_mensal", [c], d)[0] for c, d in zip(chapas, datas)]
+    np.testing.assert_array_equal(por_posicao, separadas)
+
+
+def test_colunas_na_data_usam_a_vigencia_ou_o_valor_atual(historico, cargos):
+    funcionarios = [criar_funcionario("00001", "0001"), criar_funcionario("00002", "0002"), criar_funcionario("00003", "0001")]
+    coorte = CoorteContratacao(primeira_chapa=90001, quantidade=2, codigo_funcao="0001", funcao="Cargo", empresa="Matriz",
+                               equipe="Operacao", data_admissao=datetime(2025, 1, 1), salario_base_simulado=6000.0)
+    registros = funcionarios + [coorte]
+    colunas = montar_colunas_funcionarios(registros, cargos, LancamentoMensalFuncionario())
+
+    em_2023 = historico.colunas_na_data(registros, colunas, date(2023, 6, 1))
+    assert em_2023["salario_base"].tolist() == [5000.0, 3000.0, 5000.0, 6000.0]
+    em_2025 = historico.colunas_na_data(registros, colunas, date(2025, 3, 15))
+    assert em_2025["salario_base"].tolist() == [4800.0, 3000.0, 4800.0, 6000.0]  # coorte mantém o salário simulado
+    assert em_2025["plano_saude_mensal"][:3].tolist() == [50.0, 80.0, 50.0]
+    assert em_2025["valor_vale_refeicao_mensal"][:3].tolist() == [300.0, 300.0, 420.0]
+    assert colunas["salario_base"].tolist() == [5000.0, 3000.0, 5000.0, 6000.0]  # colunas originais intactas
+
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    colunas_tabela = montar_colunas_funcionarios(tabela, cargos, LancamentoMensalFuncionario())
+    da_tabela = historico.colunas_na_data(tabela, colunas_tabela, date(2025, 3, 15))
+    for campo in ["salario_base"] + list(CAMPOS_VIGENCIA_FUNCIONARIO):
+        np.testing.assert_array_equal(da_tabela[campo], em_2025[campo][:3])
+
+
+def test_tabela_e_lista_do_mesmo_quadro_dao_as_mesmas_colunas(historico, cargos):
+    """A regra é a mesma nos dois caminhos, com uma data para todos ou uma data por linha."""
+    funcionarios = [criar_funcionario(str(i).zfill(5), "0001" if i % 3 else "0002") for i in range(1, 10)]
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    lancamento = LancamentoMensalFuncionario()
+    colunas_lista = montar_colunas_funcionarios(funcionarios, cargos, lancamento)
+    colunas_tabela = montar_colunas_funcionarios(tabela, cargos, lancamento)
+    por_linha = [date(2023, 1, 1) + timedelta(days=97 * i) for i in range(len(funcionarios))]
+
+    for datas in (date(2023, 6, 1), date(2024, 8, 1), date(2025, 3, 15), por_linha):
+        da_lista = historico.colunas_na_data(funcionarios, colunas_lista, datas)
+        da_tabela = historico.colunas_na_data(tabela, colunas_tabela, datas)
+        for campo in ["salario_base"] + list(CAMPOS_VIGENCIA_FUNCIONARIO):
+            np.testing.assert_array_equal(da_tabela[campo], da_lista[campo])
+
+
+def test_custos_nas_datas_batem_com_o_quadro_montado_em_cada_data(historico, cargos):
+    """O custo em cada data deve ser o mesmo de montar cargos e funcionários com os valores vigentes nela."""
+    funcionarios = [criar_funcionario(str(i).zfill(5), "0001" if i % 2 else "0002") for i in range(1, 8)]
+    datas = [date(2023, 12, 1), date(2024, 8, 1), date(2025, 4, 1)]
+    configuracoes = [
+        ConfiguracaoGlobal(data_calculo=d, salario_minimo=1412.00, percentual_insalubridade=0.40, aliquota_fgts_patronal=0.08,
+                           aliquota_inss_patronal_media=0.20 + 0.01 * i, percentual_terco_ferias=(1/3), meses_do_ano=12)
+        for i, d in enumerate(datas)
+    ]
+    lancamento = LancamentoMensalFuncionario(recebe_insalubridade=True)
+    servico = ServicoFolhaPagamento()
+
+    totais = servico.calcular_custos_totais_nas_datas(funcionarios, cargos, historico, datas, configuracoes, lancamento)
+
+    for data_referencia, configuracao, total in zip(datas, configuracoes, totais):
+        salarios = historico.salarios_nas_datas([cargo.codigo_funcao for cargo in cargos], data_referencia)
+        cargos_na_data = [cargo if np.isnan(salario) else replace(cargo, salario=salario) for cargo, salario in zip(cargos, salarios)]
+        funcionarios_na_data = []
+        for funcionario in funcionarios:
+            ajustado = replace(funcionario)
+            for campo in CAMPOS_VIGENCIA_FUNCIONARIO:
+                valor = historico.valores_nas_datas(campo, [funcionario.chapa], data_referencia)[0]
+                if not np.isnan(valor):
+                    setattr(ajustado, campo, valor)
+            funcionarios_na_data.append(ajustado)
+        _, esperado = servico.calcular_custo_total_ponderado_lote_centavos(funcionarios_na_data, cargos_na_data, configuracao, lancamento)
+        assert total == esperado
+
+    with pytest.raises(ValueError):
+        servico.calcular_custos_totais_nas_datas(funcionarios, cargos, historico, datas, configuracoes[:1], lancamento)
+
+
+def test_campo_sem_vigencia_no_nivel_e_rejeitado():
+    with pytest.raises(ValueError):
+        HistoricoCadastral([VigenciaCadastral(1, "FUNCIONARIO", "00001", "salario", 1.0, date(2024, 1, 1))])
+    with pytest.raises(ValueError):
+        VigenciaCadastral(1, "SETOR", "x", "salario", 1.0, date(2024, 1, 1))
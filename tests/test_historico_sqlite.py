@@ -0,0 +1,116 @@
+import pickle
+import random
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from core.history_manager import GerenciadorHistorico
+from core.historico_sqlite import GerenciadorHistoricoSQLite
+from core.config import LinhaDoTempoConfiguracao
+
+
+@pytest.fixture
+def gerenciador_historico_dados():
+    return [
+        {"id": 1, "parameter_name": "minimum_wage", "value": 1320.00, "start_date": "2023-01-01", "end_date": "2023-12-31"},
+        {"id": 2, "parameter_name": "minimum_wage", "value": 1412.00, "start_date": "2024-01-01", "end_date": None},
+        {"id": 3, "parameter_name": "aliquota_fgts_empresa", "value": 0.08, "start_date": "2000-01-01", "end_date": None},
+        {"id": 4, "parameter_name": "aliquota_inss_patronal_media", "value": 0.20, "start_date": "2010-01-01", "end_date": "2024-02-29"},
+        {"id": 5, "parameter_name": "aliquota_inss_patronal_media", "value": 0.22, "start_date": "2024-03-01", "end_date": None},
+        {"id": 6, "parameter_name": "insalubrity_percent", "value": 0.40, "start_date": "2000-01-01", "end_date": None},
+        {"id": 7, "parameter_name": "percentual_terco_ferias", "value": (1/3), "start_date": "1988-10-05", "end_date": None},
+        {"id": 8, "parameter_name": "meses_do_ano", "value": 12, "start_date": "1900-01-01", "end_date": None},
+    ]
+
+
+def gerar_dados_historicos(semente: int, quantidade: int = 60):
+    gerador = random.Random(semente)
+    base = date(2020, 1, 1)
+    dados = []
+    for i in range(quantidade):
+        inicio = base + timedelta(days=gerador.randint(0, 700))
+        fim = inicio + timedelta(days=gerador.randint(0, 300)) if gerador.random() < 0.6 else None
+        dados.append({
+            "id": i, "parameter_name": gerador.choice(["p", "q", "r"]), "value": float(gerador.randint(1, 4)),
+            "start_date": inicio.isoformat(), "end_date": fim.isoformat() if fim else None
+        })
+    return dados
+
+
+@pytest.mark.parametrize("semente", [1, 2, 3])
+def test_consultas_em_sql_batem_com_o_gerenciador_em_memoria(tmp_path, semente):
+    dados = gerar_dados_historicos(semente)
+    em_memoria = GerenciadorHistorico(dados)
+    sqlite = GerenciadorHistoricoSQLite(str(tmp_path / "historico.sqlite"), dados)
+    base = date(2020, 1, 1)
+
+    assert sqlite.nomes_parametros() == em_memoria.nomes_parametros()
+    assert sqlite.obter_datas_de_mudanca() == em_memoria.obter_datas_de_mudanca()
+    for deslocamento in range(-5, 1100, 7):
+        check_date = base + timedelta(days=deslocamento)
+        assert sqlite.obter_todos_parametros_ativos_na_data(check_date) == em_memoria.obter_todos_parametros_ativos_na_data(check_date)
+        assert sqlite.obter_valor_na_data("p", check_date) == em_memoria.obter_valor_na_data("p", check_date)
+
+    for inicio, fim in [(date(2020, 3, 1), date(2021, 6, 30)), (date(2019, 1, 1), date(2023, 1, 1)), (date(2021, 1, 1), date(2021, 1, 1))]:
+        assert sqlite.obter_datas_de_mudanca_entre(inicio, fim) == em_memoria.obter_datas_de_mudanca_entre(inicio, fim)
+        assert sqlite.obter_segmentos_entre(inicio, fim) == em_memoria.obter_segmentos_entre(inicio, fim)
+
+    datas = [base + timedelta(days=deslocamento) for deslocamento in range(-5, 1100, 2)]
+    esperado, obtido = em_memoria.obter_parametros_nas_datas(datas), sqlite.obter_parametros_nas_datas(datas)
+    assert list(obtido) == list(esperado)
+    for nome in esperado:
+        np.testing.assert_array_equal(obtido[nome], esperado[nome])
+
+
+def test_banco_persiste_entre_instancias_e_processos(tmp_path, gerenciador_historico_dados):
+    caminho = str(tmp_path / "historico.sqlite")
+    GerenciadorHistoricoSQLite(caminho, gerenciador_historico_dados).fechar()
+
+    # Uma nova instância (ou outro processo) só abre o arquivo, sem recarregar os dados
+    reaberto = GerenciadorHistoricoSQLite(caminho)
+    assert reaberto.obter_valor_na_data("minimum_wage", date(2024, 6, 1)) == 1412.00
+    copia = pickle.loads(pickle.dumps(reaberto))
+    assert copia.obter_datas_de_mudanca() == reaberto.obter_datas_de_mudanca()
+
+    # A linha do tempo de configurações funciona sobre qualquer um dos dois gerenciadores
+    configuracao = LinhaDoTempoConfiguracao(reaberto).obter(2024, 3)
+    assert configuracao == LinhaDoTempoConfiguracao(GerenciadorHistorico(gerenciador_historico_dados)).obter(2024, 3)
+
+    # Uma nova carga substitui o conteúdo
+    reaberto.carregar_de_dados_brutos(gerenciador_historico_dados[:2])
+    assert reaberto.nomes_parametros() == ["minimum_wage"]
+
+
+def test_carga_vazia_ou_com_registro_invalido_nao_apaga_o_banco(tmp_path, gerenciador_historico_dados):
+    sqlite = GerenciadorHistoricoSQLite(str(tmp_path / "historico.sqlite"), gerenciador_historico_dados)
+    datas_antes = sqlite.obter_datas_de_mudanca()
+
+    with pytest.raises(ValueError):
+        sqlite.carregar_de_dados_brutos([])
+    with pytest.raises(ValueError):
+        sqlite.carregar_registros([])
+    with pytest.raises(ValueError):
+        sqlite.carregar_de_dados_brutos(gerenciador_historico_dados[:2] + [{"id": 99, "parameter_name": "x", "value": "abc", "start_date": "2024-01-01"}])
+
+    assert sqlite.nomes_parametros() == GerenciadorHistorico(gerenciador_historico_dados).nomes_parametros()
+    assert sqlite.obter_datas_de_mudanca() == datas_antes
+
+
+def test_linha_do_tempo_por_parametro_e_montada_uma_vez_e_renovada_quando_o_banco_muda(tmp_path, gerenciador_historico_dados, monkeypatch):
+    caminho = str(tmp_path / "historico.sqlite")
+    sqlite = GerenciadorHistoricoSQLite(caminho, gerenciador_historico_dados)
+    leituras = []
+    ler_original = GerenciadorHistoricoSQLite._registros_do_parametro
+    monkeypatch.setattr(GerenciadorHistoricoSQLite, "_registros_do_parametro",
+                        lambda self, nome: leituras.append(nome) or ler_original(self, nome))
+    datas = [date(2023, 6, 1), date(2024, 6, 1)]
+
+    for _ in range(5):
+        assert sqlite.obter_valores_nas_datas("minimum_wage", datas).tolist() == [1320.00, 1412.00]
+    assert leituras == ["minimum_wage"]
+
+    # Carga pelo próprio objeto e carga por outra conexão (outro processo) descartam as linhas do tempo
+    sqlite.carregar_de_dados_brutos([dict(gerenciador_historico_dados[1], value=1500.00)])
+    assert sqlite.obter_valores_nas_datas("minimum_wage", datas).tolist()[1] == 1500.00
+    GerenciadorHistoricoSQLite(caminho).carregar_de_dados_brutos([dict(gerenciador_historico_dados[1], value=1600.00)])
+    assert sqlite.obter_valores_nas_datas("minimum_wage", datas).tolist()[1] == 1600.00
+    assert leituras == ["minimum_wage"] * 3
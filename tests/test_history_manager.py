@@ -0,0 +1,131 @@
+import pytest
+import random
+import numpy as np
+from datetime import date, timedelta
+from core.entities import ParametroHistorico
+from core.history_manager import GerenciadorHistorico, resolver_vigencias
+
+
+@pytest.fixture
+def dados_historicos():
+    return [
+        {"id": 1, "parameter_name": "minimum_wage", "value": 1320.00, "start_date": "2023-01-01", "end_date": "2023-12-31"},
+        {"id": 2, "parameter_name": "minimum_wage", "value": 1412.00, "start_date": "2024-01-01", "end_date": None},
+        {"id": 3, "parameter_name": "aliquota_fgts_empresa", "value": 0.08, "start_date": "2000-01-01", "end_date": None},
+        {"id": 4, "parameter_name": "aliquota_inss_patronal_media", "value": 0.20, "start_date": "2010-01-01", "end_date": "2023-12-31"},
+        {"id": 5, "parameter_name": "aliquota_inss_patronal_media", "value": 0.22, "start_date": "2024-01-01", "end_date": None},
+    ]
+
+
+def test_obter_valor_na_data(dados_historicos):
+    gerenciador = GerenciadorHistorico(dados_historicos)
+    assert gerenciador.obter_valor_na_data("minimum_wage", date(2023, 6, 1)) == 1320.00
+    assert gerenciador.obter_valor_na_data("minimum_wage", date(2024, 1, 1)) == 1412.00
+    assert gerenciador.obter_valor_na_data("minimum_wage", date(2022, 12, 31)) is None
+    assert gerenciador.obter_valor_na_data("parametro_inexistente", date(2024, 1, 1)) is None
+
+
+def test_obter_todos_parametros_ativos_na_data(dados_historicos):
+    gerenciador = GerenciadorHistorico(dados_historicos)
+    assert gerenciador.obter_todos_parametros_ativos_na_data(date(2023, 12, 31)) == {
+        "minimum_wage": 1320.00, "aliquota_fgts_empresa": 0.08, "aliquota_inss_patronal_media": 0.20
+    }
+    assert gerenciador.obter_todos_parametros_ativos_na_data(date(2005, 1, 1)) == {"aliquota_fgts_empresa": 0.08}
+
+
+def test_vigencias_sobrepostas_seguem_a_data_inicio_mais_recente():
+    """Com sobreposição, vale o registro de início mais recente; em empate, o primeiro carregado."""
+    gerador = random.Random(3)
+    base = date(2020, 1, 1)
+    dados = []
+    for i in range(40):
+        inicio = base + timedelta(days=gerador.randint(0, 700))
+        fim = inicio + timedelta(days=gerador.randint(0, 300)) if gerador.random() < 0.6 else None
+        dados.append({
+            "id": i, "parameter_name": "p", "value": float(gerador.randint(1, 5)),
+            "start_date": inicio.isoformat(), "end_date": fim.isoformat() if fim else None
+        })
+    gerenciador = GerenciadorHistorico(dados)
+
+    for deslocamento in range(-5, 1100, 3):
+        check_date = base + timedelta(days=deslocamento)
+        esperado = None
+        for registro in gerenciador._history_records:  # ordenados por início, estável na ordem de carga
+            if registro.is_active_on_date(check_date) and (esperado is None or registro.data_inicio > esperado.data_inicio):
+                esperado = registro
+        valor = gerenciador.obter_todos_parametros_ativos_na_data(check_date).get("p")
+        assert valor == (esperado.valor if esperado else None)
+
+
+def test_consulta_em_lote_bate_com_a_consulta_por_data():
+    gerador = random.Random(8)
+    base = date(2020, 1, 1)
+    dados = []
+    for i in range(30):
+        inicio = base + timedelta(days=gerador.randint(0, 700))
+        fim = inicio + timedelta(days=gerador.randint(0, 300)) if gerador.random() < 0.6 else None
+        dados.append({
+            "id": i, "parameter_name": gerador.choice(["p", "q"]), "value": float(gerador.randint(1, 5)),
+            "start_date": inicio.isoformat(), "end_date": fim.isoformat() if fim else None
+        })
+    gerenciador = GerenciadorHistorico(dados)
+    datas = [base + timedelta(days=deslocamento) for deslocamento in range(-5, 1100, 2)]
+
+    valores = gerenciador.obter_parametros_nas_datas(datas)
+    assert set(valores) == {"p", "q"}
+    for nome, coluna in valores.items():
+        esperado = [gerenciador.obter_todos_parametros_ativos_na_data(d).get(nome) for d in datas]
+        assert [None if np.isnan(v) else v for v in coluna] == esperado
+    assert np.isnan(gerenciador.obter_valores_nas_datas("inexistente", np.array(["2021-01-01"], dtype="datetime64[D]"))).all()
+
+
+def test_segmentos_entre_dividem_o_intervalo_nas_mudancas():
+    """Mínimo muda em janeiro e INSS em março: três segmentos contíguos, cada um com os valores vigentes."""
+    gerenciador = GerenciadorHistorico([
+        {"id": 1, "parameter_name": "minimum_wage", "value": 1412.00, "start_date": "2024-01-01", "end_date": "2024-12-31"},
+        {"id": 2, "parameter_name": "minimum_wage", "value": 1518.00, "start_date": "2025-01-01", "end_date": None},
+        {"id": 3, "parameter_name": "aliquota_inss_patronal_media", "value": 0.20, "start_date": "2010-01-01", "end_date": "2025-02-28"},
+        {"id": 4, "parameter_name": "aliquota_inss_patronal_media", "value": 0.22, "start_date": "2025-03-01", "end_date": None},
+    ])
+    assert gerenciador.obter_datas_de_mudanca_entre(date(2024, 10, 1), date(2025, 6, 30)) == [date(2025, 1, 1), date(2025, 3, 1)]
+    # Mudança exatamente no início não divide o intervalo
+    assert gerenciador.obter_datas_de_mudanca_entre(date(2025, 1, 1), date(2025, 2, 28)) == []
+
+    segmentos = gerenciador.obter_segmentos_entre(date(2024, 10, 1), date(2025, 6, 30))
+    assert [(s.data_inicio, s.data_fim) for s in segmentos] == [
+        (date(2024, 10, 1), date(2024, 12, 31)), (date(2025, 1, 1), date(2025, 2, 28)), (date(2025, 3, 1), date(2025, 6, 30))
+    ]
+    assert [s.valores for s in segmentos] == [
+        {"minimum_wage": 1412.00, "aliquota_inss_patronal_media": 0.20},
+        {"minimum_wage": 1518.00, "aliquota_inss_patronal_media": 0.20},
+        {"minimum_wage": 1518.00, "aliquota_inss_patronal_media": 0.22},
+    ]
+    for segmento in segmentos:
+        for check_date in (segmento.data_inicio, segmento.data_fim):
+            assert gerenciador.obter_todos_parametros_ativos_na_data(check_date) == segmento.valores
+
+    assert len(gerenciador.obter_segmentos_entre(date(2025, 4, 1), date(2025, 4, 1))) == 1
+    with pytest.raises(ValueError):
+        gerenciador.obter_segmentos_entre(date(2025, 4, 2), date(2025, 4, 1))
+
+
+def test_varredura_com_empates_e_carga_fora_de_ordem():
+    """Em empate de início vale o primeiro carregado, mesmo com a carga fora da ordem de início."""
+    gerador = random.Random(11)
+    base = date(2021, 1, 1)
+    registros = []
+    for i in range(300):
+        inicio = base + timedelta(days=30 * gerador.randint(0, 24))  # poucos inícios distintos: muitos empates
+        fim = inicio + timedelta(days=gerador.randint(0, 400)) if gerador.random() < 0.7 else None
+        registros.append(ParametroHistorico(i, "p", float(i), inicio, fim))
+
+    segmentos = resolver_vigencias(registros)
+    for deslocamento in range(-3, 1200, 5):
+        check_date = base + timedelta(days=deslocamento)
+        esperado = None
+        for registro in registros:  # ordem de carga
+            if registro.is_active_on_date(check_date) and (esperado is None or registro.data_inicio > esperado.data_inicio):
+                esperado = registro
+        obtido = next((valor for inicio, fim, valor in segmentos
+                       if inicio <= check_date and (fim is None or check_date <= fim)), None)
+        assert obtido == (esperado.valor if esperado else None)
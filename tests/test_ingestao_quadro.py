@@ -0,0 +1,109 @@
+import csv
+import json
+import pytest
+from datetime import date
+from core.entities import Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_rules import ServicoFolhaPagamento
+from core.qpa_generator import GeradorQPA
+from core.ingestao_quadro import (
+    ler_registros, ler_registros_jsonl, funcionarios_validos, em_blocos, processar_quadro_em_fluxo
+)
+
+
+def criar_registro(chapa: str, codigo_funcao: str = "0001", equipe: str = "Operacao", **campos) -> dict:
+    registro = {
+        "CHAPA": chapa, "NOME": f"Funcionario {chapa}", "SITUACAO": "A", "CODIGO_FUNCAO": codigo_funcao,
+        "DATA_ADMISSAO": "2020-01-15", "DATA_ADMISSAO_PTS": "15/01/2020", "DATA_NASCIMENTO": "1985-06-30",
+        "SECAO": "01.01.1.01.01.001", "CARGA_HORARIA_MENSAL": "220", "CPF": "529.982.247-25",
+        "CENTRO_CUSTO": "123456789", "EMPRESA": "Matriz", "EQUIPE": equipe, "FUNCAO": "Operador",
+        "VALOR_VALE_TRANSPORTE_MENSAL": 150.0, "VALOR_VALE_REFEICAO_MENSAL": 400.0, "PLANO_SAUDE_MENSAL": 50.0,
+        "OUTROS_BENEFICIOS_MENSAIS": 0.0,
+    }
+    registro.update(campos)
+    return registro
+
+
+@pytest.fixture
+def catalogo_cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Operador", salario=2500.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Gerente", salario=6000.00),
+    ])
+
+
+@pytest.fixture
+def configuracao_global():
+    return ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30), salario_minimo=1412.00, percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08, aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+
+
+def test_leitura_jsonl_e_csv_em_fluxo(tmp_path):
+    registros = [criar_registro("00001"), criar_registro("00002")]
+    arquivo_jsonl = tmp_path / "funcionarios.jsonl"
+    arquivo_jsonl.write_text("\n".join(json.dumps(r) for r in registros) + "\n\n", encoding="utf-8")
+    arquivo_csv = tmp_path / "funcionarios.csv"
+    with open(arquivo_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(registros[0]))
+        writer.writeheader()
+        writer.writerows(registros)
+
+    assert list(ler_registros(str(arquivo_jsonl))) == registros
+    assert [r["CHAPA"] for r in ler_registros(str(arquivo_csv))] == ["00001", "00002"]
+    with pytest.raises(ValueError):
+        ler_registros(str(tmp_path / "funcionarios.xlsx"))
+
+
+def test_jsonl_rejeita_linha_que_nao_e_objeto(tmp_path):
+    arquivo = tmp_path / "funcionarios.jsonl"
+    arquivo.write_text('{"CHAPA": "00001"}\n[1, 2]\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(ler_registros_jsonl(str(arquivo)))
+
+
+def test_funcionarios_validos_descarta_invalidos_e_funcoes_desconhecidas(catalogo_cargos):
+    registros = [criar_registro("00001"), criar_registro("1"), criar_registro("00003", codigo_funcao="9999"), criar_registro("00004")]
+    rejeitados = []
+
+    funcionarios = list(funcionarios_validos(registros, catalogo_cargos, ao_rejeitar=lambda r, motivo: rejeitados.append(r["CHAPA"])))
+
+    assert [f.chapa for f in funcionarios] == ["00001", "00004"]
+    assert rejeitados == ["1", "00003"]
+
+
+def test_em_blocos_consome_o_iteravel_aos_poucos():
+    consumidos = []
+
+    def gerador():
+        for i in range(7):
+            consumidos.append(i)
+            yield i
+
+    blocos = em_blocos(gerador(), 3)
+    assert next(blocos) == [0, 1, 2]
+    assert consumidos == [0, 1, 2]
+    assert list(blocos) == [[3, 4, 5], [6]]
+    with pytest.raises(ValueError):
+        next(em_blocos([], 0))
+
+
+def test_processamento_em_fluxo_bate_com_o_lote_inteiro(catalogo_cargos, configuracao_global):
+    registros = [criar_registro(str(i).zfill(5), codigo_funcao="0001" if i % 3 else "0002", equipe="Operacao" if i % 2 else "Projetos") for i in range(1, 26)]
+    servico = ServicoFolhaPagamento()
+    tamanhos_dos_blocos = []
+
+    resumo = processar_quadro_em_fluxo(
+        funcionarios_validos(iter(registros), catalogo_cargos),
+        servico, catalogo_cargos, configuracao_global, tamanho_bloco=10,
+        ao_calcular_bloco=lambda bloco, custos: tamanhos_dos_blocos.append(len(custos))
+    )
+
+    funcionarios = list(funcionarios_validos(registros, catalogo_cargos))
+    custos = servico.calcular_detalhamento_custo_total_lote(funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario())
+    assert tamanhos_dos_blocos == [10, 10, 5]
+    assert resumo.numero_total_funcionarios == 25
+    assert resumo.custo_total == pytest.approx(float(custos["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].sum()))
+    assert resumo.qpa.gerar_resumo() == GeradorQPA().generate_qpa_summary(funcionarios)
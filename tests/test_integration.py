@@ -74,5 +74,6 @@ def test_processo_completo_desde_dados_brutos():
     )
 
     
-    # O custo total deve ser a soma dos salários base: 5500.00 + 4200.50
-    assert custo_total_folha == pytest.approx(9700.50)
\ No newline at end of file
+    # A soma dos salários base é 5500.00 + 4200.50; o custo final inclui encargos, provisões e benefícios
+    assert custo_total_folha.total.salario_base == pytest.approx(9700.50)
+    assert custo_total_folha.custo_total > custo_total_folha.total.salario_base
\ No newline at end of file
@@ -0,0 +1,267 @@
+import pytest
+import random
+from datetime import date, datetime
+import numpy as np
+from dataclasses import replace
+from core import payroll_batch
+from core.payroll_rules import ServicoFolhaPagamento
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_batch import (
+    CAMPOS_DETALHAMENTO, GRAFO_EVENTOS_FOLHA, detalhamento_da_posicao, detalhamentos_do_lote, montar_colunas_funcionarios
+)
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, DetalhamentoCusto, CoorteContratacao
+from core.tabela_funcionarios import TabelaFuncionarios
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str, vt: float = 100.0, vr: float = 300.0, plano: float = 50.0, outros: float = 0.0) -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe="Operacao", funcao="Cargo",
+        valor_vale_transporte_mensal=vt, valor_vale_refeicao_mensal=vr,
+        plano_saude_mensal=plano, outros_beneficios_mensais=outros
+    )
+
+
+@pytest.fixture
+def cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo A", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Cargo B", salario=3000.00),
+        Cargo(codigo_funcao="0003", nome_funcao="Cargo C", salario=5202.76),
+        Cargo(codigo_funcao="0004", nome_funcao="Cargo D", salario=1412.37),
+    ])
+
+
+@pytest.fixture
+def configuracao_global():
+    return ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30),
+        salario_minimo=1412.00,
+        percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08,
+        aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3),
+        meses_do_ano=12
+    )
+
+
+def test_lote_bate_com_calculo_individual(cargos, configuracao_global):
+    """O cálculo em lote deve reproduzir exatamente a ficha individual de cada funcionário."""
+    gerador = random.Random(42)
+    codigos = ["0001", "0002", "0003", "0004", "9999"]  # 9999 não existe no catálogo
+    funcionarios = [
+        criar_funcionario(str(i).zfill(5), gerador.choice(codigos), vt=gerador.choice([0.0, 110.0, 150.5]), outros=gerador.random() * 100)
+        for i in range(200)
+    ]
+    for funcionario in funcionarios[::3]:
+        funcionario.valor_base_gratificacao_mensal = gerador.choice([800.0, 1234.56])
+    lancamentos = [
+        LancamentoMensalFuncionario(
+            dias_ferias=gerador.randint(0, 35), recebe_insalubridade=gerador.random() < 0.5,
+            recebe_periculosidade=gerador.random() < 0.3, horas_trabalhadas_no_mes=gerador.choice([0.0, 180.0, 220.0]),
+            quantidade_horas_s_aviso=gerador.choice([0.0, 0.0, 7.5]), quantidade_horas_adicional_noturno=gerador.choice([0.0, 12.0, 33.25])
+        )
+        for _ in funcionarios
+    ]
+    servico = ServicoFolhaPagamento()
+
+    resultado_lote = servico.calcular_detalhamento_custo_total_lote(funcionarios, cargos, configuracao_global, lancamentos)
+
+    for indice, (funcionario, lancamento) in enumerate(zip(funcionarios, lancamentos)):
+        esperado = servico.calcular_detalhamento_custo_total(funcionario, cargos, configuracao_global, lancamento)
+        assert detalhamento_da_posicao(resultado_lote, indice) == esperado
+
+
+def test_lote_com_lancamento_unico_nao_altera_funcionarios(cargos, configuracao_global):
+    """Um único lançamento vale para todos, e os objetos Funcionario não são modificados."""
+    funcionarios = [criar_funcionario("00001", "0001"), criar_funcionario("00002", "0002")]
+    servico = ServicoFolhaPagamento()
+
+    resultado = servico.calcular_detalhamento_custo_total_lote(
+        funcionarios, cargos, configuracao_global, LancamentoMensalFuncionario(dias_ferias=10)
+    )
+
+    assert set(resultado) == set(CAMPOS_DETALHAMENTO)
+    assert resultado["EV_DIAS_TRABALHADOS"].tolist() == [3333.33, 2000.00]
+    assert all(f.custo_total_mensal == 0.0 for f in funcionarios)
+
+
+def test_lote_rejeita_lancamentos_desalinhados(cargos, configuracao_global):
+    servico = ServicoFolhaPagamento()
+    with pytest.raises(ValueError):
+        servico.calcular_detalhamento_custo_total_lote(
+            [criar_funcionario("00001", "0001")], cargos, configuracao_global, []
+        )
+
+
+def test_ficha_em_reais_e_a_ficha_em_centavos_convertida(cargos, configuracao_global):
+    """Um único motor: a ficha em reais (individual e em lote) é a de centavos dividida por 100, e os totais fecham."""
+    funcionarios = [criar_funcionario(str(i).zfill(5), codigo) for i, codigo in enumerate(["0001", "0002", "0003", "0004"])]
+    lancamento = LancamentoMensalFuncionario(dias_ferias=7, recebe_insalubridade=True, quantidade_horas_adicional_noturno=13.0)
+    servico = ServicoFolhaPagamento()
+
+    lote = servico.calcular_detalhamento_custo_total_lote(funcionarios, cargos, configuracao_global, lancamento)
+    lote_centavos = servico.calcular_detalhamento_custo_total_lote_centavos(funcionarios, cargos, configuracao_global, lancamento)
+    for indice, funcionario in enumerate(funcionarios):
+        ficha = servico.calcular_detalhamento_custo_total(funcionario, cargos, configuracao_global, lancamento, atualizar_funcionario=False)
+        centavos = servico.calcular_detalhamento_custo_total_centavos(funcionario, cargos, configuracao_global, lancamento)
+        assert ficha == {campo: valor / 100 for campo, valor in centavos.items()}
+        assert detalhamento_da_posicao(lote, indice) == ficha
+        assert {campo: int(lote_centavos[campo][indice]) for campo in CAMPOS_DETALHAMENTO} == centavos
+        encargos = ("ENCARGO_FGTS", "ENCARGO_INSS_EMPRESA", "PROVISAO_FERIAS", "PROVISAO_13_SALARIO")
+        assert sum(centavos[campo] for campo in encargos) == centavos["TOTAL_ENCARGOS_E_PROVISOES"]
+        assert all(round(ficha[campo], 2) == ficha[campo] for campo in encargos)
+
+
+def test_detalhamentos_do_lote_compactos(cargos, configuracao_global):
+    funcionarios = [criar_funcionario("00001", "0001"), criar_funcionario("00002", "0003", outros=12.5)]
+    servico = ServicoFolhaPagamento()
+
+    resultado = servico.calcular_detalhamento_custo_total_lote(funcionarios, cargos, configuracao_global, LancamentoMensalFuncionario(dias_ferias=5))
+    detalhamentos = detalhamentos_do_lote(resultado)
+
+    for indice, detalhamento in enumerate(detalhamentos):
+        assert not hasattr(detalhamento, "__dict__")
+        assert detalhamento.para_dict() == detalhamento_da_posicao(resultado, indice)
+        assert DetalhamentoCusto.de_dict(detalhamento.para_dict()) == detalhamento
+        assert detalhamento["TOTAL_CUSTO_FINAL_DO_EMPREGADO"] == detalhamento.total_custo_final_do_empregado
+    with pytest.raises(KeyError):
+        detalhamentos[0]["CAMPO_INEXISTENTE"]
+
+
+def test_lote_em_centavos_bate_com_calculo_individual(cargos, configuracao_global):
+    """Em centavos o lote e a ficha individual batem centavo a centavo, e o total é a soma exata das fichas."""
+    gerador = random.Random(11)
+    funcionarios = [
+        criar_funcionario(str(i).zfill(5), gerador.choice(["0001", "0002", "0003", "0004"]), vt=gerador.choice([0.0, 110.0, 150.5]),
+                          outros=round(gerador.random() * 100, 2))
+        for i in range(200)
+    ]
+    for funcionario in funcionarios[::4]:
+        funcionario.valor_base_gratificacao_mensal = gerador.choice([800.0, 1234.56])
+    lancamentos = [
+        LancamentoMensalFuncionario(
+            dias_ferias=gerador.randint(0, 35), recebe_insalubridade=gerador.random() < 0.5,
+            recebe_periculosidade=gerador.random() < 0.3, horas_trabalhadas_no_mes=gerador.choice([0.0, 180.0, 220.0]),
+            quantidade_horas_s_aviso=gerador.choice([0.0, 0.0, 7.5]), quantidade_horas_adicional_noturno=gerador.choice([0.0, 12.0, 33.25])
+        )
+        for _ in funcionarios
+    ]
+    servico = ServicoFolhaPagamento()
+
+    resultado_lote = servico.calcular_detalhamento_custo_total_lote_centavos(funcionarios, cargos, configuracao_global, lancamentos)
+
+    assert all(coluna.dtype == np.int64 for coluna in resultado_lote.values())
+    total_individual = 0
+    for indice, (funcionario, lancamento) in enumerate(zip(funcionarios, lancamentos)):
+        esperado = servico.calcular_detalhamento_custo_total_centavos(funcionario, cargos, configuracao_global, lancamento)
+        assert {campo: int(coluna[indice]) for campo, coluna in resultado_lote.items()} == esperado
+        total_individual += esperado["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+    _, total_ponderado = servico.calcular_custo_total_ponderado_lote_centavos(funcionarios, cargos, configuracao_global, lancamentos)
+    assert total_ponderado == total_individual
+
+
+def test_total_folha_com_subtotais_por_grupo(cargos, configuracao_global):
+    """Os subtotais por grupo somam o total, coortes contam pela quantidade e a tabela em colunas dá o mesmo resultado."""
+    gerador = random.Random(5)
+    funcionarios = []
+    for i in range(120):
+        funcionario = criar_funcionario(str(i).zfill(5), gerador.choice(["0001", "0002", "0003"]), outros=round(gerador.random() * 50, 2))
+        funcionario.empresa = gerador.choice(["Matriz", "Filial"])
+        funcionario.centro_custo = gerador.choice(["100", "200", "300"])
+        funcionarios.append(funcionario)
+    servico = ServicoFolhaPagamento()
+    lancamento = LancamentoMensalFuncionario(dias_ferias=3)
+
+    totais = servico.calcular_total_folha_pagamento(funcionarios, cargos, configuracao_global, lancamento, agrupar_por=("empresa", "centro_custo"))
+
+    lote = servico.calcular_detalhamento_custo_total_lote_centavos(funcionarios, cargos, configuracao_global, lancamento)
+    assert totais.numero_funcionarios == 120
+    assert totais.total.total_custo_final_do_empregado == int(lote["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].sum()) / 100
+    assert list(totais.subtotais)[0] == (funcionarios[0].empresa, funcionarios[0].centro_custo)
+    assert len(totais.subtotais) == len({(f.empresa, f.centro_custo) for f in funcionarios})
+    for campo in CAMPOS_DETALHAMENTO:
+        assert round(sum(subtotal[campo] for subtotal in totais.subtotais.values()), 2) == totais.total[campo]
+    matriz_100 = [i for i, f in enumerate(funcionarios) if (f.empresa, f.centro_custo) == ("Matriz", "100")]
+    assert totais.subtotais[("Matriz", "100")].total_beneficios == int(lote["TOTAL_BENEFICIOS"][matriz_100].sum()) / 100
+
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    assert servico.calcular_total_folha_pagamento(tabela, cargos, configuracao_global, lancamento, agrupar_por=("empresa", "centro_custo")) == totais
+
+    coorte = CoorteContratacao(primeira_chapa=900, quantidade=10, codigo_funcao="0002", funcao="Cargo B", empresa="Matriz",
+                               equipe="Operacao", data_admissao=datetime(2025, 1, 1))
+    com_coorte = servico.calcular_total_folha_pagamento(funcionarios + [coorte], cargos, configuracao_global, lancamento, agrupar_por=("equipe",))
+    assert com_coorte.numero_funcionarios == 130
+    assert com_coorte.total.salario_base == pytest.approx(totais.total.salario_base + 10 * 3000.00)
+    with pytest.raises(ValueError):
+        servico.calcular_total_folha_pagamento(funcionarios, cargos, configuracao_global, lancamento, agrupar_por=("nome",))
+
+
+def test_detalhamento_preguicoso_calcula_so_o_que_e_lido(cargos, configuracao_global):
+    funcionarios = [criar_funcionario("00001", "0001"), criar_funcionario("00002", "0003", outros=12.5)]
+    lancamento = LancamentoMensalFuncionario(dias_ferias=5, recebe_insalubridade=True, quantidade_horas_adicional_noturno=10)
+    servico = ServicoFolhaPagamento()
+    completo = servico.calcular_detalhamento_custo_total_lote(funcionarios, cargos, configuracao_global, lancamento)
+
+    preguicoso = servico.calcular_detalhamento_custo_total_lote_preguicoso(funcionarios, cargos, configuracao_global, lancamento)
+    assert preguicoso.campos_calculados() == []
+    assert preguicoso["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].tolist() == completo["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].tolist()
+    assert "TOTAL_PROVENTOS" not in preguicoso.campos_calculados()
+    assert "EV_ADIC_NOTURNO" not in preguicoso.campos_calculados()
+
+    # A ficha de uma posição lê (e calcula) os demais campos no acesso
+    assert dict(preguicoso.ficha(1)) == detalhamento_da_posicao(completo, 1)
+    assert preguicoso.campos_calculados() == list(CAMPOS_DETALHAMENTO)
+    with pytest.raises(KeyError):
+        preguicoso["CAMPO_INEXISTENTE"]
+
+    ficha = servico.calcular_detalhamento_custo_total_preguicoso(funcionarios[0], cargos, configuracao_global, lancamento)
+    assert dict(ficha) == servico.calcular_detalhamento_custo_total(funcionarios[0], cargos, configuracao_global, lancamento, atualizar_funcionario=False)
+    assert funcionarios[0].custo_total_mensal == 0.0
+
+
+def test_custos_totais_monta_so_as_colunas_do_custo_final(cargos, configuracao_global):
+    funcionarios = [criar_funcionario(str(i).zfill(5), ["0001", "0002", "0003"][i % 3]) for i in range(30)]
+    lancamentos = [LancamentoMensalFuncionario(dias_ferias=i % 7) for i in range(30)]
+    servico = ServicoFolhaPagamento()
+
+    custos, quantidade = servico.calcular_custos_totais_lote(funcionarios, cargos, configuracao_global, lancamentos)
+
+    completo = servico.calcular_detalhamento_custo_total_lote(funcionarios, cargos, configuracao_global, lancamentos)
+    assert custos.tolist() == completo["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].tolist()
+    assert quantidade.tolist() == [1] * 30
+    plano = GRAFO_EVENTOS_FOLHA.compilar(["TOTAL_CUSTO_FINAL_DO_EMPREGADO"])
+    colunas = montar_colunas_funcionarios(funcionarios, cargos, lancamentos, plano.entradas)
+    assert "dias_ferias" not in colunas and "valor_base_gratificacao_mensal" not in colunas
+
+
+def test_recalculo_incremental_so_refaz_os_eventos_afetados(cargos, configuracao_global):
+    """Trocar o salário mínimo só recalcula a insalubridade e o que depende dela; o resultado é o de um cálculo do zero."""
+    gerador = random.Random(9)
+    funcionarios = [criar_funcionario(str(i).zfill(5), gerador.choice(["0001", "0002", "0003"])) for i in range(50)]
+    lancamentos = [
+        LancamentoMensalFuncionario(recebe_insalubridade=i % 2 == 0, quantidade_horas_adicional_noturno=float(i % 3)) for i in range(50)
+    ]
+    servico = ServicoFolhaPagamento()
+    lote = servico.calcular_detalhamento_custo_total_lote_preguicoso(funcionarios, cargos, configuracao_global, lancamentos, em_centavos=True)
+    totais_antes = payroll_batch.totalizar_lote_centavos(lote, lote.colunas["quantidade"])
+
+    nova_configuracao = replace(configuracao_global, salario_minimo=1518.00)
+    novo_lote = lote.com_configuracao(nova_configuracao)
+    calculados_antes = {campo: novo_lote._calculados.get(campo) for campo in CAMPOS_DETALHAMENTO}
+    totais_depois = payroll_batch.totalizar_lote_centavos(novo_lote, novo_lote.colunas["quantidade"])
+
+    do_zero = servico.calcular_detalhamento_custo_total_lote_centavos(funcionarios, cargos, nova_configuracao, lancamentos)
+    for campo in CAMPOS_DETALHAMENTO:
+        assert novo_lote[campo].tolist() == do_zero[campo].tolist()
+    # Os eventos que o salário mínimo não afeta são os mesmos arrays do lote anterior
+    assert calculados_antes["ENCARGO_FGTS"] is lote["ENCARGO_FGTS"]
+    assert calculados_antes["TOTAL_CUSTO_FINAL_DO_EMPREGADO"] is lote["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+    assert calculados_antes["EV_ADIC_INSALUBRIDADE"] is None and calculados_antes["TOTAL_PROVENTOS"] is None
+    assert totais_depois.custo_total == totais_antes.custo_total
+    assert totais_depois.total.ev_adic_insalubridade > totais_antes.total.ev_adic_insalubridade
+    # O lote original não muda
+    assert lote.configuracao_global is configuracao_global
@@ -0,0 +1,136 @@
+import random
+import pytest
+from dataclasses import replace
+from datetime import date, datetime
+from core import dinheiro
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, CoorteContratacao
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_rules import ServicoFolhaPagamento
+from core.ingestao_quadro import processar_quadro_em_fluxo
+from core.payroll_paralelo import ExecutorFolhaParalelo
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str, equipe: str, outros: float) -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe=equipe, funcao=f"Cargo {codigo_funcao}",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=50.0, outros_beneficios_mensais=outros
+    )
+
+
+@pytest.fixture
+def catalogo_cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo A", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Cargo B", salario=3000.00),
+        Cargo(codigo_funcao="0003", nome_funcao="Cargo C", salario=5202.76),
+    ])
+
+
+@pytest.fixture
+def configuracao_global():
+    return ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30), salario_minimo=1412.00, percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08, aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+
+
+@pytest.fixture
+def funcionarios():
+    sorteio = random.Random(3)
+    return [
+        criar_funcionario(str(i).zfill(5), sorteio.choice(["0001", "0002", "0003"]), sorteio.choice(["Operacao", "Projetos"]), sorteio.random() * 100)
+        for i in range(1, 238)
+    ]
+
+
+def test_processar_quadro_em_paralelo_igual_ao_fluxo_sequencial(funcionarios, catalogo_cargos, configuracao_global):
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=50) as executor:
+        resumo = executor.processar_quadro(iter(funcionarios), catalogo_cargos, configuracao_global)
+
+    sequencial = processar_quadro_em_fluxo(funcionarios, ServicoFolhaPagamento(), catalogo_cargos, configuracao_global, tamanho_bloco=50)
+    assert resumo.numero_total_funcionarios == len(funcionarios)
+    assert resumo.custo_total == sequencial.custo_total
+    assert resumo.qpa.gerar_resumo() == sequencial.qpa.gerar_resumo()
+
+
+def test_custo_ponderado_em_paralelo_preserva_a_ordem(funcionarios, catalogo_cargos, configuracao_global):
+    coorte = CoorteContratacao(
+        primeira_chapa=900, quantidade=4, codigo_funcao="0002", funcao="Cargo B",
+        empresa="Matriz", equipe="Operacao", data_admissao=datetime(2025, 1, 1), salario_base_simulado=3150.0
+    )
+    registros = funcionarios + [coorte]
+    lancamentos = [LancamentoMensalFuncionario(dias_ferias=i % 31, recebe_insalubridade=i % 2 == 0) for i in range(len(registros))]
+    servico = ServicoFolhaPagamento()
+
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=40) as executor:
+        custos, total = executor.calcular_custo_total_ponderado_lote(registros, catalogo_cargos, configuracao_global, lancamentos)
+        with pytest.raises(ValueError):
+            executor.calcular_custo_total_ponderado_lote(registros, catalogo_cargos, configuracao_global, lancamentos[1:])
+
+    custos_esperados, total_esperado = servico.calcular_custo_total_ponderado_lote_centavos(registros, catalogo_cargos, configuracao_global, lancamentos)
+    assert custos.tolist() == dinheiro.para_reais(custos_esperados).tolist()
+    assert total == dinheiro.para_reais(total_esperado)
+
+
+def test_entrada_de_um_bloco_nao_cria_processos(funcionarios, catalogo_cargos, configuracao_global):
+    executor = ExecutorFolhaParalelo(processos=2, tamanho_bloco=1000)
+    resumo = executor.processar_quadro(funcionarios, catalogo_cargos, configuracao_global)
+
+    assert resumo.numero_total_funcionarios == len(funcionarios)
+    assert executor._executor is None
+    with pytest.raises(ValueError):
+        ExecutorFolhaParalelo(processos=0)
+
+
+@pytest.mark.parametrize("tamanho_bloco", [7, 50, 236])
+def test_total_em_centavos_nao_depende_do_tamanho_do_bloco(funcionarios, catalogo_cargos, configuracao_global, tamanho_bloco):
+    servico = ServicoFolhaPagamento()
+    custos_esperados, total_esperado = servico.calcular_custo_total_ponderado_lote_centavos(
+        funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario()
+    )
+
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=tamanho_bloco) as executor:
+        custos, total = executor.calcular_custo_total_ponderado_lote_centavos(
+            funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario()
+        )
+
+    assert custos.tolist() == custos_esperados.tolist()
+    assert total == total_esperado
+
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=tamanho_bloco) as executor:
+        _, total_em_reais = executor.calcular_custo_total_ponderado_lote(
+            funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario()
+        )
+    assert total_em_reais == dinheiro.para_reais(total_esperado)
+
+
+def test_pool_reaproveitado_enquanto_o_catalogo_nao_muda(funcionarios, catalogo_cargos, configuracao_global):
+    """O catálogo vai aos workers no inicializador: outra configuração usa o mesmo pool, outro catálogo recria."""
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=50) as executor:
+        executor.calcular_custo_total_ponderado_lote_centavos(funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario())
+        pool = executor._executor
+        _, total = executor.calcular_custo_total_ponderado_lote_centavos(
+            funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario()
+        )
+        assert executor._executor is pool
+
+        nova_configuracao = replace(configuracao_global, aliquota_fgts_patronal=0.09)
+        _, total_com_nova_configuracao = executor.calcular_custo_total_ponderado_lote_centavos(
+            funcionarios, catalogo_cargos, nova_configuracao, LancamentoMensalFuncionario()
+        )
+        assert executor._executor is pool
+
+        catalogo_cargos.adicionar(Cargo(codigo_funcao="0004", nome_funcao="Cargo D", salario=1412.37))
+        executor.calcular_custo_total_ponderado_lote_centavos(funcionarios, catalogo_cargos, configuracao_global, LancamentoMensalFuncionario())
+        assert executor._executor is not pool
+
+    _, esperado = ServicoFolhaPagamento().calcular_custo_total_ponderado_lote_centavos(
+        funcionarios, catalogo_cargos, nova_configuracao, LancamentoMensalFuncionario()
+    )
+    assert total_com_nova_configuracao == esperado != total
@@ -0,0 +1,184 @@
+import pytest
+import random
+from datetime import datetime
+from core.entities import Funcionario, CoorteContratacao
+from core.qpa_generator import GeradorQPA
+from core.quadro_simulado import QuadroSimulado
+
+
+def criar_funcionario(chapa: str, equipe: str = "Operacao") -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao="0001", data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe=equipe, funcao="Cargo",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=50.0, outros_beneficios_mensais=0.0
+    )
+
+
+@pytest.fixture
+def funcionarios_base():
+    return [criar_funcionario("00001"), criar_funcionario("00002"), criar_funcionario("00003")]
+
+
+def test_quadro_compartilha_funcionarios_base(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    assert len(quadro) == 3
+    assert all(a is b for a, b in zip(quadro, funcionarios_base))
+
+
+def test_contratacao_e_reducao_ficam_como_deltas(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    quadro.contratar(criar_funcionario("00004"))
+    removido = quadro.remover("00002")
+
+    assert removido is funcionarios_base[1]
+    assert list(quadro.chapas()) == ["00001", "00003", "00004"]
+    assert "00002" not in quadro and quadro.obter("00002") is None
+    with pytest.raises(ValueError):
+        quadro.contratar(criar_funcionario("00001"))
+
+
+def test_sobrescrita_nao_altera_objeto_base(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    quadro.sobrescrever("00001", equipe="Projetos")
+
+    assert quadro.obter("00001").equipe == "Projetos"
+    assert quadro.obter("00001") is quadro.obter("00001")
+    assert funcionarios_base[0].equipe == "Operacao"
+
+
+def test_ramificar_isola_os_deltas(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    quadro.custos["00001"] = 10.0
+    retrato = quadro.ramificar()
+    quadro.remover("00003")
+    quadro.contratar(criar_funcionario("00009"))
+
+    assert list(retrato.chapas()) == ["00001", "00002", "00003"]
+    assert retrato.custos == {}
+    assert list(quadro.chapas()) == ["00001", "00002", "00009"]
+
+
+def test_indice_de_grupos_acompanha_as_alteracoes(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", 2) == ["00003", "00002"]
+
+    quadro.contratar(criar_funcionario("00010"))
+    quadro.remover("00002")
+    quadro.sobrescrever("00003", equipe="Projetos")
+
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", 5) == ["00010", "00001"]
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Projetos", "0001", 5) == ["00003"]
+    assert quadro.quantidade_no_grupo("Matriz", "Operacao", "0001") == 2
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", 0) == []
+    assert quadro.maiores_chapas_do_grupo("Filial", "Operacao", "0001", 1) == []
+
+
+def test_indice_de_grupos_bate_com_a_ordenacao_apos_muitas_alteracoes():
+    """Entradas e saídas em qualquer ordem (inclusive chapas que saem e voltam ao grupo) mantêm a leitura ordenada."""
+    gerador = random.Random(4)
+    quadro = QuadroSimulado([criar_funcionario(str(i).zfill(5)) for i in gerador.sample(range(1, 400), 200)])
+    quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", 1)
+    for _ in range(600):
+        operacao = gerador.random()
+        chapas_do_grupo = [f.chapa for f in quadro if f.equipe == "Operacao"]
+        if operacao < 0.3:
+            chapa = str(gerador.randint(1, 800)).zfill(5)
+            if chapa not in quadro:
+                quadro.contratar(criar_funcionario(chapa))
+        elif operacao < 0.55 and chapas_do_grupo:
+            quadro.remover(gerador.choice(chapas_do_grupo))
+        elif operacao < 0.7 and chapas_do_grupo:
+            quadro.remover(max(chapas_do_grupo))
+        elif operacao < 0.85:
+            chapa = gerador.choice(list(quadro.chapas()))
+            quadro.sobrescrever(chapa, equipe=gerador.choice(["Operacao", "Projetos"]))
+        else:
+            quantidade = gerador.randint(0, 30)
+            esperadas = sorted((f.chapa for f in quadro if f.equipe == "Operacao"), reverse=True)[:quantidade]
+            assert quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", quantidade) == esperadas
+    esperadas = sorted(f.chapa for f in quadro if f.equipe == "Operacao")
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Operacao", "0001", len(esperadas) + 1) == esperadas[::-1]
+    assert quadro.quantidade_no_grupo("Matriz", "Operacao", "0001") == len(esperadas)
+
+
+def test_alocador_de_chapas_nao_reaproveita_chapas(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base + [criar_funcionario("TEMP1")])
+    assert quadro.alocar_chapa() == "00004"
+
+    quadro.contratar(criar_funcionario("00020"))
+    quadro.remover("00020")
+    assert quadro.alocar_chapa() == "00021"
+
+
+def criar_coorte(primeira_chapa: int, quantidade: int) -> CoorteContratacao:
+    return CoorteContratacao(
+        primeira_chapa=primeira_chapa, quantidade=quantidade, codigo_funcao="0001", funcao="Cargo",
+        empresa="Matriz", equipe="Operacao", data_admissao=datetime(2025, 1, 1)
+    )
+
+
+def test_coorte_conta_pessoas_sem_criar_funcionarios(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    faixa = quadro.alocar_faixa_de_chapas(150)
+    quadro.contratar_coorte(criar_coorte(faixa.start, len(faixa)))
+    quadro.custos_coortes["00004"] = 10.0
+    quadro.custos["00001"] = 5.0
+
+    assert len(quadro) == 153 and len(list(quadro)) == 3
+    assert quadro.quantidade_no_grupo("Matriz", "Operacao", "0001") == 153
+    assert "00153" in quadro and "00154" not in quadro
+    assert quadro.custo_total() == pytest.approx(5.0 + 150 * 10.0)
+    assert quadro.alocar_chapa() == "00154"
+
+    restante = quadro.reduzir_coorte("00004", 149)
+    assert restante.quantidade == 1 and restante.chapas == ["00004"]
+    assert quadro.reduzir_coorte("00004", 1) is None
+    assert len(quadro) == 3 and "00004" not in quadro.custos_coortes
+    with pytest.raises(KeyError):
+        quadro.reduzir_coorte("00004", 1)
+
+
+def test_ramificar_copia_as_coortes(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    quadro.contratar_coorte(criar_coorte(10, 5))
+    retrato = quadro.ramificar()
+    quadro.reduzir_coorte("00010", 2)
+
+    assert retrato.obter_coorte("00010").quantidade == 5
+    assert [c.quantidade for c in quadro.coortes_do_grupo("Matriz", "Operacao", "0001")] == [3]
+    assert len(list(retrato.registros())) == 4
+
+
+def test_qpa_conta_a_quantidade_das_coortes(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    quadro.contratar_coorte(criar_coorte(10, 40))
+
+    resumo = GeradorQPA().generate_qpa_summary(quadro.registros())
+
+    assert resumo == [{"empresa": "Matriz", "equipe": "Operacao", "funcao": "Cargo", "quantidade": 43}]
+
+
+def test_pertinencia_de_chapas_em_muitas_coortes(funcionarios_base):
+    quadro = QuadroSimulado(funcionarios_base)
+    faixas = [quadro.alocar_faixa_de_chapas(3) for _ in range(500)]
+    for faixa in faixas:
+        quadro.contratar_coorte(criar_coorte(faixa.start, len(faixa)))
+    quadro.reduzir_coorte(str(faixas[10].start).zfill(5), 3)
+    quadro.reduzir_coorte(str(faixas[20].start).zfill(5), 1)
+
+    assert "00001" in quadro and str(faixas[0].start).zfill(5) in quadro
+    assert all(str(numero).zfill(5) not in quadro for numero in faixas[10])
+    assert str(faixas[20].start + 1).zfill(5) in quadro and str(faixas[20].start + 2).zfill(5) not in quadro
+    assert str(faixas[-1].stop - 1).zfill(5) in quadro and str(faixas[-1].stop).zfill(5) not in quadro
+    assert "ABC" not in quadro
+    with pytest.raises(ValueError):
+        quadro.contratar_coorte(criar_coorte(faixas[10].start, 4))  # cabe na faixa liberada, mas invade a seguinte
+    quadro.contratar_coorte(criar_coorte(faixas[10].start, 3))
+    assert str(faixas[10].stop - 1).zfill(5) in quadro
+    retrato = quadro.ramificar()
+    quadro.reduzir_coorte(str(faixas[40].start).zfill(5), 3)
+    assert str(faixas[40].start).zfill(5) in retrato and str(faixas[40].start).zfill(5) not in quadro
@@ -0,0 +1,193 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+from core.entities import Funcionario, Cargo, CenarioOrcamento, AcaoQuadroPessoal
+from core.catalogo_cargos import CatalogoCargos
+from core.config import LinhaDoTempoConfiguracao, SegmentoMensal
+from core.history_manager import GerenciadorHistorico
+from core.payroll_rules import ServicoFolhaPagamento
+from core.services import OrcamentoService
+from core.payroll_paralelo import ExecutorFolhaParalelo
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str = "0001", equipe: str = "Operacao") -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe=equipe, funcao="Cargo",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=50.0, outros_beneficios_mensais=0.0
+    )
+
+
+@pytest.fixture
+def catalogo_cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Operador", salario=2500.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Gerente", salario=6000.00),
+    ])
+
+
+@pytest.fixture
+def orcamento_service(catalogo_cargos):
+    gerenciador_historico = GerenciadorHistorico([
+        {"id": 1, "parameter_name": "minimum_wage", "value": 1412.00, "start_date": "2024-01-01", "end_date": "2024-12-31"},
+        {"id": 2, "parameter_name": "minimum_wage", "value": 1518.00, "start_date": "2025-01-01", "end_date": None},
+        {"id": 3, "parameter_name": "aliquota_fgts_empresa", "value": 0.08, "start_date": "2000-01-01", "end_date": None},
+        {"id": 4, "parameter_name": "aliquota_inss_patronal_media", "value": 0.20, "start_date": "2000-01-01", "end_date": "2024-12-31"},
+        {"id": 5, "parameter_name": "aliquota_inss_patronal_media", "value": 0.22, "start_date": "2025-01-01", "end_date": None},
+        {"id": 6, "parameter_name": "insalubrity_percent", "value": 0.40, "start_date": "2000-01-01", "end_date": None},
+        {"id": 7, "parameter_name": "percentual_terco_ferias", "value": (1/3), "start_date": "1988-10-05", "end_date": None},
+        {"id": 8, "parameter_name": "meses_do_ano", "value": 12, "start_date": "1900-01-01", "end_date": None},
+    ])
+    return OrcamentoService(
+        ServicoFolhaPagamento(), LinhaDoTempoConfiguracao(gerenciador_historico), catalogo_cargos, exibir_acoes=False
+    )
+
+
+@pytest.fixture
+def funcionarios_base():
+    return [criar_funcionario("00001"), criar_funcionario("00002"), criar_funcionario("00003", codigo_funcao="0002", equipe="Projetos")]
+
+
+def test_simulacao_avanca_por_meses_do_calendario(orcamento_service, funcionarios_base):
+    """Cada mês do calendário aparece uma única vez, inclusive ao atravessar fevereiro e a virada do ano."""
+    cenario = CenarioOrcamento(nome_cenario="Teste", ano_inicio=2024, mes_inicio=11, duracao_meses=14)
+
+    resultado = orcamento_service.simular(cenario, funcionarios_base)
+
+    assert [(m.ano, m.mes) for m in resultado.meses][:4] == [(2024, 11), (2024, 12), (2025, 1), (2025, 2)]
+    assert (resultado.meses[-1].ano, resultado.meses[-1].mes) == (2025, 12)
+    assert resultado.periodo_simulacao == "2024-11 a 2025-12"
+    # A mudança de INSS em jan/2025 aparece no custo
+    assert resultado.meses[2].custo_total_orcamento > resultado.meses[1].custo_total_orcamento
+
+
+def test_acoes_sao_aplicadas_no_mes_de_efetivacao(orcamento_service, funcionarios_base, catalogo_cargos):
+    cenario = CenarioOrcamento(nome_cenario="Teste", ano_inicio=2025, mes_inicio=1, duracao_meses=4, acoes_quadro_pessoal=[
+        AcaoQuadroPessoal(tipo="ACRESCIMO_QPA", data_efetivacao="2025-01-31", empresa="Filial SP", equipe="Operacao",
+                          id_funcao="0001", quantidade=2, valor_vale_transporte_simulado=110.0),
+        AcaoQuadroPessoal(tipo="REDUCAO_QPA", data_efetivacao="2025-03-01", empresa="Matriz", equipe="Operacao",
+                          id_funcao="0001", quantidade=1),
+    ])
+
+    resultado = orcamento_service.simular(cenario, funcionarios_base)
+
+    assert [m.numero_total_funcionarios for m in resultado.meses] == [5, 5, 4, 4]
+    assert list(resultado.quadro_final.chapas()) == ["00001", "00003", "00004", "00005"]
+    assert resultado.custo_total_simulado == pytest.approx(sum(m.custo_total_orcamento for m in resultado.meses))
+
+    # O custo do último mês é o do quadro final calculado diretamente, pessoa a pessoa
+    funcionarios_finais = [resultado.quadro_final.obter("00001"), resultado.quadro_final.obter("00003")]
+    contratados = [
+        replace(funcionarios_base[0], chapa=chapa, empresa="Filial SP", valor_vale_transporte_mensal=110.0,
+                valor_vale_refeicao_mensal=0.0, plano_saude_mensal=0.0)
+        for chapa in ("00004", "00005")
+    ]
+    esperado = ServicoFolhaPagamento().calcular_detalhamento_custo_total_lote(
+        funcionarios_finais + contratados, catalogo_cargos,
+        orcamento_service.linha_do_tempo_configuracao.obter(2025, 4), orcamento_service.lancamento_mensal_padrao
+    )["TOTAL_CUSTO_FINAL_DO_EMPREGADO"].sum()
+    assert resultado.meses[-1].custo_total_orcamento == pytest.approx(esperado)
+    assert resultado.quadro_final.custo_total() == pytest.approx(esperado)
+
+
+class LinhaDoTempoSemInternar:
+    """Devolve uma cópia nova da configuração e um segmento por mês, forçando o recálculo completo do quadro."""
+    def __init__(self, linha_do_tempo):
+        self.linha_do_tempo = linha_do_tempo
+
+    def obter(self, ano, mes):
+        return replace(self.linha_do_tempo.obter(ano, mes))
+
+    def segmentos_mensais(self, ano_inicio, mes_inicio, duracao_meses):
+        segmentos = []
+        for deslocamento in range(duracao_meses):
+            ano, mes = divmod(ano_inicio * 12 + mes_inicio - 1 + deslocamento, 12)
+            segmentos.append(SegmentoMensal(deslocamento, 1, self.obter(ano, mes + 1)))
+        return segmentos
+
+
+def test_simulacao_incremental_bate_com_recalculo_completo(orcamento_service, funcionarios_base, catalogo_cargos, monkeypatch):
+    """O ajuste mês a mês pelas ações deve dar o mesmo custo que recalcular o quadro inteiro todo mês."""
+    cenario = CenarioOrcamento(nome_cenario="Teste", ano_inicio=2024, mes_inicio=10, duracao_meses=8, acoes_quadro_pessoal=[
+        AcaoQuadroPessoal(tipo="ACRESCIMO_QPA", data_efetivacao="2024-11-15", empresa="Matriz", equipe="Operacao",
+                          id_funcao="0001", quantidade=3, plano_saude_simulado=210.0),
+        AcaoQuadroPessoal(tipo="REDUCAO_QPA", data_efetivacao="2024-11-20", empresa="Matriz", equipe="Operacao",
+                          id_funcao="0001", quantidade=1),
+        AcaoQuadroPessoal(tipo="REDUCAO_QPA", data_efetivacao="2025-03-01", empresa="Matriz", equipe="Projetos",
+                          id_funcao="0002", quantidade=1),
+        AcaoQuadroPessoal(tipo="ACRESCIMO_QPA", data_efetivacao="2025-04-01", empresa="Matriz", equipe="Projetos",
+                          id_funcao="0002", quantidade=2),
+    ])
+    tamanhos_dos_lotes = []
+    calcular_lote_original = ServicoFolhaPagamento.calcular_custo_total_ponderado_lote_centavos
+
+    def calcular_lote_espiao(self, registros, *args, **kwargs):
+        tamanhos_dos_lotes.append(len(registros))
+        return calcular_lote_original(self, registros, *args, **kwargs)
+
+    monkeypatch.setattr(ServicoFolhaPagamento, "calcular_custo_total_ponderado_lote_centavos", calcular_lote_espiao)
+    incremental = orcamento_service.simular(cenario, funcionarios_base)
+    # Recálculo completo só em out/2024 (início) e jan/2025 (mudança de parâmetros, 3 funcionários + 1 coorte);
+    # nos meses de contratação só a coorte nova entra no lote
+    assert tamanhos_dos_lotes == [3, 1, 4, 1]
+
+    servico_completo = OrcamentoService(
+        ServicoFolhaPagamento(), LinhaDoTempoSemInternar(orcamento_service.linha_do_tempo_configuracao),
+        catalogo_cargos, exibir_acoes=False
+    )
+    completo = servico_completo.simular(cenario, funcionarios_base)
+
+    assert [m.numero_total_funcionarios for m in incremental.meses] == [m.numero_total_funcionarios for m in completo.meses]
+    for mes_incremental, mes_completo in zip(incremental.meses, completo.meses):
+        assert mes_incremental.custo_total_orcamento == pytest.approx(mes_completo.custo_total_orcamento, abs=1e-6)
+
+
+def test_contratacao_em_massa_vira_uma_unica_coorte(orcamento_service, funcionarios_base, catalogo_cargos):
+    """200 contratações são calculadas como um único registro e multiplicadas pela quantidade."""
+    cenario = CenarioOrcamento(nome_cenario="Teste", ano_inicio=2025, mes_inicio=1, duracao_meses=2, acoes_quadro_pessoal=[
+        AcaoQuadroPessoal(tipo="ACRESCIMO_QPA", data_efetivacao="2025-01-10", empresa="Matriz", equipe="Operacao",
+                          id_funcao="0001", quantidade=200, salario_base_simulado=3000.0),
+        AcaoQuadroPessoal(tipo="REDUCAO_QPA", data_efetivacao="2025-02-10", empresa="Matriz", equipe="Operacao",
+                          id_funcao="0001", quantidade=202),
+    ])
+
+    resultado = orcamento_service.simular(cenario, funcionarios_base)
+
+    assert [m.numero_total_funcionarios for m in resultado.meses] == [203, 1]
+    configuracao = orcamento_service.linha_do_tempo_configuracao.obter(2025, 1)
+    contratado = replace(funcionarios_base[0], valor_vale_transporte_mensal=0.0, valor_vale_refeicao_mensal=0.0, plano_saude_mensal=0.0)
+    custo_contratado = ServicoFolhaPagamento().calcular_detalhamento_custo_total_lote(
+        [contratado], [Cargo(codigo_funcao="0001", nome_funcao="Operador", salario=3000.0)],
+        configuracao, orcamento_service.lancamento_mensal_padrao
+    )["TOTAL_CUSTO_FINAL_DO_EMPREGADO"][0]
+    custo_base = ServicoFolhaPagamento().calcular_detalhamento_custo_total_lote(
+        funcionarios_base, catalogo_cargos, configuracao, orcamento_service.lancamento_mensal_padrao
+    )["TOTAL_CUSTO_FINAL_DO_EMPREGADO"]
+    assert resultado.meses[0].custo_total_orcamento == pytest.approx(custo_base.sum() + 200 * custo_contratado)
+
+    # A redução esvazia a coorte antes de tocar nos funcionários individuais (maiores chapas primeiro)
+    assert list(resultado.quadro_final.coortes()) == []
+    assert list(resultado.quadro_final.chapas()) == ["00003"]
+    assert resultado.meses[1].custo_total_orcamento == pytest.approx(custo_base[2])
+
+
+def test_simulacao_com_executor_paralelo_igual_a_sequencial(orcamento_service, catalogo_cargos):
+    """Com o executor paralelo os recálculos do quadro são feitos em blocos, sem mudar o resultado."""
+    funcionarios = [criar_funcionario(str(i).zfill(5), codigo_funcao="0001" if i % 4 else "0002") for i in range(1, 61)]
+    cenario = CenarioOrcamento(nome_cenario="Paralelo", ano_inicio=2024, mes_inicio=11, duracao_meses=4, acoes_quadro_pessoal=[
+        AcaoQuadroPessoal(tipo="ACRESCIMO_QPA", data_efetivacao="2024-12-01", empresa="Matriz", equipe="Operacao", id_funcao="0001", quantidade=3),
+        AcaoQuadroPessoal(tipo="REDUCAO_QPA", data_efetivacao="2025-01-10", empresa="Matriz", equipe="Operacao", id_funcao="0002", quantidade=2),
+    ])
+    sequencial = orcamento_service.simular(cenario, funcionarios)
+
+    with ExecutorFolhaParalelo(processos=2, tamanho_bloco=16) as executor:
+        orcamento_service.executor_paralelo = executor
+        paralelo = orcamento_service.simular(cenario, funcionarios)
+
+    assert [m.numero_total_funcionarios for m in paralelo.meses] == [m.numero_total_funcionarios for m in sequencial.meses]
+    for mes_paralelo, mes_sequencial in zip(paralelo.meses, sequencial.meses):
+        assert mes_paralelo.custo_total_orcamento == pytest.approx(mes_sequencial.custo_total_orcamento)
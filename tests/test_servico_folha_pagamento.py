@@ -2,6 +2,7 @@ import pytest
 from datetime import date, datetime
 import copy
 from core.payroll_rules import ServicoFolhaPagamento
+from core.catalogo_cargos import CatalogoCargos
 from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario, Funcionario
 
 
@@ -31,11 +32,11 @@ def funcionario_exemplo():
 
 @pytest.fixture
 def cargos_empresa():
-    """Retorna uma lista de objetos Cargo."""
-    return [
+    """Retorna o catálogo dos cargos da empresa."""
+    return CatalogoCargos([
         Cargo(codigo_funcao="0001", nome_funcao="Cargo Teste", salario=5000.00),
         Cargo(codigo_funcao="0002", nome_funcao="Outro Cargo", salario=3000.00)
-    ]
+    ])
 
 @pytest.fixture
 def configuracao_global_exemplo():
@@ -156,8 +157,8 @@ def test_calcular_bonus_insalubridade_retorna_zero_quando_nao_elegivel(servico_f
     # Assert
     assert bonus == 0.0
 
-def test_calcular_total_folha_pagamento_soma_salarios_base(servico_folha_pagamento, funcionario_exemplo, cargos_empresa, configuracao_global_exemplo, lancamento_mensal_exemplo_base):
-    """Testa se o método calcula_total_folha_pagamento soma corretamente os salários base."""
+def test_calcular_total_folha_pagamento_soma_o_custo_completo(servico_folha_pagamento, funcionario_exemplo, cargos_empresa, configuracao_global_exemplo, lancamento_mensal_exemplo_base):
+    """Testa se calcular_total_folha_pagamento soma cada campo da ficha de todos os funcionários."""
     # Arrange: Dois funcionários
     funcionario1 = copy.deepcopy(funcionario_exemplo)
     funcionario1.chapa = "00001"
@@ -170,15 +171,24 @@ def test_calcular_total_folha_pagamento_soma_salarios_base(servico_folha_pagamen
     lista_funcionarios = [funcionario1, funcionario2]
 
     # Act
-    custo_total = servico_folha_pagamento.calcular_total_folha_pagamento(
+    totais = servico_folha_pagamento.calcular_total_folha_pagamento(
         funcionarios=lista_funcionarios,
         cargos=cargos_empresa,
         configuracao_global=configuracao_global_exemplo,
         lancamento_mensal_padrao=lancamento_mensal_exemplo_base
     )
 
-    # Assert: 5000 + 3000 = 8000
-    assert custo_total == 8000.00
+    # Assert: salário base 5000 + 3000 = 8000, e os demais campos batem com a soma das fichas individuais
+    assert totais.numero_funcionarios == 2
+    assert totais.total.salario_base == 8000.00
+    fichas = [
+        servico_folha_pagamento.calcular_detalhamento_custo_total(f, cargos_empresa, configuracao_global_exemplo, lancamento_mensal_exemplo_base)
+        for f in copy.deepcopy(lista_funcionarios)
+    ]
+    for campo, valor in totais.total.para_dict().items():
+        assert valor == round(sum(ficha[campo] for ficha in fichas), 2)
+    assert totais.custo_total == totais.total.total_custo_final_do_empregado
+    assert totais.subtotais == {}
 
 
 def test_calcular_salario_proporcional_servico_sem_ferias(servico_folha_pagamento, funcionario_exemplo, cargos_empresa, lancamento_mensal_exemplo_base):
@@ -0,0 +1,94 @@
+import pytest
+from datetime import date, datetime
+from core.entities import Funcionario, Cargo, ConfiguracaoGlobal, LancamentoMensalFuncionario
+from core.catalogo_cargos import CatalogoCargos
+from core.payroll_rules import ServicoFolhaPagamento
+from core.qpa_generator import GeradorQPA
+from core.quadro_simulado import QuadroSimulado
+from core.tabela_funcionarios import TabelaFuncionarios, LinhaFuncionario, codificar_categorias
+
+
+def criar_funcionario(chapa: str, codigo_funcao: str = "0001", equipe: str = "Operacao", plano: float = 50.0) -> Funcionario:
+    return Funcionario(
+        chapa=chapa, nome=f"Funcionario {chapa}", situacao="A",
+        codigo_funcao=codigo_funcao, data_admissao=datetime(2020, 1, int(chapa[-1]) + 1),
+        data_admissao_pts=datetime(2020, 1, 1), data_nascimento=datetime(1980, 1, 1),
+        secao="01.01.1.01.01.001", carga_horaria_mensal="220", cpf="12345678909",
+        centro_custo="123456789", empresa="Matriz", equipe=equipe, funcao=f"Cargo {codigo_funcao}",
+        valor_vale_transporte_mensal=100.0, valor_vale_refeicao_mensal=300.0,
+        plano_saude_mensal=plano, outros_beneficios_mensais=0.0
+    )
+
+
+@pytest.fixture
+def funcionarios():
+    return [
+        criar_funcionario("00001"), criar_funcionario("00002", "0002", "Projetos", plano=80.0),
+        criar_funcionario("00003"), criar_funcionario("00004", "0003", "Projetos"),
+    ]
+
+
+@pytest.fixture
+def catalogo_cargos():
+    return CatalogoCargos([
+        Cargo(codigo_funcao="0001", nome_funcao="Cargo A", salario=5000.00),
+        Cargo(codigo_funcao="0002", nome_funcao="Cargo B", salario=3000.00),
+    ])
+
+
+def test_codificar_categorias():
+    codigos, categorias = codificar_categorias(["b", "a", "b", "c"])
+    assert codigos.tolist() == [0, 1, 0, 2]
+    assert categorias == ["b", "a", "c"]
+
+
+def test_linhas_se_comportam_como_funcionario(funcionarios):
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+
+    assert len(tabela) == 4
+    assert all(linha == funcionario for linha, funcionario in zip(tabela, funcionarios))
+    assert tabela[-1].materializar() == funcionarios[-1]
+    assert tabela[1].is_active() and tabela[1].data_admissao == datetime(2020, 1, 3)
+    assert tabela.categoricas["empresa"][1] == ["Matriz"]
+    assert tabela.coluna_categorica("equipe").tolist() == ["Operacao", "Projetos", "Operacao", "Projetos"]
+    with pytest.raises(IndexError):
+        tabela[4]
+
+
+def test_linha_grava_na_tabela(funcionarios):
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    linha = tabela[2]
+    linha.custo_total_mensal = 1234.5
+
+    assert tabela.numericos["custo_total_mensal"][2] == 1234.5
+    assert isinstance(linha, LinhaFuncionario) and not hasattr(linha, "__dict__")
+
+
+def test_lote_e_qpa_sobre_colunas(funcionarios, catalogo_cargos):
+    configuracao_global = ConfiguracaoGlobal(
+        data_calculo=date(2025, 4, 30), salario_minimo=1412.00, percentual_insalubridade=0.40,
+        aliquota_fgts_patronal=0.08, aliquota_inss_patronal_media=0.22,
+        percentual_terco_ferias=(1/3), meses_do_ano=12
+    )
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    servico = ServicoFolhaPagamento()
+    lancamento = LancamentoMensalFuncionario(dias_ferias=3)
+
+    resultado_tabela = servico.calcular_detalhamento_custo_total_lote(tabela, catalogo_cargos, configuracao_global, lancamento)
+    resultado_objetos = servico.calcular_detalhamento_custo_total_lote(funcionarios, catalogo_cargos, configuracao_global, lancamento)
+
+    for campo, valores in resultado_objetos.items():
+        assert resultado_tabela[campo].tolist() == valores.tolist()
+    gerador = GeradorQPA()
+    assert gerador.generate_qpa_summary(tabela) == gerador.generate_qpa_summary(funcionarios)
+    assert gerador.generate_qpa_summary(iter(tabela)) == gerador.generate_qpa_summary(funcionarios)
+
+
+def test_quadro_simulado_sobre_a_tabela(funcionarios):
+    tabela = TabelaFuncionarios.de_funcionarios(funcionarios)
+    quadro = QuadroSimulado(tabela)
+    quadro.sobrescrever("00001", equipe="Projetos")
+
+    assert quadro.obter("00001").equipe == "Projetos"
+    assert tabela[0].equipe == "Operacao"
+    assert quadro.maiores_chapas_do_grupo("Matriz", "Projetos", "0001", 5) == ["00001"]
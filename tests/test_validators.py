@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from core.validators import ValidadorDadosFuncionario, DataValidationError
+from core.validators import ValidadorDadosFuncionario, ValidadorDadosCargo, DataValidationError, converter_data, conferir_cpf
 
 @pytest.fixture
 def validador_funcionario():
@@ -48,4 +48,24 @@ def test_validador_data_aceita_formato_brasileiro(validador_funcionario):
     assert isinstance(data_validada, datetime)
     assert data_validada.year == 1999
     assert data_validada.month == 10
-    assert data_validada.day == 28
\ No newline at end of file
+    assert data_validada.day == 28
+
+def test_plano_de_validacao_e_compartilhado_entre_instancias():
+    """O plano (chaves e regras) é montado uma vez por classe, não a cada validador criado."""
+    assert ValidadorDadosFuncionario().plano is ValidadorDadosFuncionario().plano
+    assert ValidadorDadosCargo().validation_rules is ValidadorDadosCargo.plano.regras
+    assert "CPF" in ValidadorDadosFuncionario().required_keys
+
+def test_datas_e_cpfs_repetidos_vem_do_cache(validador_funcionario):
+    """Textos repetidos são convertidos uma vez; o resultado (e a mensagem de erro) é o mesmo da primeira conversão."""
+    converter_data.cache_clear()
+    conferir_cpf.cache_clear()
+    for _ in range(3):
+        assert validador_funcionario._validate_date_format(" 2020-01-15 ") == datetime(2020, 1, 15)
+        assert validador_funcionario._validate_CPF_format("529.982.247-25") == "52998224725"
+        with pytest.raises(DataValidationError, match="O CPF fornecido é inválido."):
+            validador_funcionario._validate_CPF_format("111.111.111-11")
+        with pytest.raises(DataValidationError, match="A data deve estar no formato"):
+            validador_funcionario._validate_date_format("31-12-1990")
+    assert converter_data.cache_info().misses == 2
+    assert conferir_cpf.cache_info().misses == 2
@@ -0,0 +1,97 @@
+import random
+import pandas as pd
+import pytest
+from core.validators import ValidadorDadosFuncionario, DataValidationError
+from core.validators_batch import ValidadorDadosFuncionarioLote
+
+
+def criar_registro(chapa: str = "00001", **campos) -> dict:
+    registro = {
+        "CHAPA": chapa, "NOME": " Maria Silva ", "SITUACAO": "A", "CODIGO_FUNCAO": "0001",
+        "DATA_ADMISSAO": "2020-01-15", "DATA_ADMISSAO_PTS": "15/01/2020", "DATA_NASCIMENTO": "1985-06-30",
+        "SECAO": "01.01.1.01.01.001", "CARGA_HORARIA_MENSAL": "220", "CPF": "529.982.247-25",
+        "CENTRO_CUSTO": "123456789", "EMPRESA": "Matriz", "EQUIPE": "Operacao", "FUNCAO": "Operador",
+        "VALOR_VALE_TRANSPORTE_MENSAL": 150.0, "VALOR_VALE_REFEICAO_MENSAL": "400", "PLANO_SAUDE_MENSAL": 0,
+        "OUTROS_BENEFICIOS_MENSAIS": 0.0,
+    }
+    registro.update(campos)
+    return registro
+
+
+@pytest.fixture
+def validador_lote():
+    return ValidadorDadosFuncionarioLote()
+
+
+def test_registros_validos_saem_convertidos_como_no_validate(validador_lote):
+    registros = [criar_registro("00001"), criar_registro("00002", CPF="11144477735", DATA_ADMISSAO="2023-1-5")]
+
+    resultado = validador_lote.validar_registros(registros)
+
+    assert resultado.quantidade_erros == 0
+    esperado = [ValidadorDadosFuncionario().validate(registro) for registro in registros]
+    assert resultado.validos.to_dict(orient="records") == esperado
+
+
+def test_erros_tem_as_mesmas_mensagens_do_validate(validador_lote):
+    registros = [
+        criar_registro("00001"),
+        criar_registro("1", CPF="111.111.111-11"),
+        criar_registro("00003", DATA_NASCIMENTO="31-12-1990", VALOR_VALE_TRANSPORTE_MENSAL=-1),
+        criar_registro("00004", CPF="52998224726"),
+    ]
+    del registros[3]["EQUIPE"]
+
+    resultado = validador_lote.validar(pd.DataFrame(registros, index=[10, 11, 12, 13], dtype=object))
+
+    assert list(resultado.validos.index) == [10]
+    assert list(resultado.erros["linha"]) == [11, 12, 13]
+    for linha, erro in zip(resultado.erros["linha"], resultado.erros["erro"]):
+        registro = registros[linha - 10]
+        with pytest.raises(DataValidationError) as excinfo:
+            ValidadorDadosFuncionario().validate(registro)
+        assert erro == str(excinfo.value)
+
+
+def test_coluna_obrigatoria_ausente_reprova_todas_as_linhas(validador_lote):
+    registros = [criar_registro("00001"), criar_registro("00002")]
+    for registro in registros:
+        del registro["CPF"]
+
+    resultado = validador_lote.validar_registros(registros)
+
+    assert resultado.validos.empty
+    assert list(resultado.erros["erro"]) == ["O campo obrigatório 'CPF' está ausente."] * 2
+
+
+def test_lote_aleatorio_bate_com_validacao_individual(validador_lote):
+    """Sorteia valores válidos e inválidos por campo e compara o lote com o validate registro a registro."""
+    sorteio = random.Random(7)
+    variacoes = {
+        "CHAPA": ["00001", "1234", "abcde", 12345],
+        "NOME": ["Ana", "   ", None],
+        "SITUACAO": ["A", "T", "X", "AA"],
+        "CODIGO_FUNCAO": ["0001", "001", " 0001"],
+        "DATA_ADMISSAO": ["2020-02-29", "29/02/2020", "2021-02-29", "2020/01/01", 20200101],
+        "SECAO": ["01.01.1.01.01.001", "01011010100"],
+        "CARGA_HORARIA_MENSAL": ["220", "75", "075", 220],
+        "CPF": ["529.982.247-25", "52998224725", "000.000.000-00", "5299822472", "52998224724", "529 982 247 25", 52998224725],
+        "CENTRO_CUSTO": ["123456789", "12345678"],
+        "VALOR_VALE_REFEICAO_MENSAL": [0, 10.5, "12.5", "-3", "abc", None],
+    }
+    registros = []
+    for _ in range(300):
+        registros.append(criar_registro(**{campo: sorteio.choice(valores) for campo, valores in variacoes.items()}))
+
+    resultado = validador_lote.validar_registros(registros)
+
+    validos = resultado.validos.to_dict(orient="index")
+    erros = dict(zip(resultado.erros["linha"], resultado.erros["erro"]))
+    assert len(validos) + len(erros) == len(registros)
+    for posicao, registro in enumerate(registros):
+        try:
+            esperado = ValidadorDadosFuncionario().validate(registro)
+        except DataValidationError as e:
+            assert erros[posicao] == str(e)
+        else:
+            assert validos[posicao] == esperado